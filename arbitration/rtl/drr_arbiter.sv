@@ -0,0 +1,103 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Deficit Round Robin Arbiter
+// Reference: M. Shreedhar and G. Varghese, Efficient Fair Queueing using Deficit Round Robin
+// ------------------------------------------------------------------------------------------------
+
+/*
+Each requester presents the length (in bytes) of its head packet and gets one packet per grant.
+The bandwidth is shared in bytes: requester i gets quantum[i] bytes in each round.
+
+Each requester has a deficit counter. A requester is eligible if its head packet fits in its
+deficit. The eligible requesters are arbitrated in round robin order (same as rr_arbiter) and the
+length of the granted packet is taken from the deficit.
+
+When no requester is eligible, a new round starts: the quantum is added to the deficit of every
+requester, and the arbitration in this cycle uses the new deficit. If a packet still does not fit,
+the requester keeps its deficit for the next round (the deficit in DRR). So there is one grant per
+cycle unless the quantum is smaller than the packet length.
+
+Same as DRR, a requester that stops requesting (empty queue) loses its deficit.
+
+The deficit is always smaller than quantum + len, so DW = max(QW, LW) + 1 bits is enough.
+*/
+
+module drr_arbiter #(
+    parameter WIDTH = 8,
+    parameter QW = 8,                       // quantum width
+    parameter LW = 8                        // packet length width
+) (
+    input                           clk,
+    input                           rst_b,
+    input  [WIDTH-1:0]              req,        // request vector
+    input  [WIDTH*LW-1:0]           len,        // length of the head packet. requester i is len[i*LW+LW-1:i*LW]
+    input  [WIDTH*QW-1:0]           quantum,    // quantum of each requester. requester i is quantum[i*QW+QW-1:i*QW]
+    output [WIDTH-1:0]              grant       // grant vector
+);
+
+    localparam DW = (QW > LW ? QW : LW) + 1;
+
+    logic [WIDTH-1:0]               base;
+    logic [WIDTH-1:0]               eligible;   // head packet fits in the current deficit
+    logic [WIDTH-1:0]               arb_req;
+    logic                           reload;     // start a new round
+
+    genvar i;
+    generate
+        for (i = 0; i < WIDTH; i = i + 1) begin: deficit_counter
+
+            logic [DW-1:0] deficit;
+            logic [DW-1:0] credit;      // deficit used in this cycle
+            logic [DW-1:0] len_i;
+            logic [DW-1:0] quantum_i;
+
+            assign len_i = {{(DW-LW){1'b0}}, len[i*LW+LW-1:i*LW]};
+            assign quantum_i = {{(DW-QW){1'b0}}, quantum[i*QW+QW-1:i*QW]};
+            assign eligible[i] = req[i] & (len_i <= deficit);
+            assign credit = reload ? deficit + quantum_i : deficit;
+            assign arb_req[i] = req[i] & (len_i <= credit);
+
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    deficit <= 0;
+                end
+                else if (!req[i]) begin
+                    deficit <= 0;
+                end
+                else if (grant[i]) begin
+                    deficit <= credit - len_i;
+                end
+                else begin
+                    deficit <= credit;
+                end
+            end
+
+        end
+    endgenerate
+
+    assign reload = (eligible == 0) & (req != 0);
+
+    fixed_arbiter #(
+        .WIDTH(WIDTH)
+    )
+    u_fixed_arbiter (
+        .req(arb_req),
+        .base(base),
+        .grant(grant)
+    );
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            base <= 1;
+        end
+        else if (|arb_req) begin
+            // left shift the grant and rotate it as the new base
+            base <= {grant[WIDTH-2:0], grant[WIDTH-1]};
+        end
+    end
+
+endmodule
@@ -0,0 +1,194 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// iSLIP style separable allocator
+// Match N inputs to M outputs in one cycle, for example for a crossbar switch.
+// Reference: N. McKeown, The iSLIP Scheduling Algorithm for Input-Queued Switches
+// ------------------------------------------------------------------------------------------------
+
+/*
+------------------------------
+* Request and match          *
+------------------------------
+req[i*M+j] is set if input i has a cell for output j (for example the virtual output queue j of
+input i is not empty). match[i*M+j] is set if input i is matched to output j in this cycle.
+Each input is matched to at most one output and each output to at most one input.
+
+------------------------------
+* Separable allocation       *
+------------------------------
+Each iteration uses one round robin arbiter per output (N requests) and one per input (M requests)
+
+OUTPUT_FIRST (iSLIP):
+    1. Grant:  each unmatched output grants one of the unmatched inputs requesting it
+    2. Accept: each unmatched input accepts one of the grants it receives
+
+INPUT_FIRST:
+    1. Select: each unmatched input selects one of the unmatched outputs it requests
+    2. Grant:  each unmatched output grants one of the inputs selecting it
+
+The inputs and outputs matched in an iteration are removed from the next iterations. All the
+ITER iterations are done in the same cycle.
+
+------------------------------
+* Pointer update             *
+------------------------------
+The arbiters are fixed_arbiter with a one-hot base (the round robin pointer). Following iSLIP,
+the pointers are only updated by the match of the first iteration:
+    - the pointer of an output moves to one beyond the input it is matched to.
+    - the pointer of an input moves to one beyond the output it is matched to.
+A grant that is not accepted does not move the pointer. This is what makes the output pointers
+desynchronize and gives 100% throughput under uniform traffic with one iteration.
+
+rr_arbiter.sv can not be used directly as it moves its base on every grant.
+*/
+
+module islip_allocator #(
+    parameter N = 4,                        // number of inputs
+    parameter M = 4,                        // number of outputs
+    parameter ITER = 1,                     // number of iterations, 1 to 3
+    parameter MODE = "OUTPUT_FIRST"         // OUTPUT_FIRST (iSLIP) or INPUT_FIRST
+) (
+    input                           clk,
+    input                           rst_b,
+    input  [N*M-1:0]                req,    // req[i*M+j]: input i requests output j
+    output [N*M-1:0]                match   // match[i*M+j]: input i is matched to output j
+);
+
+    // round robin pointers
+    logic [N-1:0]                   out_ptr [M-1:0];
+    logic [M-1:0]                   in_ptr [N-1:0];
+
+    // unmatched inputs and outputs at each iteration
+    logic [N-1:0]                   in_free [ITER:0];
+    logic [M-1:0]                   out_free [ITER:0];
+    // match of each iteration, and the accumulated match
+    logic [N*M-1:0]                 match_iter [ITER-1:0];
+    logic [N*M-1:0]                 match_acc [ITER:0];
+
+    assign in_free[0] = {N{1'b1}};
+    assign out_free[0] = {M{1'b1}};
+    assign match_acc[0] = 0;
+
+    genvar k, i, j;
+    generate
+        for (k = 0; k < ITER; k = k + 1) begin: iteration
+
+            logic [N*M-1:0] req_k;      // requests between unmatched inputs and outputs
+            logic [N*M-1:0] stage1;     // result of the first arbitration
+            logic [N*M-1:0] stage2;     // result of the second arbitration (match)
+            logic [N-1:0]   in_matched;
+            logic [M-1:0]   out_matched;
+
+            for (i = 0; i < N; i = i + 1) begin: req_row
+                for (j = 0; j < M; j = j + 1) begin: req_col
+                    assign req_k[i*M+j] = req[i*M+j] & in_free[k][i] & out_free[k][j];
+                end
+            end
+
+            if (MODE == "OUTPUT_FIRST") begin: output_first
+
+                // grant: one arbiter per output
+                for (j = 0; j < M; j = j + 1) begin: out_arb
+                    logic [N-1:0] col_req;
+                    logic [N-1:0] col_grant;
+                    for (i = 0; i < N; i = i + 1) begin: col
+                        assign col_req[i] = req_k[i*M+j];
+                        assign stage1[i*M+j] = col_grant[i];
+                    end
+                    fixed_arbiter #(.WIDTH(N))
+                    u_fixed_arbiter (.req(col_req), .base(out_ptr[j]), .grant(col_grant));
+                end
+
+                // accept: one arbiter per input
+                for (i = 0; i < N; i = i + 1) begin: in_arb
+                    fixed_arbiter #(.WIDTH(M))
+                    u_fixed_arbiter (.req(stage1[i*M+M-1:i*M]), .base(in_ptr[i]), .grant(stage2[i*M+M-1:i*M]));
+                end
+
+            end
+            else begin: input_first
+
+                // select: one arbiter per input
+                for (i = 0; i < N; i = i + 1) begin: in_arb
+                    fixed_arbiter #(.WIDTH(M))
+                    u_fixed_arbiter (.req(req_k[i*M+M-1:i*M]), .base(in_ptr[i]), .grant(stage1[i*M+M-1:i*M]));
+                end
+
+                // grant: one arbiter per output
+                for (j = 0; j < M; j = j + 1) begin: out_arb
+                    logic [N-1:0] col_req;
+                    logic [N-1:0] col_grant;
+                    for (i = 0; i < N; i = i + 1) begin: col
+                        assign col_req[i] = stage1[i*M+j];
+                        assign stage2[i*M+j] = col_grant[i];
+                    end
+                    fixed_arbiter #(.WIDTH(N))
+                    u_fixed_arbiter (.req(col_req), .base(out_ptr[j]), .grant(col_grant));
+                end
+
+            end
+
+            for (i = 0; i < N; i = i + 1) begin: in_match
+                assign in_matched[i] = |stage2[i*M+M-1:i*M];
+            end
+
+            for (j = 0; j < M; j = j + 1) begin: out_match
+                logic [N-1:0] col_match;
+                for (i = 0; i < N; i = i + 1) begin: col
+                    assign col_match[i] = stage2[i*M+j];
+                end
+                assign out_matched[j] = |col_match;
+            end
+
+            assign match_iter[k] = stage2;
+            assign match_acc[k+1] = match_acc[k] | stage2;
+            assign in_free[k+1] = in_free[k] & ~in_matched;
+            assign out_free[k+1] = out_free[k] & ~out_matched;
+
+        end
+    endgenerate
+
+    assign match = match_acc[ITER];
+
+    // pointer update, only using the match of the first iteration
+    generate
+        for (j = 0; j < M; j = j + 1) begin: out_pointer
+            logic [N-1:0] ptr;
+            logic [N-1:0] col_match;
+            for (i = 0; i < N; i = i + 1) begin: col
+                assign col_match[i] = match_iter[0][i*M+j];
+            end
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    ptr <= 1;
+                end
+                else if (|col_match) begin
+                    // left shift the match and rotate it as the new pointer
+                    ptr <= {col_match[N-2:0], col_match[N-1]};
+                end
+            end
+            assign out_ptr[j] = ptr;
+        end
+
+        for (i = 0; i < N; i = i + 1) begin: in_pointer
+            logic [M-1:0] ptr;
+            logic [M-1:0] row_match;
+            assign row_match = match_iter[0][i*M+M-1:i*M];
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    ptr <= 1;
+                end
+                else if (|row_match) begin
+                    // left shift the match and rotate it as the new pointer
+                    ptr <= {row_match[M-2:0], row_match[M-1]};
+                end
+            end
+            assign in_ptr[i] = ptr;
+        end
+    endgenerate
+
+endmodule
@@ -0,0 +1,91 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Weighted Round Robin Arbiter
+// ------------------------------------------------------------------------------------------------
+
+/*
+Each requester has a credit counter. At the start of a round the credit is loaded with the weight of
+the requester. A requester with credit left is eligible, and the eligible requesters are arbitrated
+in round robin order (same as rr_arbiter). Each grant takes one credit.
+
+When no requester is eligible anymore (all the credits are used or the requesters with credits
+left are not requesting), a new round starts: all the credits are reloaded and the arbitration in
+this cycle uses the reloaded credits, so there is one grant per cycle as long as there is a request.
+
+When all the requesters are requesting, requester i gets weight[i] grants in each round and the
+grants are interleaved. For example with weights 3, 1, 2 for requesters 0, 1, 2, the first round is:
+    0 1 2 0 2 0
+
+A requester with weight 0 is never granted. A new weight takes effect at the next round.
+*/
+
+module wrr_arbiter #(
+    parameter WIDTH = 8,
+    parameter CW = 4                        // credit (weight) width
+) (
+    input                           clk,
+    input                           rst_b,
+    input  [WIDTH-1:0]              req,    // request vector
+    input  [WIDTH*CW-1:0]           weight, // weight of each requester. requester i is weight[i*CW+CW-1:i*CW]
+    output [WIDTH-1:0]              grant   // grant vector
+);
+
+    logic [WIDTH-1:0]               base;
+    logic [WIDTH-1:0]               valid_req;  // requesting and weight is not zero
+    logic [WIDTH-1:0]               eligible;   // requesting and has credit left
+    logic [WIDTH-1:0]               arb_req;
+    logic                           reload;     // start a new round
+
+    genvar i;
+    generate
+        for (i = 0; i < WIDTH; i = i + 1) begin: credit_counter
+
+            logic [CW-1:0] credit;
+            logic [CW-1:0] weight_i;
+
+            assign weight_i = weight[i*CW+CW-1:i*CW];
+            assign valid_req[i] = req[i] & (weight_i != 0);
+            assign eligible[i] = valid_req[i] & (credit != 0);
+
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    credit <= 0;
+                end
+                else if (reload) begin
+                    credit <= weight_i - grant[i];
+                end
+                else begin
+                    credit <= credit - grant[i];
+                end
+            end
+
+        end
+    endgenerate
+
+    assign reload = (eligible == 0) & (valid_req != 0);
+    assign arb_req = reload ? valid_req : eligible;
+
+    fixed_arbiter #(
+        .WIDTH(WIDTH)
+    )
+    u_fixed_arbiter (
+        .req(arb_req),
+        .base(base),
+        .grant(grant)
+    );
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            base <= 1;
+        end
+        else if (|arb_req) begin
+            // left shift the grant and rotate it as the new base
+            base <= {grant[WIDTH-2:0], grant[WIDTH-1]};
+        end
+    end
+
+endmodule
@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Reference models of the arbiters
+numpy is required to run the traces in batch
+https://numpy.org/
+------------------------------------------------------------------------------------------------
+Each arbiter is a class holding its own state (base pointer, credits, deficits), so several
+instances can run side by side. step() arbitrates one cycle, run() takes a whole trace as numpy
+arrays (one row per cycle) and returns the grants of every cycle.
+
+share() counts the grants (or bytes) of each requester in a grant trace, to check the bandwidth
+ratio over long runs.
+------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+
+def fixed_arbiter(req, base, width):
+    """ Same as fixed_arbiter.sv. base is one-hot and has the highest priority """
+    double_req = (req << width) | req
+    mask = (1 << (2 * width)) - 1
+    double_grant = double_req & ((~double_req + base) & mask)
+    return ((double_grant >> width) | double_grant) & ((1 << width) - 1)
+
+def onehot_index(grant):
+    """ index of a one-hot grant, -1 if no grant """
+    return grant.bit_length() - 1
+
+def share(grants, width, weights=None):
+    """
+    number of grants of each requester in a trace of one-hot grants
+    @param weights: optional array (same shape as grants) to sum instead of counting, e.g. bytes
+    """
+    grants = np.asarray(grants, dtype=np.int64)
+    index = np.full(grants.shape, -1, dtype=np.int64)
+    for i in range(width):
+        index[(grants >> i) & 0x1 == 1] = i
+    valid = index >= 0
+    return np.bincount(index[valid], weights=None if weights is None else np.asarray(weights)[valid],
+                       minlength=width)
+
+class RrArbiter():
+
+    def __init__(self, width):
+        """ Same as rr_arbiter.sv """
+        self.width = width
+        self.base = 1
+
+    def rotate(self, grant):
+        return ((grant << 1) | (grant >> (self.width - 1))) & ((1 << self.width) - 1)
+
+    def step(self, req):
+        grant = fixed_arbiter(req, self.base, self.width)
+        if grant:
+            self.base = self.rotate(grant)
+        return grant
+
+    def run(self, reqs):
+        """ arbitrate a trace of requests, return the grants """
+        return np.array([self.step(int(req)) for req in reqs], dtype=np.int64)
+
+class WrrArbiter(RrArbiter):
+
+    def __init__(self, width, weights):
+        """
+        Same as wrr_arbiter.sv
+        @param weights: list of weight of each requester
+        """
+        super().__init__(width)
+        self.weights = list(weights)
+        self.credits = [0] * width
+
+    def step(self, req):
+        valid_req = 0
+        eligible = 0
+        for i in range(self.width):
+            if (req >> i) & 0x1 and self.weights[i]:
+                valid_req |= 1 << i
+                if self.credits[i]:
+                    eligible |= 1 << i
+        reload = eligible == 0 and valid_req != 0
+        grant = fixed_arbiter(valid_req if reload else eligible, self.base, self.width)
+        if grant:
+            self.base = self.rotate(grant)
+        if reload:
+            self.credits = list(self.weights)
+        if grant:
+            self.credits[onehot_index(grant)] -= 1
+        return grant
+
+class DrrArbiter(RrArbiter):
+
+    def __init__(self, width, quantum):
+        """
+        Same as drr_arbiter.sv
+        @param quantum: list of quantum (bytes per round) of each requester
+        """
+        super().__init__(width)
+        self.quantum = list(quantum)
+        self.deficit = [0] * width
+
+    def step(self, req, lens):
+        """
+        @param lens: length of the head packet of each requester
+        """
+        requesting = [(req >> i) & 0x1 for i in range(self.width)]
+        eligible = any(requesting[i] and lens[i] <= self.deficit[i] for i in range(self.width))
+        reload = not eligible and req != 0
+        credit = [d + q if reload else d for d, q in zip(self.deficit, self.quantum)]
+        arb_req = 0
+        for i in range(self.width):
+            if requesting[i] and lens[i] <= credit[i]:
+                arb_req |= 1 << i
+        grant = fixed_arbiter(arb_req, self.base, self.width)
+        if grant:
+            self.base = self.rotate(grant)
+        for i in range(self.width):
+            if not requesting[i]:
+                self.deficit[i] = 0
+            elif (grant >> i) & 0x1:
+                self.deficit[i] = credit[i] - lens[i]
+            else:
+                self.deficit[i] = credit[i]
+        return grant
+
+    def run(self, reqs, lens):
+        """
+        arbitrate a trace of requests, return the grants
+        @param lens: array of shape (cycles, width), head packet length of each requester
+        """
+        return np.array([self.step(int(req), [int(l) for l in row]) for req, row in zip(reqs, lens)],
+                        dtype=np.int64)
+
+class IslipAllocator():
+
+    def __init__(self, n, m, iterations=1, mode="OUTPUT_FIRST"):
+        """
+        Same as islip_allocator.sv
+        @param n: number of inputs
+        @param m: number of outputs
+        @param iterations: number of iterations
+        @param mode: OUTPUT_FIRST (iSLIP) or INPUT_FIRST
+        """
+        self.n = n
+        self.m = m
+        self.iterations = iterations
+        self.mode = mode
+        self.out_ptr = [1] * m
+        self.in_ptr = [1] * n
+
+    @staticmethod
+    def rotate(value, width):
+        return ((value << 1) | (value >> (width - 1))) & ((1 << width) - 1)
+
+    def row(self, matrix, i):
+        return (matrix >> (i * self.m)) & ((1 << self.m) - 1)
+
+    def col(self, matrix, j):
+        return sum(((matrix >> (i * self.m + j)) & 0x1) << i for i in range(self.n))
+
+    def from_rows(self, rows):
+        return sum(row << (i * self.m) for i, row in enumerate(rows))
+
+    def from_cols(self, cols):
+        return sum(((col >> i) & 0x1) << (i * self.m + j) for j, col in enumerate(cols) for i in range(self.n))
+
+    def step(self, req):
+        """
+        @param req: bit i*M+j is set if input i requests output j
+        @return: match, bit i*M+j is set if input i is matched to output j
+        """
+        in_free = (1 << self.n) - 1
+        out_free = (1 << self.m) - 1
+        match = 0
+        first = 0
+        for k in range(self.iterations):
+            req_k = 0
+            for i in range(self.n):
+                if (in_free >> i) & 0x1:
+                    req_k |= (self.row(req, i) & out_free) << (i * self.m)
+            if self.mode == "OUTPUT_FIRST":
+                stage1 = self.from_cols([fixed_arbiter(self.col(req_k, j), self.out_ptr[j], self.n) for j in range(self.m)])
+                stage2 = self.from_rows([fixed_arbiter(self.row(stage1, i), self.in_ptr[i], self.m) for i in range(self.n)])
+            else:
+                stage1 = self.from_rows([fixed_arbiter(self.row(req_k, i), self.in_ptr[i], self.m) for i in range(self.n)])
+                stage2 = self.from_cols([fixed_arbiter(self.col(stage1, j), self.out_ptr[j], self.n) for j in range(self.m)])
+            if k == 0:
+                first = stage2
+            match |= stage2
+            for i in range(self.n):
+                if self.row(stage2, i):
+                    in_free &= ~(1 << i)
+            for j in range(self.m):
+                if self.col(stage2, j):
+                    out_free &= ~(1 << j)
+        # pointer update with the first iteration
+        for j in range(self.m):
+            col = self.col(first, j)
+            if col:
+                self.out_ptr[j] = self.rotate(col, self.n)
+        for i in range(self.n):
+            row = self.row(first, i)
+            if row:
+                self.in_ptr[i] = self.rotate(row, self.m)
+        return match
+
+    def run(self, reqs):
+        """ allocate a trace of requests, return the matches """
+        return np.array([self.step(int(req)) for req in reqs], dtype=object)
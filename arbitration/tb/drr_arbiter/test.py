@@ -0,0 +1,119 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Testbench for deficit round robin arbiter
+# ------------------------------------------------------------------------------------------------
+
+import cocotb
+from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.clock import Clock
+from ArbiterModel import DrrArbiter, share, onehot_index
+from collections import deque
+import numpy as np
+import random
+
+WIDTH = 8
+QW = 8
+LW = 8
+
+def pack(values, width):
+    """ pack a list of values into a flat vector """
+    return sum(value << (i * width) for i, value in enumerate(values))
+
+########################################
+# Test functions
+########################################
+
+async def setup(dut):
+    dut.req.value = 0
+    dut.len.value = 0
+    dut.quantum.value = 0
+    dut.rst_b.value = 0
+    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    await Timer(20, units="ns")
+
+async def reset(dut, quantum):
+    """ reset the arbiter and program the quantum """
+    await FallingEdge(dut.clk)
+    dut.req.value = 0
+    dut.quantum.value = pack(quantum, QW)
+    dut.rst_b.value = 0
+    await FallingEdge(dut.clk)
+    dut.rst_b.value = 1
+
+async def run_queues(dut, model, queues, cycles, arrival=None):
+    """
+    Send the packets in the queues. The head packet of each queue is presented to the arbiter and
+    removed when granted.
+    @param arrival: function called every cycle to add new packets to the queues
+    @return: grants and granted bytes of each cycle
+    """
+    grants = np.zeros(cycles, dtype=np.int64)
+    nbytes = np.zeros(cycles, dtype=np.int64)
+    for cycle in range(cycles):
+        if arrival:
+            arrival(queues)
+        req = sum(1 << i for i, queue in enumerate(queues) if queue)
+        lens = [queue[0] if queue else 0 for queue in queues]
+        await FallingEdge(dut.clk)
+        dut.req.value = req
+        dut.len.value = pack(lens, LW)
+        await Timer(2, "ns")
+        grant = dut.grant.value.integer
+        expected_grant = model.step(req, lens)
+        error_msg = f"cycle {cycle}: req = {bin(req)}, lens = {lens}, grant = {bin(grant)}, expected grant = {bin(expected_grant)}"
+        assert grant == expected_grant, dut._log.error(error_msg)
+        if grant:
+            idx = onehot_index(grant)
+            grants[cycle] = grant
+            nbytes[cycle] = queues[idx].popleft()
+    return grants, nbytes
+
+def random_queue(length, max_len):
+    return deque(random.randint(1, max_len) for _ in range(length))
+
+async def tester_bandwidth(dut, quantum, cycles, max_len=(1 << LW) - 1, tolerance=0.02):
+    """ all the queues are backlogged, the bytes should be shared as the quantum """
+    model = DrrArbiter(WIDTH, quantum)
+    await reset(dut, quantum)
+    queues = [random_queue(cycles, max_len) for _ in range(WIDTH)]
+    grants, nbytes = await run_queues(dut, model, queues, cycles)
+    bw = share(grants, WIDTH, nbytes)
+    ratio = bw / bw.sum()
+    expected = np.array(quantum) / sum(quantum)
+    busy = np.count_nonzero(grants) / cycles
+    dut._log.info(f"quantum = {quantum}, byte share = {np.round(ratio, 4).tolist()}, grant per cycle = {busy:.3f}")
+    assert np.all(np.abs(ratio - expected) <= tolerance * expected + 1.0 / cycles), \
+        dut._log.error(f"Byte share {ratio} does not match the quantum {expected}")
+
+async def tester_random(dut, quantum, cycles, load, max_len=(1 << LW) - 1):
+    """ packets arrive randomly. Queue i gets a new packet with probability load[i] each cycle """
+    model = DrrArbiter(WIDTH, quantum)
+    await reset(dut, quantum)
+    queues = [deque() for _ in range(WIDTH)]
+    def arrival(queues):
+        for i, queue in enumerate(queues):
+            if random.random() < load[i]:
+                queue.append(random.randint(0, max_len))
+    await run_queues(dut, model, queues, cycles, arrival)
+
+@cocotb.test()
+async def test_bandwidth(dut):
+    await setup(dut)
+    await tester_bandwidth(dut, [32, 64, 96, 128, 160, 192, 224, 255], 10000)
+
+@cocotb.test()
+async def test_bandwidth_small_quantum(dut):
+    """ quantum smaller than the packets, some rounds have no grant """
+    await setup(dut)
+    await tester_bandwidth(dut, [8, 16, 16, 32, 32, 48, 64, 64], 20000, max_len=128, tolerance=0.05)
+
+@cocotb.test()
+async def test_random(dut):
+    await setup(dut)
+    quantum = [random.randint(1, (1 << QW) - 1) for _ in range(WIDTH)]
+    load = [random.random() * 0.25 for _ in range(WIDTH)]
+    await tester_random(dut, quantum, 10000, load)
@@ -0,0 +1,44 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Testbench for iSLIP allocator
+// Each instance has its own request so it can be driven by its own virtual output queues.
+// ------------------------------------------------------------------------------------------------
+
+module tb();
+
+    localparam N = 8;
+    localparam M = 8;
+
+    logic            clk;
+    logic            rst_b;
+
+    logic [N*M-1:0]  req_of1;
+    logic [N*M-1:0]  match_of1;
+    logic [N*M-1:0]  req_of2;
+    logic [N*M-1:0]  match_of2;
+    logic [N*M-1:0]  req_of3;
+    logic [N*M-1:0]  match_of3;
+    logic [N*M-1:0]  req_if2;
+    logic [N*M-1:0]  match_if2;
+
+    // iSLIP, 1 iteration
+    islip_allocator #(.N(N), .M(M), .ITER(1), .MODE("OUTPUT_FIRST"))
+    u_of1 (.clk(clk), .rst_b(rst_b), .req(req_of1), .match(match_of1));
+
+    // iSLIP, 2 iterations
+    islip_allocator #(.N(N), .M(M), .ITER(2), .MODE("OUTPUT_FIRST"))
+    u_of2 (.clk(clk), .rst_b(rst_b), .req(req_of2), .match(match_of2));
+
+    // iSLIP, 3 iterations
+    islip_allocator #(.N(N), .M(M), .ITER(3), .MODE("OUTPUT_FIRST"))
+    u_of3 (.clk(clk), .rst_b(rst_b), .req(req_of3), .match(match_of3));
+
+    // input first, 2 iterations
+    islip_allocator #(.N(N), .M(M), .ITER(2), .MODE("INPUT_FIRST"))
+    u_if2 (.clk(clk), .rst_b(rst_b), .req(req_if2), .match(match_if2));
+
+endmodule
@@ -0,0 +1,145 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Testbench for iSLIP allocator
+# ------------------------------------------------------------------------------------------------
+
+import cocotb
+from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.clock import Clock
+from ArbiterModel import IslipAllocator
+import numpy as np
+import random
+
+N = 8
+M = 8
+
+# instance name in tb.sv: (iterations, mode)
+INSTANCES = {
+    "of1": (1, "OUTPUT_FIRST"),
+    "of2": (2, "OUTPUT_FIRST"),
+    "of3": (3, "OUTPUT_FIRST"),
+    "if2": (2, "INPUT_FIRST"),
+}
+
+class SwitchBench():
+
+    def __init__(self, dut, name):
+        """
+        Input queued switch with virtual output queues driving one allocator instance
+        @param name: instance name in tb.sv
+        """
+        iterations, mode = INSTANCES[name]
+        self.name = name
+        self.req = getattr(dut, f"req_{name}")
+        self.match = getattr(dut, f"match_{name}")
+        self.model = IslipAllocator(N, M, iterations, mode)
+        self.voq = np.zeros((N, M), dtype=np.int64)     # number of cells in each queue
+        self.sent = np.zeros(M, dtype=np.int64)         # cells sent to each output
+        self.match_size = []
+        self.req.value = 0
+
+    def request(self):
+        req = 0
+        for i, j in zip(*np.nonzero(self.voq)):
+            req |= 1 << int(i * M + j)
+        return req
+
+    def check(self, req):
+        """ compare the match with the model and send the matched cells """
+        match = self.match.value.integer
+        expected = self.model.step(req)
+        assert match == expected, f"{self.name}: match = {hex(match)}, expected {hex(expected)}"
+        assert match & ~req == 0, f"{self.name}: matched a pair without request"
+        pairs = [(k // M, k % M) for k in range(N * M) if (match >> k) & 0x1]
+        assert len({i for i, _ in pairs}) == len(pairs), f"{self.name}: input matched twice"
+        assert len({j for _, j in pairs}) == len(pairs), f"{self.name}: output matched twice"
+        for i, j in pairs:
+            self.voq[i, j] -= 1
+            self.sent[j] += 1
+        self.match_size.append(len(pairs))
+
+def traffic(rng, load, hotspot=0.0):
+    """
+    arrivals of one cycle: each input gets a cell with probability load. The cell goes to output 0
+    with probability hotspot, or to a uniformly random output otherwise.
+    """
+    arrivals = np.zeros((N, M), dtype=np.int64)
+    for i in np.nonzero(rng.random(N) < load)[0]:
+        j = 0 if rng.random() < hotspot else rng.integers(M)
+        arrivals[i, j] += 1
+    return arrivals
+
+async def setup(dut):
+    benches = [SwitchBench(dut, name) for name in INSTANCES]
+    dut.rst_b.value = 0
+    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    await Timer(20, units="ns")
+    await FallingEdge(dut.clk)
+    dut.rst_b.value = 1
+    return benches
+
+async def run(dut, benches, cycles, load, hotspot=0.0, saturate=False):
+    """ run the switch for some cycles. All the instances get the same arrivals """
+    rng = np.random.default_rng(random.getrandbits(32))
+    for _ in range(cycles):
+        arrivals = traffic(rng, load, hotspot)
+        await FallingEdge(dut.clk)
+        reqs = []
+        for bench in benches:
+            bench.voq += arrivals
+            if saturate:
+                bench.voq = np.maximum(bench.voq, 1)
+            reqs.append(bench.request())
+            bench.req.value = reqs[-1]
+        await Timer(2, "ns")
+        for bench, req in zip(benches, reqs):
+            bench.check(req)
+
+def report(dut, benches, cycles):
+    for bench in benches:
+        size = np.array(bench.match_size[-cycles:])
+        dut._log.info(f"{bench.name}: average match size = {size.mean():.3f}, "
+                      f"throughput = {bench.sent.sum() / (cycles * N):.3f} cells/cycle/port, "
+                      f"backlog = {bench.voq.sum()}")
+
+@cocotb.test()
+async def test_saturated(dut):
+    """ all the queues are always backlogged. iSLIP reaches a full match once the pointers desynchronize """
+    benches = await setup(dut)
+    await run(dut, benches, N, 0.0, saturate=True)
+    await run(dut, benches, 1000, 0.0, saturate=True)
+    report(dut, benches, 1000)
+    for bench in benches:
+        if bench.model.mode == "OUTPUT_FIRST":
+            assert min(bench.match_size[N:]) == N, f"{bench.name}: match is not full under saturated traffic"
+
+@cocotb.test()
+async def test_uniform(dut):
+    """ uniform traffic, 90% load """
+    cycles = 5000
+    benches = await setup(dut)
+    await run(dut, benches, cycles, 0.9)
+    report(dut, benches, cycles)
+    for bench in benches:
+        # the queues stay small if the allocator keeps up with the load
+        assert bench.voq.sum() < 10 * N * M, f"{bench.name}: queues are growing under 90% uniform load"
+
+@cocotb.test()
+async def test_hotspot(dut):
+    """
+    half of the cells go to output 0. With one iteration a grant of output 0 is lost when the input
+    accepts another output, the later iterations give it to another input so output 0 is always busy.
+    """
+    cycles = 5000
+    benches = await setup(dut)
+    await run(dut, benches, cycles, 0.5, hotspot=0.5)
+    report(dut, benches, cycles)
+    for bench in benches:
+        busy = bench.sent[0] / cycles
+        dut._log.info(f"{bench.name}: output 0 utilization = {busy:.3f}")
+        if bench.model.iterations > 1:
+            assert busy > 0.98, f"{bench.name}: hotspot output is not fully used"
@@ -10,12 +10,25 @@
 import cocotb
 from cocotb.triggers import Timer, RisingEdge, FallingEdge
 from cocotb.clock import Clock
+from TraceRecorder import TraceRecorder, Trace, replay
+from Coverage import Coverage
 import random
+import os
 
-WIDTH = 8
+# WIDTH is set with the environment variable WIDTH, same as the rr_arbiter parameter:
+#   make PARAMS="WIDTH=16"
+WIDTH = int(os.environ.get("WIDTH", 8))
 MAX_VALUES = (1 << WIDTH) - 1
 BASE = 1
 
+# Set TRACE=1 to always save the trace of test_random. The trace is saved on failure anyway.
+# Set TRACE_REPLAY=<trace file> to replay TRACE_WINDOW cycles around the failure of a saved trace,
+# checked against the model. test_replay fails as long as the failure reproduces.
+# Set COVERAGE=<dir> to save the coverage of test_random, merge the runs with Coverage.py merge.
+TRACE = int(os.environ.get("TRACE", 0))
+TRACE_REPLAY = os.environ.get("TRACE_REPLAY")
+TRACE_WINDOW = int(os.environ.get("TRACE_WINDOW", 16))
+
 def arbiter_model(req, base, width):
     """ Arbiter. base determine the priority"""
     pos = 0
@@ -40,6 +53,10 @@ def rr_arbiter(req):
     BASE = grant << 1 | grant >> (WIDTH-1)
     return grant
 
+def trace_model(inputs, meta):
+    """ Model used to check a recorded trace offline with TraceRecorder.py """
+    return {"grant": rr_arbiter(inputs["req"])}
+
 ########################################
 # Test functions
 ########################################
@@ -74,22 +91,63 @@ async def tester_fixed(dut, step, debug=False):
             if req == 0:
                 break
 
+def random_req():
+    """ random request with a random density so that every requester can win after every base """
+    density = random.choice([0.1, 0.25, 0.5, 0.75, 0.9])
+    req = 0
+    while req == 0:
+        req = sum(1 << i for i in range(WIDTH) if random.random() < density)
+    return req
+
 async def tester_random(dut, step, debug=False):
+    """ random requests until every requester has won after every base, at most step cycles """
     await setup(dut)
     await FallingEdge(dut.clk)
-    for _ in range(step):
-        req = random.randint(1, MAX_VALUES)
-        await FallingEdge(dut.clk)
-        dut.req.value = req
-        await Timer(2, "ns")
-        grant = dut.grant.value.integer
-        expected_grant = rr_arbiter(req)
-        error_msg = f"req = {bin(req)}, grant = {bin(grant)}, expected grant = {bin(expected_grant)}"
-        assert grant == expected_grant, dut._log.error(error_msg)
-        good_msg = f"req = {bin(req)}, grant = {bin(grant)}"
-        if debug:
-            dut._log.info(good_msg)
+    recorder = TraceRecorder("rr_arbiter_random", {"req": dut.req}, {"grant": dut.grant}, {"base": dut.base},
+                             meta={"width": WIDTH})
+    cov = Coverage("rr_arbiter_random")
+    cov.cross("grant_x_base", cov.point("grant", WIDTH), cov.point("base", WIDTH), goal=4)
+    cov.point("requests", WIDTH + 1, ignore=[0])
+    try:
+        cycles = 0
+        while not cov.done and cycles < step:
+            cycles += 1
+            req = random_req()
+            await FallingEdge(dut.clk)
+            dut.req.value = req
+            await Timer(2, "ns")
+            recorder.sample()
+            grant = dut.grant.value.integer
+            expected_grant = rr_arbiter(req)
+            error_msg = f"req = {bin(req)}, grant = {bin(grant)}, expected grant = {bin(expected_grant)}"
+            if grant != expected_grant:
+                recorder.fail(error_msg)
+            assert grant == expected_grant, dut._log.error(error_msg)
+            cov.sample(grant=grant.bit_length() - 1, base=dut.base.value.integer.bit_length() - 1,
+                       requests=bin(req).count("1"))
+            good_msg = f"req = {bin(req)}, grant = {bin(grant)}"
+            if debug:
+                dut._log.info(good_msg)
+    finally:
+        if TRACE or recorder.failure is not None:
+            dut._log.info(f"Trace saved to {recorder.save()}")
+    dut._log.info(f"{cycles} cycles\n{cov.report(holes=8)}")
+    cov.save()
+    assert cov.done, dut._log.error(f"Coverage not closed after {step} cycles")
 
+async def tester_replay(dut, path, window):
+    """ Replay the cycles around the failure of a saved trace and check them against the model """
+    global BASE
+    trace = Trace(path)
+    dut._log.info(str(trace))
+    await setup(dut)
+    rows = trace.window(window, window)
+    # the model starts from the base deposited into the design
+    BASE = trace.value("state", "base", rows[0])
+    mismatches = await replay(dut, trace, dut.clk, rows, trace_model)
+    for row, name, expected, actual in mismatches:
+        dut._log.error(f"row {row}: {name} = {bin(actual)}, expected {name} = {bin(expected)}")
+    assert not mismatches, dut._log.error(f"{len(mismatches)} mismatches in the replayed window")
 
 @cocotb.test()
 async def test_fixed(dut):
@@ -101,4 +159,8 @@ async def test_fixed(dut):
 async def test_random(dut):
     global BASE
     BASE = 1
-    await tester_random(dut, 10000, False)
\ No newline at end of file
+    await tester_random(dut, max(10000, 1000 * WIDTH * WIDTH), False)
+
+@cocotb.test(skip=TRACE_REPLAY is None)
+async def test_replay(dut):
+    await tester_replay(dut, TRACE_REPLAY, TRACE_WINDOW)
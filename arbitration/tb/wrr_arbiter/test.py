@@ -0,0 +1,99 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Testbench for weighted round robin arbiter
+# ------------------------------------------------------------------------------------------------
+
+import cocotb
+from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.clock import Clock
+from ArbiterModel import WrrArbiter, share
+import numpy as np
+import random
+
+WIDTH = 8
+CW = 4
+MAX_VALUES = (1 << WIDTH) - 1
+
+def pack(values, width):
+    """ pack a list of values into a flat vector """
+    return sum(value << (i * width) for i, value in enumerate(values))
+
+########################################
+# Test functions
+########################################
+
+async def setup(dut):
+    dut.req.value = 0
+    dut.weight.value = 0
+    dut.rst_b.value = 0
+    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    await Timer(20, units="ns")
+
+async def reset(dut, weights):
+    """ reset the arbiter and program the weights """
+    await FallingEdge(dut.clk)
+    dut.req.value = 0
+    dut.weight.value = pack(weights, CW)
+    dut.rst_b.value = 0
+    await FallingEdge(dut.clk)
+    dut.rst_b.value = 1
+
+async def run_trace(dut, model, reqs):
+    """ drive the requests, compare the grants with the model and return the grants """
+    grants = np.zeros(len(reqs), dtype=np.int64)
+    for cycle, req in enumerate(reqs):
+        await FallingEdge(dut.clk)
+        dut.req.value = int(req)
+        await Timer(2, "ns")
+        grant = dut.grant.value.integer
+        expected_grant = model.step(int(req))
+        error_msg = f"cycle {cycle}: req = {bin(req)}, grant = {bin(grant)}, expected grant = {bin(expected_grant)}"
+        assert grant == expected_grant, dut._log.error(error_msg)
+        grants[cycle] = grant
+    return grants
+
+async def tester_bandwidth(dut, weights, rounds):
+    """ all the requesters are requesting, each of them should get weight grants per round """
+    model = WrrArbiter(WIDTH, weights)
+    await reset(dut, weights)
+    cycles = rounds * sum(weights)
+    grants = await run_trace(dut, model, np.full(cycles, MAX_VALUES))
+    counts = [int(count) for count in share(grants, WIDTH)]
+    dut._log.info(f"weights = {weights}, grants = {counts}")
+    assert counts == [w * rounds for w in weights], \
+        dut._log.error(f"Bandwidth does not match the weights: {counts}")
+
+async def tester_random(dut, weights, cycles, load):
+    """ random requests. Requester i requests with probability load[i] """
+    model = WrrArbiter(WIDTH, weights)
+    await reset(dut, weights)
+    # numpy generator seeded from random so the test is reproduced with RANDOM_SEED
+    rng = np.random.default_rng(random.getrandbits(32))
+    active = rng.random((cycles, WIDTH)) < np.array(load)
+    reqs = (active * (1 << np.arange(WIDTH))).sum(axis=1)
+    grants = await run_trace(dut, model, reqs)
+    assert share(grants, WIDTH)[[i for i, w in enumerate(weights) if w == 0]].sum() == 0, \
+        dut._log.error("Requester with weight 0 is granted")
+
+@cocotb.test()
+async def test_bandwidth(dut):
+    await setup(dut)
+    await tester_bandwidth(dut, [1, 2, 3, 4, 5, 6, 7, 8], 20)
+
+@cocotb.test()
+async def test_bandwidth_random(dut):
+    await setup(dut)
+    for _ in range(5):
+        weights = [random.randint(1, (1 << CW) - 1) for _ in range(WIDTH)]
+        await tester_bandwidth(dut, weights, 10)
+
+@cocotb.test()
+async def test_random(dut):
+    await setup(dut)
+    weights = [random.randint(0, (1 << CW) - 1) for _ in range(WIDTH)]
+    load = [random.random() for _ in range(WIDTH)]
+    await tester_random(dut, weights, 10000, load)
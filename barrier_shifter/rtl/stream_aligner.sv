@@ -0,0 +1,202 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Stream aligner
+// ------------------------------------------------------------------------------------------------
+// Pack a byte stream with partial beats into full beats, one beat per cycle.
+//
+// Features:
+//      - NB bytes per beat, NB is a power of 2 (e.g. 64 for a 512 bit datapath)
+//      - Input beats can start and end at any byte (e.g. after header stripping)
+//      - Each packet can start at any byte of the first output beat (out_offset), so the same
+//        module also unpacks a stream, e.g. to leave room for a header
+//      - valid/ready on both sides
+// Notes:
+//      - The bytes of an input beat must be contiguous: in_keep = bytes [s, s+n)
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Carry register             *
+------------------------------
+The carry register holds the first cnt bytes of the next output beat at bytes [0, cnt).
+When a beat with bytes [s, s+n) comes in, it is rotated left by (cnt - s) mod NB bytes so its first
+byte lands at byte cnt:
+
+    merged byte i = carry byte i     if i < cnt
+                    rotated byte i   otherwise
+
+    cnt + n <  NB:  merged goes back into the carry register, cnt <= cnt + n
+    cnt + n >= NB:  merged is sent as a full beat. The bytes that do not fit wrapped around to
+                    bytes [0, cnt + n - NB) of the rotated beat, which is the new carry.
+
+So the same rotation gives both the output beat and the new carry, there is no second shifter.
+
+------------------------------
+* Byte rotation              *
+------------------------------
+The bytes are rotated with barrier_shifter. Bit b of all the bytes forms a NB bit plane and each
+plane is rotated by the same amount, so 8 NB-bit barrier shifters do the byte rotation with
+log2(NB) levels of mux.
+
+------------------------------
+* Packet boundary            *
+------------------------------
+At the first beat of a packet cnt starts from out_offset, the bytes [0, out_offset) of the first
+output beat are not valid (out_keep = 0).
+
+At the last beat the merged beat is sent with out_last. If the last beat does not fit (cnt + n > NB),
+the full beat is sent first and the carry is flushed as the last beat in the next cycle. in_ready
+is low in that cycle, this is the only bubble of the aligner: at most one per packet.
+*/
+
+module stream_aligner #(
+    parameter NB = 8                        // number of bytes per beat, power of 2
+) (
+    input  logic                    clk,
+    input  logic                    rst_b,
+
+    input  logic                    in_vld,
+    output logic                    in_ready,
+    input  logic [NB*8-1:0]         in_data,
+    input  logic [NB-1:0]           in_keep,    // byte enable, contiguous
+    input  logic                    in_last,    // last beat of a packet
+    input  logic [$clog2(NB)-1:0]   out_offset, // first byte of the packet in the output, sampled at the first beat
+
+    output logic                    out_vld,
+    input  logic                    out_ready,
+    output logic [NB*8-1:0]         out_data,
+    output logic [NB-1:0]           out_keep,
+    output logic                    out_last
+);
+
+    localparam CW = $clog2(NB);
+
+    logic [NB*8-1:0]    carry;
+    logic [CW-1:0]      cnt;            // number of bytes in carry, including the holes
+    logic [CW-1:0]      hole;           // number of bytes not valid at the beginning of carry
+    logic               sop;            // next input beat is the first beat of a packet
+    logic               flush;          // carry has the last bytes of a packet
+
+    logic               advance;
+    logic               in_fire;
+
+    logic [CW-1:0]      in_start;       // first valid byte of the input beat
+    logic [CW:0]        in_cnt;         // number of valid bytes of the input beat
+    logic [CW-1:0]      base;           // cnt or out_offset for the first beat
+    logic [CW-1:0]      base_hole;
+    logic [CW-1:0]      rot;
+    logic [CW+1:0]      total;
+    logic [NB*8-1:0]    rotated;
+    logic [NB*8-1:0]    merged;
+    logic [NB-1:0]      merged_keep;
+
+    assign advance = ~out_vld | out_ready;
+    assign in_ready = advance & ~flush;
+    assign in_fire = in_vld & in_ready;
+
+    // ---------------------------------------------
+    // input beat position and size
+    // ---------------------------------------------
+
+    always @(*) begin
+        in_start = 0;
+        in_cnt = 0;
+        for (int i = NB - 1; i >= 0; i = i - 1) begin
+            if (in_keep[i]) in_start = i;
+            in_cnt = in_cnt + in_keep[i];
+        end
+    end
+
+    assign base = sop ? out_offset : cnt;
+    assign base_hole = sop ? out_offset : hole;
+    assign rot = base - in_start;
+    assign total = base + in_cnt;
+
+    // ---------------------------------------------
+    // byte rotation, one barrier shifter per bit plane
+    // ---------------------------------------------
+
+    genvar b, i;
+    generate
+        for (b = 0; b < 8; b = b + 1) begin: plane
+            logic [NB-1:0] din;
+            logic [NB-1:0] dout;
+            for (i = 0; i < NB; i = i + 1) begin: byte_bit
+                assign din[i] = in_data[i*8+b];
+                assign rotated[i*8+b] = dout[i];
+            end
+            barrier_shifter #(.WIDTH(NB), .DIRECTION("L"))
+            u_barrier_shifter (.din(din), .shift(rot), .dout(dout));
+        end
+
+        for (i = 0; i < NB; i = i + 1) begin: merge
+            assign merged[i*8+7:i*8] = (i < base) ? carry[i*8+7:i*8] : rotated[i*8+7:i*8];
+            assign merged_keep[i] = (i >= base_hole) && (i < total);
+        end
+    endgenerate
+
+    // ---------------------------------------------
+    // carry register and output
+    // ---------------------------------------------
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            cnt <= '0;
+            hole <= '0;
+            sop <= 1'b1;
+            flush <= 1'b0;
+            out_vld <= 1'b0;
+            out_keep <= '0;
+            out_last <= 1'b0;
+        end
+        else if (advance) begin
+            if (flush) begin
+                out_vld <= 1'b1;
+                out_keep <= ~({NB{1'b1}} << cnt);
+                out_last <= 1'b1;
+                flush <= 1'b0;
+                sop <= 1'b1;
+                cnt <= '0;
+            end
+            else if (in_fire) begin
+                sop <= in_last;
+                if (total >= NB) begin
+                    // full beat, the wrapped bytes are the new carry
+                    out_vld <= 1'b1;
+                    out_keep <= merged_keep;
+                    out_last <= in_last && (total == NB);
+                    flush <= in_last && (total > NB);
+                    cnt <= total - NB;
+                    hole <= '0;
+                end
+                else begin
+                    out_vld <= in_last;
+                    out_keep <= merged_keep;
+                    out_last <= in_last;
+                    cnt <= in_last ? '0 : total;
+                    hole <= base_hole;
+                end
+            end
+            else begin
+                out_vld <= 1'b0;
+            end
+        end
+    end
+
+    always @(posedge clk) begin
+        if (advance) begin
+            if (flush) begin
+                out_data <= carry;
+            end
+            else if (in_fire) begin
+                out_data <= merged;
+                carry <= (total >= NB) ? rotated : merged;
+            end
+        end
+    end
+
+endmodule
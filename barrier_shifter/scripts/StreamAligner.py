@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Stream aligner model, same as stream_aligner.sv
+numpy is required
+https://numpy.org/
+------------------------------------------------------------------------------------------------
+A stream of beats is three numpy arrays, one row per beat:
+
+    data: (beats, nb) uint8
+    keep: (beats, nb) bool, the valid bytes of each beat
+    last: (beats,) bool, last beat of a packet
+
+segment() cuts packets into input beats with contiguous byte enables, align() gives the beats
+expected from the aligner and bubbles() the number of cycles the aligner stalls the input.
+------------------------------------------------------------------------------------------------
+Example:
+Beats per cycle of 64 byte beats with random packet length and offset
+    python3 StreamAligner.py -b 64 -n 1000
+------------------------------------------------------------------------------------------------
+"""
+
+import argparse
+import numpy as np
+
+def random_packets(rng, n, min_len=1, max_len=1500):
+    """ n random packets as uint8 arrays """
+    return [rng.integers(0, 256, rng.integers(min_len, max_len + 1), dtype=np.uint8) for _ in range(n)]
+
+def segment(packets, nb, starts=None, rng=None):
+    """
+    cut the packets into input beats
+    @param starts: first byte of each packet in its first beat (e.g. header removed), default 0
+    @param rng: if set, each beat has a random number of bytes at a random position, otherwise
+                the beats are full except the first and the last one
+    @return: data, keep, last
+    """
+    data, keep, last = [], [], []
+    for p, packet in enumerate(packets):
+        pos = 0
+        start = starts[p] if starts is not None else 0
+        while pos < len(packet):
+            if rng is not None and pos > 0:
+                start = int(rng.integers(0, nb))
+            n = min(nb - start, len(packet) - pos)
+            if rng is not None:
+                n = int(rng.integers(1, n + 1))
+            beat = np.zeros(nb, dtype=np.uint8)
+            mask = np.zeros(nb, dtype=bool)
+            beat[start:start + n] = packet[pos:pos + n]
+            mask[start:start + n] = True
+            pos += n
+            data.append(beat)
+            keep.append(mask)
+            last.append(pos == len(packet))
+            start = 0
+    return np.array(data), np.array(keep), np.array(last)
+
+def align(packets, nb, offsets=None):
+    """
+    beats sent by the aligner: each packet starts at offsets[p] of its first beat and is packed
+    @return: data, keep, last
+    """
+    data, keep, last = [], [], []
+    for p, packet in enumerate(packets):
+        offset = offsets[p] if offsets is not None else 0
+        beats = (offset + len(packet) + nb - 1) // nb
+        buf = np.zeros(beats * nb, dtype=np.uint8)
+        mask = np.zeros(beats * nb, dtype=bool)
+        buf[offset:offset + len(packet)] = packet
+        mask[offset:offset + len(packet)] = True
+        data.append(buf.reshape(beats, nb))
+        keep.append(mask.reshape(beats, nb))
+        packet_last = np.zeros(beats, dtype=bool)
+        packet_last[-1] = True
+        last.append(packet_last)
+    return np.concatenate(data), np.concatenate(keep), np.concatenate(last)
+
+def bubbles(keep, last, nb, offsets=None):
+    """
+    number of cycles the input is stalled: the last beat of a packet that does not fit into the
+    current output beat needs one more cycle to flush
+    """
+    count = keep.sum(axis=1)
+    # bytes of each packet before each beat
+    packet = np.concatenate([[0], np.cumsum(last)[:-1]])
+    before = np.cumsum(count) - count
+    packet_start = np.concatenate([[0], np.cumsum(count)[np.nonzero(last)[0]]])[packet]
+    offset = np.asarray(offsets)[packet] if offsets is not None else 0
+    base = (offset + before - packet_start) % nb
+    return int(np.count_nonzero(last & (base + count > nb)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream aligner throughput")
+    parser.add_argument('-b', '--bytes',   type=int, default=64,   help="number of bytes per beat (default 64)")
+    parser.add_argument('-n', '--packets', type=int, default=1000, help="number of packets (default 1000)")
+    parser.add_argument('-m', '--max',     type=int, default=1500, help="max packet length (default 1500)")
+    args = parser.parse_args()
+    rng = np.random.default_rng()
+    packets = random_packets(rng, args.packets, 1, args.max)
+    starts = rng.integers(0, args.bytes, args.packets)
+    offsets = rng.integers(0, args.bytes, args.packets)
+    _, keep, last = segment(packets, args.bytes, starts)
+    _, out_keep, _ = align(packets, args.bytes, offsets)
+    cycles = len(keep) + bubbles(keep, last, args.bytes, offsets)
+    print(f"{len(keep)} input beats, {len(out_keep)} output beats in {cycles} cycles")
+    print(f"input: {len(keep) / cycles:.3f} beats/cycle, output: {len(out_keep) / cycles:.3f} beats/cycle")
+
+if __name__ == "__main__":
+    main()
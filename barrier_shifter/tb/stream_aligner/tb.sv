@@ -0,0 +1,89 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Testbench for stream aligner
+// One 512 bit (64 bytes) aligner and one 64 bit (8 bytes) aligner
+// ------------------------------------------------------------------------------------------------
+
+module tb();
+
+    logic               clk;
+    logic               rst_b;
+
+    // ------------------------------
+    // 64 bytes
+    // ------------------------------
+
+    logic               in_vld_64;
+    logic               in_ready_64;
+    logic [511:0]       in_data_64;
+    logic [63:0]        in_keep_64;
+    logic               in_last_64;
+    logic [5:0]         out_offset_64;
+    logic               out_vld_64;
+    logic               out_ready_64;
+    logic [511:0]       out_data_64;
+    logic [63:0]        out_keep_64;
+    logic               out_last_64;
+
+    stream_aligner #(.NB(64))
+    u_stream_aligner_64 (
+        .clk        (clk),
+        .rst_b      (rst_b),
+        .in_vld     (in_vld_64),
+        .in_ready   (in_ready_64),
+        .in_data    (in_data_64),
+        .in_keep    (in_keep_64),
+        .in_last    (in_last_64),
+        .out_offset (out_offset_64),
+        .out_vld    (out_vld_64),
+        .out_ready  (out_ready_64),
+        .out_data   (out_data_64),
+        .out_keep   (out_keep_64),
+        .out_last   (out_last_64)
+    );
+
+    // ------------------------------
+    // 8 bytes
+    // ------------------------------
+
+    logic               in_vld_8;
+    logic               in_ready_8;
+    logic [63:0]        in_data_8;
+    logic [7:0]         in_keep_8;
+    logic               in_last_8;
+    logic [2:0]         out_offset_8;
+    logic               out_vld_8;
+    logic               out_ready_8;
+    logic [63:0]        out_data_8;
+    logic [7:0]         out_keep_8;
+    logic               out_last_8;
+
+    stream_aligner #(.NB(8))
+    u_stream_aligner_8 (
+        .clk        (clk),
+        .rst_b      (rst_b),
+        .in_vld     (in_vld_8),
+        .in_ready   (in_ready_8),
+        .in_data    (in_data_8),
+        .in_keep    (in_keep_8),
+        .in_last    (in_last_8),
+        .out_offset (out_offset_8),
+        .out_vld    (out_vld_8),
+        .out_ready  (out_ready_8),
+        .out_data   (out_data_8),
+        .out_keep   (out_keep_8),
+        .out_last   (out_last_8)
+    );
+
+    //`ifdef COCOTB_SIM
+    //    initial begin
+    //        $dumpfile("dump.vcd");
+    //        $dumpvars(0, tb);
+    //    end
+    //`endif
+
+endmodule
@@ -0,0 +1,164 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Testbench for stream aligner
+# ------------------------------------------------------------------------------------------------
+
+import cocotb
+from cocotb.triggers import Timer, FallingEdge
+from cocotb.clock import Clock
+from StreamAligner import random_packets, segment, align, bubbles
+import numpy as np
+import random
+
+class Port():
+
+    def __init__(self, dut, nb):
+        """
+        Drive and monitor one aligner in tb.sv
+        @param nb: number of bytes per beat, 64 or 8
+        """
+        self.nb = nb
+        self.sig = lambda name: getattr(dut, f"{name}_{nb}")
+        self.inst = getattr(dut, f"u_stream_aligner_{nb}")
+        self.sig("in_vld").value = 0
+        self.sig("out_ready").value = 0
+
+    def to_int(self, row):
+        """ byte (or keep bit) i of the row is at bits [i*8+7:i*8] (or bit i) """
+        if row.dtype == bool:
+            row = np.packbits(row, bitorder="little")
+        return int.from_bytes(row.tobytes(), "little")
+
+    def from_int(self, value, keep):
+        if keep:
+            return np.unpackbits(np.frombuffer(value.to_bytes(self.nb // 8, "little"), dtype=np.uint8),
+                                 bitorder="little").astype(bool)
+        return np.frombuffer(value.to_bytes(self.nb, "little"), dtype=np.uint8)
+
+########################################
+# Test functions
+########################################
+
+async def setup(dut):
+    ports = {nb: Port(dut, nb) for nb in [64, 8]}
+    dut.rst_b.value = 0
+    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    await Timer(20, units="ns")
+    await FallingEdge(dut.clk)
+    dut.rst_b.value = 1
+    return ports
+
+async def run(dut, port, beats, offsets, rng, expected, in_rate=1.0, out_rate=1.0, timeout=1000):
+    """
+    send the input beats and collect the output beats
+    After the last input beat, run until the expected number of output beats is collected and the
+    aligner has no output beat or flush pending
+    @param offsets: out_offset of each packet
+    @param expected: expected number of output beats
+    @param in_rate, out_rate: probability of in_vld / out_ready in a cycle
+    @param timeout: max number of cycles after the last input beat
+    @return: output data, keep, last, number of cycles, number of cycles in_ready is low
+    """
+    data, keep, last = beats
+    packet = np.concatenate([[0], np.cumsum(last)[:-1]])
+    out_data, out_keep, out_last = [], [], []
+    idx = 0
+    cycles = 0
+    stall = 0
+    drain = 0
+    pending = True
+    while idx < len(data) or pending:
+        await FallingEdge(dut.clk)
+        vld = idx < len(data) and rng.random() < in_rate
+        port.sig("in_vld").value = int(vld)
+        if vld:
+            port.sig("in_data").value = port.to_int(data[idx])
+            port.sig("in_keep").value = port.to_int(keep[idx])
+            port.sig("in_last").value = int(last[idx])
+            port.sig("out_offset").value = int(offsets[packet[idx]])
+        port.sig("out_ready").value = int(rng.random() < out_rate)
+        await Timer(1, units="ns")
+        if port.sig("out_vld").value.integer and port.sig("out_ready").value.integer:
+            out_data.append(port.from_int(port.sig("out_data").value.integer, False))
+            out_keep.append(port.from_int(port.sig("out_keep").value.integer, True))
+            out_last.append(bool(port.sig("out_last").value.integer))
+        if vld and port.sig("in_ready").value.integer:
+            idx += 1
+        stall += not port.sig("in_ready").value.integer
+        cycles += idx < len(data)
+        if idx >= len(data):
+            pending = len(out_data) < expected or port.sig("out_vld").value.integer or port.inst.flush.value.integer
+            drain += 1
+            assert drain <= timeout, f"Timeout: got {len(out_data)} output beats, expected {expected}"
+    return np.array(out_data), np.array(out_keep), np.array(out_last), cycles, stall
+
+def check(port, actual, expected):
+    """ compare the output beats, only the valid bytes are compared """
+    data, keep, last = actual
+    exp_data, exp_keep, exp_last = expected
+    assert len(keep) == len(exp_keep), f"Got {len(keep)} output beats, expected {len(exp_keep)}"
+    mismatch = np.nonzero((keep != exp_keep).any(axis=1) | (last != exp_last) |
+                          ((data != exp_data) & exp_keep).any(axis=1))[0]
+    assert len(mismatch) == 0, \
+        f"NB = {port.nb}: output beat {mismatch[0]} mismatch\n" \
+        f"keep = {port.to_int(keep[mismatch[0]]):x}, expected {port.to_int(exp_keep[mismatch[0]]):x}\n" \
+        f"data = {port.to_int(data[mismatch[0]] * keep[mismatch[0]]):x}\n" \
+        f"expected {port.to_int(exp_data[mismatch[0]] * exp_keep[mismatch[0]]):x}"
+
+async def tester_full_rate(dut, nb, n, unpack):
+    """
+    packets with a random start offset (header removed) at full rate, with out_ready always high
+    the only stall cycles are the flush cycles predicted by the model
+    """
+    ports = await setup(dut)
+    port = ports[nb]
+    rng = np.random.default_rng(random.getrandbits(32))
+    packets = random_packets(rng, n, 1, 1500)
+    starts = rng.integers(0, nb, n)
+    offsets = rng.integers(0, nb, n) if unpack else np.zeros(n, dtype=np.int64)
+    beats = segment(packets, nb, starts)
+    expected = align(packets, nb, offsets)
+    *actual, cycles, stall = await run(dut, port, beats, offsets, rng, len(expected[1]))
+    check(port, actual, expected)
+    expected_stall = bubbles(beats[1], beats[2], nb, offsets)
+    dut._log.info(f"NB = {nb}: {len(beats[0])} input beats, {len(actual[0])} output beats in {cycles} cycles, "
+                  f"{len(beats[0]) / cycles:.3f} input beats/cycle, {len(actual[0]) / cycles:.3f} output beats/cycle, "
+                  f"{stall} stall cycles for {n} packets")
+    assert stall == expected_stall, f"Got {stall} stall cycles, expected {expected_stall}"
+
+async def tester_random(dut, nb, n, in_rate, out_rate):
+    """ random partial beats, random out_offset, random in_vld and out_ready """
+    ports = await setup(dut)
+    port = ports[nb]
+    rng = np.random.default_rng(random.getrandbits(32))
+    packets = random_packets(rng, n, 1, 8 * nb)
+    starts = rng.integers(0, nb, n)
+    offsets = rng.integers(0, nb, n)
+    beats = segment(packets, nb, starts, rng)
+    expected = align(packets, nb, offsets)
+    *actual, cycles, stall = await run(dut, port, beats, offsets, rng, len(expected[1]), in_rate, out_rate)
+    check(port, actual, expected)
+
+@cocotb.test()
+async def test_pack_64(dut):
+    await tester_full_rate(dut, 64, 200, False)
+
+@cocotb.test()
+async def test_unpack_64(dut):
+    await tester_full_rate(dut, 64, 200, True)
+
+@cocotb.test()
+async def test_unpack_8(dut):
+    await tester_full_rate(dut, 8, 200, True)
+
+@cocotb.test()
+async def test_random_64(dut):
+    await tester_random(dut, 64, 200, 0.8, 0.7)
+
+@cocotb.test()
+async def test_random_8(dut):
+    await tester_random(dut, 8, 500, 0.7, 0.5)
@@ -7,7 +7,9 @@
 // Testbench for Barrier Shifter
 // ------------------------------------------------------------------------------------------------
 
-module tb();
+module tb #(
+    parameter WIDTH = 16    // width of the parameterized instances, override with PARAMS="WIDTH=<n>"
+) ();
 
     logic [7:0] din8, dout8l, dout8r;
     logic [2:0] shift8;
@@ -27,6 +29,15 @@ module tb();
     barrier_shifter #(.WIDTH(12), .DIRECTION("R"))
     u_barrier_shifter_12r (.din(din12), .shift(shift12), .dout(dout12r));
 
+    logic [WIDTH-1:0] din, doutl, doutr;
+    logic [$clog2(WIDTH)-1:0] shift;
+
+    barrier_shifter #(.WIDTH(WIDTH), .DIRECTION("L"))
+    u_barrier_shifter_l (.din(din), .shift(shift), .dout(doutl));
+
+    barrier_shifter #(.WIDTH(WIDTH), .DIRECTION("R"))
+    u_barrier_shifter_r (.din(din), .shift(shift), .dout(doutr));
+
     //`ifdef COCOTB_SIM
     //    initial begin
     //        $dumpfile("dump.vcd");
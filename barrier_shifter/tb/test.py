@@ -6,10 +6,15 @@
 # ------------------------------------------------------------------------------------------------
 # Testbench for Barrier Shifter
 # ------------------------------------------------------------------------------------------------
+# test_left/test_right check the WIDTH instances of tb.sv. WIDTH is set with the environment
+# variable WIDTH, same as the tb parameter: make PARAMS="WIDTH=32"
+# ------------------------------------------------------------------------------------------------
 
 import cocotb
 from cocotb.triggers import Timer, RisingEdge, FallingEdge
 from cocotb.clock import Clock
+import random
+import os
 
 ########################################
 # Test functions
@@ -17,6 +22,10 @@ from cocotb.clock import Clock
 
 PRINT_INTO = False
 
+WIDTH = int(os.environ.get("WIDTH", 16))
+# exhaustive up to this width, random data above
+MAX_EXHAUSTIVE = 12
+
 class Signals():
     def __init__(self, din, shift, dout):
         self.din = din
@@ -71,4 +80,25 @@ async def test_left_12b(dut):
     signals = Signals(dut.din12, dut.shift12, dut.dout12l)
     for din in range(0, (1<<12)-1):
         for shift in range(0, 11):
-            await tester(dut, signals, 12, rotate_left, din, shift)
\ No newline at end of file
+            await tester(dut, signals, 12, rotate_left, din, shift)
+
+async def tester_width(dut, signals, rotate_fun, samples=4096):
+    """ all the data (or random data if WIDTH > MAX_EXHAUSTIVE) with all the shift values """
+    assert len(signals.din) == WIDTH, f"WIDTH = {WIDTH} but tb WIDTH = {len(signals.din)}"
+    if WIDTH <= MAX_EXHAUSTIVE:
+        data = range(1 << WIDTH)
+    else:
+        data = [random.getrandbits(WIDTH) for _ in range(samples)]
+    for din in data:
+        for shift in range(WIDTH):
+            await tester(dut, signals, WIDTH, rotate_fun, din, shift)
+
+@cocotb.test()
+async def test_right(dut):
+    """ Test rotate right with WIDTH """
+    await tester_width(dut, Signals(dut.din, dut.shift, dut.doutr), rotate_right)
+
+@cocotb.test()
+async def test_left(dut):
+    """ Test rotate left with WIDTH """
+    await tester_width(dut, Signals(dut.din, dut.shift, dut.doutl), rotate_left)
@@ -0,0 +1,279 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Functional coverage for the cocotb testbenches
+numpy is required
+https://numpy.org/
+------------------------------------------------------------------------------------------------
+A coverpoint has a fixed number of bins, each bin is a hit counter in a bytearray (saturates at
+255). A numpy array shares the same memory so a whole batch of samples can be added at once. A bin
+is covered when it has been hit `goal` times, the number of covered bins is kept up to date on
+each sample so checking if the goal is met costs nothing.
+
+A cross is a coverpoint over the combinations of other coverpoints (bins = product of the number
+of bins), sampled with one value per coverpoint. A combination with a bin ignored on one of the
+coverpoints is ignored on the cross as well.
+
+Usage in a testbench:
+
+    cov = Coverage("rr_arbiter")
+    grant = cov.point("grant", 8)               # values 0..7
+    base = cov.point("base", 8)
+    cov.cross("grant_x_base", grant, base, goal=4)
+    while not cov.done and n < max_iters:       # stop as soon as the goals are met
+        ...
+        cov.sample(grant=g, base=b)             # the crosses are sampled from their points
+    dut._log.info(cov.report())
+    cov.save()                                  # COVERAGE=<dir>: save <dir>/<name>.<pid>.json
+
+Merge the coverage of parallel runs and report:
+
+    python3 Coverage.py merge cov/*.json -o merged.json
+    python3 Coverage.py report merged.json --holes
+------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import argparse
+import json
+import os
+
+class Coverpoint():
+
+    def __init__(self, name, bins, goal=1, ignore=(), labels=None):
+        """
+        @param bins: number of bins, the sampled value is the bin index
+        @param goal: number of hits for a bin to be covered (max 255)
+        @param ignore: bins not counted in the goal (e.g. not reachable)
+        @param labels: optional function bin index -> label for the report
+        """
+        assert 1 <= goal <= 255, "goal must be between 1 and 255"
+        self.name = name
+        self.bins = bins
+        self.goal = goal
+        self.labels = labels
+        self.counts = bytearray(bins)
+        self.hits = np.frombuffer(self.counts, dtype=np.uint8)
+        self.mask = np.ones(bins, dtype=bool)
+        self.mask[list(ignore)] = False
+        self.ignore = bytearray(self.mask.astype(np.uint8) ^ 1)
+        self.goal_bins = int(self.mask.sum())
+        self.covered = 0
+
+    def sample(self, value):
+        c = self.counts[value]
+        if c < 255:
+            self.counts[value] = c + 1
+            if c + 1 == self.goal and not self.ignore[value]:
+                self.covered += 1
+
+    def sample_many(self, values):
+        """ add a batch of samples (numpy array of bin indexes) """
+        add = np.bincount(np.asarray(values, dtype=np.int64), minlength=self.bins)
+        self.hits[:] = np.minimum(self.hits.astype(np.int64) + add, 255)
+        self._recount()
+
+    def _recount(self):
+        self.covered = int(((self.hits >= self.goal) & self.mask).sum())
+
+    @property
+    def done(self):
+        return self.covered >= self.goal_bins
+
+    @property
+    def percent(self):
+        return 100.0 * self.covered / max(self.goal_bins, 1)
+
+    def holes(self):
+        """ @return: the bins not covered yet """
+        return [int(i) for i in np.nonzero((self.hits < self.goal) & self.mask)[0]]
+
+    def label(self, index):
+        return self.labels(index) if self.labels else str(index)
+
+    def merge(self, other):
+        """ add the hits of another run of the same coverpoint """
+        assert self.bins == other.bins, f"{self.name}: number of bins does not match"
+        self.hits[:] = np.minimum(self.hits.astype(np.int64) + other.hits, 255)
+        self._recount()
+
+    def to_dict(self):
+        return {"bins": self.bins, "goal": self.goal, "counts": bytes(self.counts).hex(),
+                "ignore": [int(i) for i in np.nonzero(~self.mask)[0]]}
+
+    @classmethod
+    def from_dict(cls, name, data):
+        point = cls(name, data["bins"], data["goal"], data.get("ignore", ()))
+        point.hits[:] = np.frombuffer(bytes.fromhex(data["counts"]), dtype=np.uint8)
+        point._recount()
+        return point
+
+class Cross(Coverpoint):
+
+    def __init__(self, name, points, goal=1, ignore=()):
+        """
+        @param points: the crossed coverpoints, the bin index is the mixed radix number of the
+                       bin indexes, the first point is the most significant
+        @param ignore: cross bins not counted in the goal, in addition to the bins of the values
+                       ignored on the coverpoints
+        """
+        self.points = points
+        bins = int(np.prod([p.bins for p in points]))
+        ignored = np.zeros(1, dtype=bool)
+        for point in points:
+            ignored = (ignored[:, None] | ~point.mask[None, :]).ravel()
+        ignore = sorted(set(ignore) | {int(i) for i in np.nonzero(ignored)[0]})
+        super().__init__(name, bins, goal, ignore, labels=self._label)
+
+    def index(self, *values):
+        index = 0
+        for point, value in zip(self.points, values):
+            index = index * point.bins + value
+        return index
+
+    def sample(self, *values):
+        super().sample(self.index(*values))
+
+    def sample_many(self, *values):
+        index = np.zeros(len(values[0]), dtype=np.int64)
+        for point, value in zip(self.points, values):
+            index = index * point.bins + np.asarray(value, dtype=np.int64)
+        super().sample_many(index)
+
+    def _label(self, index):
+        labels = []
+        for point in reversed(self.points):
+            labels.append(f"{point.name}={point.label(index % point.bins)}")
+            index //= point.bins
+        return ", ".join(reversed(labels))
+
+class Coverage():
+
+    def __init__(self, name):
+        self.name = name
+        self.points = {}
+        self.crosses = {}
+
+    def point(self, name, bins, goal=1, ignore=(), labels=None):
+        self.points[name] = Coverpoint(name, bins, goal, ignore, labels)
+        return self.points[name]
+
+    def cross(self, name, *points, goal=1, ignore=()):
+        self.crosses[name] = Cross(name, points, goal, ignore)
+        return self.crosses[name]
+
+    def sample(self, **values):
+        """ sample the coverpoints by name, the crosses of the sampled points are sampled as well """
+        for name, value in values.items():
+            self.points[name].sample(value)
+        for cross in self.crosses.values():
+            if all(p.name in values for p in cross.points):
+                cross.sample(*(values[p.name] for p in cross.points))
+
+    def sample_many(self, **values):
+        """ same as sample with numpy arrays of values """
+        for name, value in values.items():
+            self.points[name].sample_many(value)
+        for cross in self.crosses.values():
+            if all(p.name in values for p in cross.points):
+                cross.sample_many(*(values[p.name] for p in cross.points))
+
+    def all(self):
+        return list(self.points.values()) + list(self.crosses.values())
+
+    @property
+    def done(self):
+        return all(p.done for p in self.all())
+
+    @property
+    def percent(self):
+        covered = sum(p.covered for p in self.all())
+        return 100.0 * covered / max(sum(p.goal_bins for p in self.all()), 1)
+
+    def report(self, holes=0):
+        """
+        @param holes: number of holes to list for each coverpoint
+        """
+        lines = [f"Coverage {self.name}: {self.percent:.1f}%"]
+        for p in self.all():
+            lines.append(f"    {p.name:<24} {p.covered:>6}/{p.goal_bins:<6} {p.percent:6.1f}%  (goal {p.goal})")
+            if holes and not p.done:
+                missing = p.holes()
+                lines.append("        holes: " + "; ".join(p.label(i) for i in missing[:holes]) +
+                             (" ..." if len(missing) > holes else ""))
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {"name": self.name,
+                "points": {n: p.to_dict() for n, p in self.points.items()},
+                "crosses": {n: dict(p.to_dict(), points=[q.name for q in p.points]) for n, p in self.crosses.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        cov = cls(data["name"])
+        for name, point in data["points"].items():
+            cov.points[name] = Coverpoint.from_dict(name, point)
+        for name, cross in data["crosses"].items():
+            cov.crosses[name] = Cross(name, [cov.points[p] for p in cross["points"]], cross["goal"], cross.get("ignore", ()))
+            cov.crosses[name].merge(Coverpoint.from_dict(name, cross))
+        return cov
+
+    def save(self, path=None):
+        """
+        save the coverage as json
+        @param path: default <COVERAGE>/<name>.<pid>.json if the environment variable COVERAGE is
+                     set, otherwise nothing is saved
+        @return: the path or None
+        """
+        if path is None:
+            if not os.environ.get("COVERAGE"):
+                return None
+            os.makedirs(os.environ["COVERAGE"], exist_ok=True)
+            path = os.path.join(os.environ["COVERAGE"], f"{self.name}.{os.getpid()}.json")
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def merge(self, other):
+        for p in self.all():
+            src = other.points.get(p.name) or other.crosses.get(p.name)
+            if src is not None:
+                p.merge(src)
+
+def merge(paths):
+    """ @return: {coverage name: merged Coverage} """
+    merged = {}
+    for path in paths:
+        cov = Coverage.load(path)
+        if cov.name in merged:
+            merged[cov.name].merge(cov)
+        else:
+            merged[cov.name] = cov
+    return merged
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge and report functional coverage")
+    parser.add_argument('command', choices=["merge", "report"], help="merge: merge the files, report: report each file")
+    parser.add_argument('files', nargs='+', help="coverage json files")
+    parser.add_argument('-o', '--output', type=str, default=None, help="merge: output json file (one coverage name only)")
+    parser.add_argument('--holes', type=int, nargs='?', const=16, default=0, help="list up to N holes per coverpoint (default 16)")
+    args = parser.parse_args()
+    covs = merge(args.files) if args.command == "merge" else {p: Coverage.load(p) for p in args.files}
+    for cov in covs.values():
+        print(cov.report(args.holes))
+    if args.output:
+        assert len(covs) == 1, "Only one coverage name can be written to the output"
+        next(iter(covs.values())).save(args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Synthesis QoR benchmark suite
+yosys is required: https://github.com/YosysHQ/yosys
+------------------------------------------------------------------------------------------------
+Synthesize every block in the suite (common/syn/qor_suite.json) with yosys/abc for each parameter
+set, in a process pool, and report:
+
+    cells:  number of cells after synthesis (flops included)
+    flops:  number of flops
+    depth:  longest topological path (ltp -noff) in number of cells
+    area:   total cell area, only when the liberty file exists
+
+The flow is the same as lfsr/syn/lfsr_galois_p/synth.ys. When the liberty file is not present
+(common/lib/vsclib013.lib, see README), cells and depth are reported on the yosys internal gates.
+
+A block can be a generated variant: the "generate" command is run first and creates {out}, which
+is then synthesized with the other sources.
+
+Each run is appended to the csv history. The results are compared with the json baseline, a
+metric that grows more than its threshold (in percent) is a regression and the script returns 1.
+------------------------------------------------------------------------------------------------
+Example:
+Run the whole suite and compare with the baseline
+    python3 QorBench.py
+Only the crc blocks, update the baseline
+    python3 QorBench.py -f crc --update-baseline
+------------------------------------------------------------------------------------------------
+"""
+
+from multiprocessing import Pool
+from itertools import product
+import subprocess
+import argparse
+import tempfile
+import datetime
+import json
+import time
+import csv
+import os
+import re
+import sys
+
+GIT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SUITE = os.path.join(GIT_ROOT, "common", "syn", "qor_suite.json")
+BASELINE = os.path.join(GIT_ROOT, "common", "syn", "qor_baseline.json")
+HISTORY = os.path.join(GIT_ROOT, "common", "syn", "qor_history.csv")
+LIBERTY = os.path.join(GIT_ROOT, "common", "lib", "vsclib013.lib")
+
+METRICS = ("cells", "flops", "depth", "area")
+# allowed increase in percent
+THRESHOLDS = {"cells": 5.0, "flops": 0.0, "depth": 5.0, "area": 5.0}
+
+class Job():
+
+    def __init__(self, block, params):
+        """
+        @param block: block from the suite
+        @param params: parameter set of this job
+        """
+        self.block = block["name"]
+        self.top = block["top"]
+        self.sources = [os.path.join(GIT_ROOT, src) for src in block.get("sources", [])]
+        self.generate = block.get("generate")
+        self.params = params
+        if params:
+            self.name = f"{self.block}[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+        else:
+            self.name = self.block
+
+    def script(self, sources, liberty=None):
+        """ yosys script of this job """
+        script = [f"read -sv {' '.join(sources)}"]
+        script += [f"chparam -set {k} {v} {self.top}" for k, v in self.params.items()]
+        script += [
+            f"hierarchy -top {self.top}",
+            f"synth -flatten -top {self.top}",
+        ]
+        if liberty:
+            script += [
+                f"dfflibmap -liberty {liberty}",
+                f"abc -liberty {liberty}",
+                "opt_clean",
+                f"tee -q -o stat.json stat -json -liberty {liberty}",
+            ]
+        else:
+            script += ["tee -q -o stat.json stat -json"]
+        script += ["tee -q -o ltp.txt ltp -noff"]
+        return "; ".join(script)
+
+def expand(block):
+    """ parameter sets of a block """
+    params = block.get("params")
+    if not params:
+        return [{}]
+    if isinstance(params, list):
+        return params
+    keys = list(params)
+    return [dict(zip(keys, values)) for values in product(*(params[k] for k in keys))]
+
+def load_suite(path, pattern=None):
+    """ list of jobs in the suite, optionally filtered by a regex on the job name """
+    with open(path) as suite_file:
+        suite = json.load(suite_file)
+    jobs = [Job(block, params) for block in suite["blocks"] for params in expand(block)]
+    if pattern:
+        jobs = [job for job in jobs if re.search(pattern, job.name)]
+    return jobs
+
+def parse_stat(path):
+    with open(path) as stat_file:
+        design = json.load(stat_file)["design"]
+    cells = design["num_cells_by_type"]
+    return {
+        "cells": design["num_cells"],
+        "flops": sum(count for cell, count in cells.items() if "DFF" in cell.upper()),
+        "area": design.get("area"),
+    }
+
+def parse_ltp(path):
+    with open(path) as ltp_file:
+        match = re.search(r"length=(\d+)", ltp_file.read())
+    return int(match.group(1)) if match else 0
+
+def run_job(args):
+    """ worker: synthesize one job. Return (job name, result dict) """
+    job, yosys, liberty, workdir = args
+    start = time.time()
+    result = {"block": job.block, "top": job.top, "params": job.params}
+    with tempfile.TemporaryDirectory(dir=workdir) as cwd:
+        sources = list(job.sources)
+        if job.generate:
+            out = os.path.join(cwd, f"{job.top}.sv")
+            cmd = job.generate.format(root=GIT_ROOT, out=out)
+            proc = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+            if proc.returncode:
+                result["error"] = proc.stderr.strip()[-2000:]
+                return job.name, result
+            sources.append(out)
+        proc = subprocess.run(yosys + ["-q", "-p", job.script(sources, liberty)],
+                              cwd=cwd, capture_output=True, text=True)
+        if proc.returncode:
+            result["error"] = (proc.stdout + proc.stderr).strip()[-2000:]
+            return job.name, result
+        result.update(parse_stat(os.path.join(cwd, "stat.json")))
+        result["depth"] = parse_ltp(os.path.join(cwd, "ltp.txt"))
+    result["seconds"] = round(time.time() - start, 2)
+    return job.name, result
+
+def run(jobs, yosys=("yosys",), liberty=None, processes=None, workdir=None):
+    """ run all the jobs in a process pool. Return dict of job name -> result """
+    args = [(job, list(yosys), liberty, workdir) for job in jobs]
+    with Pool(processes) as pool:
+        return dict(pool.imap_unordered(run_job, args))
+
+def compare(results, baseline, thresholds=THRESHOLDS):
+    """ list of regressions (name, metric, baseline value, new value) """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline or "error" in result:
+            continue
+        for metric, threshold in thresholds.items():
+            old = baseline[name].get(metric)
+            new = result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold / 100.0):
+                regressions.append((name, metric, old, new))
+    return regressions
+
+def git_commit():
+    proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=GIT_ROOT, capture_output=True, text=True)
+    return proc.stdout.strip()
+
+def append_history(path, results):
+    """ append the results to the csv history """
+    new_file = not os.path.exists(path)
+    date = datetime.datetime.now().isoformat(timespec="seconds")
+    commit = git_commit()
+    with open(path, 'a', newline='') as history_file:
+        writer = csv.writer(history_file)
+        if new_file:
+            writer.writerow(["date", "commit", "name"] + list(METRICS) + ["seconds"])
+        for name in sorted(results):
+            result = results[name]
+            if "error" in result:
+                continue
+            writer.writerow([date, commit, name] + [result.get(m) for m in METRICS] + [result["seconds"]])
+
+def report(results, baseline):
+    print(f"{'name':<60} {'cells':>8} {'flops':>6} {'depth':>6} {'area':>10} {'delta cells':>12}")
+    for name in sorted(results):
+        result = results[name]
+        if "error" in result:
+            print(f"{name:<60} ERROR")
+            continue
+        area = f"{result['area']:.1f}" if result.get("area") is not None else "-"
+        delta = ""
+        if name in baseline and baseline[name].get("cells"):
+            delta = f"{100.0 * (result['cells'] - baseline[name]['cells']) / baseline[name]['cells']:+.1f}%"
+        print(f"{name:<60} {result['cells']:>8} {result['flops']:>6} {result['depth']:>6} {area:>10} {delta:>12}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthesis QoR benchmark suite")
+    parser.add_argument('-s', '--suite',     type=str, default=SUITE,    help="suite file")
+    parser.add_argument('-f', '--filter',    type=str, default=None,     help="only run the jobs matching this regex")
+    parser.add_argument('-j', '--jobs',      type=int, default=None,     help="number of processes (default cpu count)")
+    parser.add_argument('-l', '--liberty',   type=str, default=LIBERTY,  help="liberty file, ignored if not present")
+    parser.add_argument('-b', '--baseline',  type=str, default=BASELINE, help="baseline json file")
+    parser.add_argument('--history',         type=str, default=HISTORY,  help="history csv file")
+    parser.add_argument('--yosys',           type=str, default=os.environ.get("YOSYS", "yosys"), help="yosys command")
+    parser.add_argument('--workdir',         type=str, default=None,     help="directory for the temporary job directories")
+    parser.add_argument('--threshold',       type=str, nargs='*', default=[], help="allowed increase in percent, e.g. cells=2 depth=0")
+    parser.add_argument('--update-baseline', action='store_true',        help="write the results into the baseline")
+    parser.add_argument('--list',            action='store_true',        help="list the jobs and exit")
+    args = parser.parse_args()
+
+    jobs = load_suite(args.suite, args.filter)
+    if args.list:
+        for job in jobs:
+            print(job.name)
+        return
+    liberty = args.liberty if args.liberty and os.path.exists(args.liberty) else None
+    if not liberty:
+        print("Liberty file not found, reporting yosys internal gates")
+    thresholds = dict(THRESHOLDS)
+    for threshold in args.threshold:
+        metric, value = threshold.split("=")
+        thresholds[metric] = float(value)
+
+    results = run(jobs, args.yosys.split(), liberty, args.jobs, args.workdir)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    report(results, baseline)
+    append_history(args.history, results)
+    errors = [name for name, result in results.items() if "error" in result]
+    for name in errors:
+        print(f"ERROR: {name}\n{results[name]['error']}")
+    regressions = compare(results, baseline, thresholds)
+    for name, metric, old, new in regressions:
+        print(f"REGRESSION: {name} {metric} {old} -> {new}")
+
+    if args.update_baseline:
+        for name, result in results.items():
+            if "error" not in result:
+                baseline[name] = {metric: result.get(metric) for metric in METRICS}
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=1, sort_keys=True)
+    sys.exit(1 if errors or regressions else 0)
+
+if __name__ == "__main__":
+    main()
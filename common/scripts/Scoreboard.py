@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Scoreboard for the cocotb testbenches
+------------------------------------------------------------------------------------------------
+Count the checks and keep the errors of one design (or one instance). A fail fast scoreboard
+raises on the first mismatch, otherwise the errors are kept so that concurrent testers can go on
+and report all the instances at the end.
+
+Usage in a testbench:
+
+    scoreboard = Scoreboard("crc_32p", fail_fast=False)
+    scoreboard.check(dut, crc, expected, f"Data: {hex(data)}, Expected CRC: ...")
+    dut._log.info(scoreboard.report())
+    assert not scoreboard.errors, scoreboard.report()
+
+A testbench with its own expected queues subclasses it and calls check() or error().
+------------------------------------------------------------------------------------------------
+"""
+
+class Scoreboard():
+
+    def __init__(self, name, fail_fast=True):
+        """
+        @param fail_fast: raise on the first mismatch, otherwise keep the errors and go on
+        """
+        self.name = name
+        self.fail_fast = fail_fast
+        self.checked = 0
+        self.errors = []
+
+    def check(self, dut, actual, expected, msg):
+        """ @return: True if actual matches expected """
+        self.checked += 1
+        if actual != expected:
+            self.error(dut, msg)
+        return actual == expected
+
+    def error(self, dut, msg):
+        self.errors.append(msg)
+        assert not self.fail_fast, dut._log.error(f"ERROR: {msg}")
+
+    def report(self):
+        status = "PASS" if not self.errors else f"FAIL ({len(self.errors)} errors, first: {self.errors[0]})"
+        return f"{self.name}: {self.checked} checked, {status}"
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Simulator benchmark for the cocotb testbenches
+------------------------------------------------------------------------------------------------
+Run the testbenches (the tb Makefiles including common/tb/common.mk) with each simulator and
+compare the wall-clock time of each test from the cocotb results file:
+
+    test:       wall-clock time of the test reported by cocotb
+    overhead:   make wall-clock time minus the time of the tests: compile, verilator C++ build,
+                simulator startup
+
+Each tb is run --repeat times per simulator. With verilator the first run builds the model into
+the cache (.sim_cache) and the next runs reuse it, so the overhead of the first and the last run
+shows the cost of the C++ build. --cold removes the cache first.
+
+A failing make (e.g. simulator not installed) is reported and the benchmark goes on.
+------------------------------------------------------------------------------------------------
+Example:
+All the testbenches with icarus and verilator
+    python3 SimBench.py
+The arbiters, verilator only, cold and cached run
+    python3 SimBench.py -f arbitration -s verilator --repeat 2 --cold
+------------------------------------------------------------------------------------------------
+"""
+
+import xml.etree.ElementTree as ET
+import subprocess
+import argparse
+import shutil
+import time
+import csv
+import os
+import re
+import sys
+
+GIT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SIM_CACHE_DIR = os.path.join(GIT_ROOT, ".sim_cache")
+
+def find_testbenches(root=GIT_ROOT):
+    """ @return: tb directories (relative to root) whose Makefile includes common.mk """
+    tbs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "sim_build"]
+        if "Makefile" in filenames:
+            with open(os.path.join(dirpath, "Makefile")) as f:
+                if "common/tb/common.mk" in f.read():
+                    tbs.append(os.path.relpath(dirpath, root))
+    return sorted(tbs)
+
+def parse_results(path):
+    """ @return: {test name: (wall time, sim time ns, passed)} from the cocotb results file """
+    tests = {}
+    for case in ET.parse(path).getroot().iter("testcase"):
+        passed = case.find("failure") is None and case.find("error") is None
+        tests[case.get("name")] = (float(case.get("time", 0)), float(case.get("sim_time_ns", 0)), passed)
+    return tests
+
+def run_tb(tb, sim, results, testcase=None, extra=()):
+    """
+    run one tb with one simulator
+    @return: make wall time, {test name: (wall time, sim time ns, passed)}, error message or None
+    """
+    if os.path.exists(results):
+        os.remove(results)
+    cmd = ["make", "--no-print-directory", "-C", os.path.join(GIT_ROOT, tb), f"SIM={sim}", f"COCOTB_RESULTS_FILE={results}"]
+    if testcase:
+        cmd.append(f"TESTCASE={testcase}")
+    cmd += list(extra)
+    start = time.time()
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    wall = time.time() - start
+    if not os.path.exists(results):
+        lines = [l for l in proc.stdout.splitlines() if "***" in l or "rror" in l]
+        return wall, {}, lines[0].strip() if lines else f"make returned {proc.returncode}"
+    return wall, parse_results(results), None
+
+def fmt(value, digits=2):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the simulators on the cocotb testbenches")
+    parser.add_argument('-f', '--filter',    type=str, default=None, help="only run the testbenches matching this regex")
+    parser.add_argument('-s', '--sim',       type=str, nargs='+', default=["icarus", "verilator"], help="simulators (default icarus verilator)")
+    parser.add_argument('-t', '--testcase',  type=str, default=None, help="only run this test (cocotb TESTCASE)")
+    parser.add_argument('-r', '--repeat',    type=int, default=1,    help="number of runs per simulator (default 1)")
+    parser.add_argument('--cold',            action='store_true',    help="remove the verilator model cache first")
+    parser.add_argument('--workdir',         type=str, default=None, help="directory for the results files (default .sim_cache/bench)")
+    parser.add_argument('--csv',             type=str, default=None, help="write the results into this csv file")
+    parser.add_argument('--list',            action='store_true',    help="list the testbenches and exit")
+    parser.add_argument('args',              nargs='*',              help="extra make arguments, e.g. WIDTH=16")
+    args = parser.parse_args()
+
+    tbs = [tb for tb in find_testbenches() if not args.filter or re.search(args.filter, tb)]
+    if args.list:
+        print("\n".join(tbs))
+        return 0
+    if args.cold and os.path.isdir(SIM_CACHE_DIR):
+        shutil.rmtree(SIM_CACHE_DIR)
+
+    rows = []
+    overheads = []
+    for tb in tbs:
+        workdir = args.workdir or os.path.join(SIM_CACHE_DIR, "bench")
+        os.makedirs(workdir, exist_ok=True)
+        times = {}      # test -> sim -> best wall time
+        for sim in args.sim:
+            for r in range(args.repeat):
+                results = os.path.join(os.path.abspath(workdir), f"{tb.replace(os.sep, '_')}_{sim}.xml")
+                wall, tests, error = run_tb(tb, sim, results, args.testcase, args.args)
+                if error:
+                    print(f"{tb} [{sim}]: {error}")
+                    overheads.append((tb, sim, r, wall, None))
+                    break
+                for name, (test_wall, sim_ns, passed) in tests.items():
+                    best = times.setdefault(name, {}).get(sim)
+                    times[name][sim] = test_wall if best is None else min(best, test_wall)
+                    if not passed:
+                        print(f"{tb} [{sim}]: {name} FAILED")
+                overheads.append((tb, sim, r, wall, wall - sum(t[0] for t in tests.values())))
+        for name, by_sim in times.items():
+            rows.append((tb, name, by_sim))
+
+    base = args.sim[0]
+    header = f"{'testbench/test':<60}" + "".join(f"{sim:>12}" for sim in args.sim) + \
+             "".join(f"{'x ' + sim:>14}" for sim in args.sim[1:])
+    print(header)
+    for tb, name, by_sim in rows:
+        line = f"{tb + '/' + name:<60}" + "".join(f"{fmt(by_sim.get(sim)):>12}" for sim in args.sim)
+        for sim in args.sim[1:]:
+            speedup = by_sim[base] / by_sim[sim] if by_sim.get(base) and by_sim.get(sim) else None
+            line += f"{fmt(speedup, 1):>14}"
+        print(line)
+    print()
+    print(f"{'testbench':<48}{'sim':>12}{'run':>6}{'make':>10}{'overhead':>10}")
+    for tb, sim, r, wall, overhead in overheads:
+        print(f"{tb:<48}{sim:>12}{r:>6}{fmt(wall):>10}{fmt(overhead):>10}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["testbench", "test"] + args.sim)
+            for tb, name, by_sim in rows:
+                writer.writerow([tb, name] + [by_sim.get(sim, "") for sim in args.sim])
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
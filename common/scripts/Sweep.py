@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Parameter sweep for the cocotb testbenches
+------------------------------------------------------------------------------------------------
+Run a testbench once per parameter set with PARAMS (see common/tb/common.mk). Each parameter set
+has its own build directory (sim_build/<params> or its own cached verilator model) and its own
+results file, so the runs are done at the same time in a pool of --jobs processes. The python
+test gets the parameters as environment variables.
+
+The parameter sets are the product of the -p values:
+
+    -p WIDTH=4,8,16 -p DEPTH=2,4        6 runs: WIDTH=4 DEPTH=2, WIDTH=4 DEPTH=4, ...
+
+The results and the timings of each test are collected from the cocotb results files and
+reported per parameter set.
+------------------------------------------------------------------------------------------------
+Example:
+The round robin arbiter with 4 to 32 requesters
+    python3 Sweep.py arbitration/tb/rr_arbiter -p WIDTH=4,8,16,32
+The barrier shifter with verilator, 4 jobs, only test_left
+    python3 Sweep.py barrier_shifter/tb -p WIDTH=5,8,13,16,32,64 -s verilator -j 4 -t test_left
+------------------------------------------------------------------------------------------------
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from SimBench import GIT_ROOT, SIM_CACHE_DIR, run_tb
+from itertools import product
+import argparse
+import csv
+import os
+import sys
+
+def param_sets(specs):
+    """
+    @param specs: ["WIDTH=4,8", "DEPTH=2"]
+    @return: list of parameter sets, each a list of NAME=VALUE
+    """
+    names, values = [], []
+    for spec in specs:
+        name, _, value = spec.partition("=")
+        assert name and value, f"Wrong parameter '{spec}', expected NAME=VALUE[,VALUE...]"
+        names.append(name)
+        values.append(value.split(","))
+    return [[f"{n}={v}" for n, v in zip(names, combo)] for combo in product(*values)]
+
+def run(job):
+    """ worker: run the tb with one parameter set """
+    tb, sim, params, workdir, testcase, extra = job
+    tag = "_".join(p.replace("=", "") for p in params)
+    results = os.path.join(workdir, f"{tag}.xml")
+    wall, tests, error = run_tb(tb, sim, results, testcase, [f"PARAMS={' '.join(params)}"] + list(extra))
+    return params, wall, tests, error
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a testbench for each parameter set in parallel")
+    parser.add_argument('tb',                type=str,               help="testbench directory (relative to the repository root)")
+    parser.add_argument('-p', '--param',     type=str, action='append', required=True,
+                                                                     help="NAME=VALUE[,VALUE...], can be repeated")
+    parser.add_argument('-s', '--sim',       type=str, default="icarus", help="simulator (default icarus)")
+    parser.add_argument('-j', '--jobs',      type=int, default=os.cpu_count(), help="number of runs at the same time (default cpu count)")
+    parser.add_argument('-t', '--testcase',  type=str, default=None, help="only run this test (cocotb TESTCASE)")
+    parser.add_argument('--workdir',         type=str, default=None, help="directory for the results files (default .sim_cache/sweep/<tb>)")
+    parser.add_argument('--csv',             type=str, default=None, help="write the results of each test into this csv file")
+    parser.add_argument('args',              nargs='*',              help="extra make arguments")
+    args = parser.parse_args()
+
+    tb = os.path.relpath(os.path.abspath(args.tb), GIT_ROOT) if os.path.isdir(args.tb) else args.tb
+    workdir = os.path.abspath(args.workdir or os.path.join(SIM_CACHE_DIR, "sweep", tb.replace(os.sep, "_")))
+    os.makedirs(workdir, exist_ok=True)
+    jobs = [(tb, args.sim, params, workdir, args.testcase, args.args) for params in param_sets(args.param)]
+    with ThreadPoolExecutor(max(args.jobs, 1)) as pool:
+        results = list(pool.map(run, jobs))
+
+    failed = 0
+    print(f"{'parameters':<32}{'passed':>10}{'sim ns':>14}{'test s':>10}{'make s':>10}  status")
+    for params, wall, tests, error in results:
+        passed = sum(t[2] for t in tests.values())
+        failures = [name for name, t in tests.items() if not t[2]]
+        status = error or (f"FAIL: {' '.join(failures)}" if failures else "PASS")
+        failed += bool(error or failures)
+        print(f"{' '.join(params):<32}{f'{passed}/{len(tests)}':>10}{sum(t[1] for t in tests.values()):>14.0f}"
+              f"{sum(t[0] for t in tests.values()):>10.2f}{wall:>10.2f}  {status}")
+    print(f"{len(results) - failed}/{len(results)} parameter sets passed")
+
+    if args.csv:
+        names = [p.split("=")[0] for p in results[0][0]] if results else []
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(names + ["test", "passed", "wall", "sim_ns", "make_wall"])
+            for params, wall, tests, error in results:
+                values = [p.split("=", 1)[1] for p in params]
+                if error:
+                    writer.writerow(values + ["", 0, "", "", f"{wall:.2f}"])
+                for name, (test_wall, sim_ns, passed) in tests.items():
+                    writer.writerow(values + [name, int(passed), f"{test_wall:.3f}", f"{sim_ns:.0f}", f"{wall:.2f}"])
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
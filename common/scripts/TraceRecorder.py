@@ -0,0 +1,279 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Stimulus/response trace recording and replay for the cocotb testbenches
+numpy is required to save and load the trace
+https://numpy.org/
+------------------------------------------------------------------------------------------------
+A trace stores one row per cycle (or per transaction). Each signal is stored as its own column
+in a compressed npz file using the smallest unsigned integer type that fits the signal:
+
+    in.<name>       values driven into the design
+    out.<name>      values sampled from the design
+    state.<name>    internal state, deposited into the design before replaying a window
+    meta            json string: trace name, failing row, error message and user information
+
+Usage in a testbench:
+
+    recorder = TraceRecorder("rr_arbiter_random", inputs={"req": dut.req}, outputs={"grant": dut.grant})
+    recorder.sample()       # after driving the inputs and waiting for the outputs
+    recorder.fail(msg)      # mark the current row as the failing row
+    recorder.save()         # write <name>.trace.npz
+
+Offline check against a python model (no simulator needed):
+
+    python TraceRecorder.py check rr_arbiter_random.trace.npz --model test.py:trace_model
+
+Replay the rows around the failure in the simulator, checked against the python model:
+
+    mismatches = await replay(dut, trace, dut.clk, trace.window(16, 16), trace_model)
+
+Print the rows around the failure:
+
+    python TraceRecorder.py show rr_arbiter_random.trace.npz --window 8
+------------------------------------------------------------------------------------------------
+"""
+
+from array import array
+import importlib.util
+import argparse
+import json
+import os
+import sys
+
+KINDS = ("in", "out", "state")
+
+class Column():
+
+    def __init__(self):
+        """ Create a new column. Values up to 64 bits are packed in an array, wider values in a list """
+        self.values = array('Q')
+        self.wide = None
+
+    def append(self, value):
+        if self.wide is None and value >> 64:
+            self.wide = list(self.values)
+        if self.wide is None:
+            self.values.append(value)
+        else:
+            self.wide.append(value)
+
+    def __len__(self):
+        return len(self.values) if self.wide is None else len(self.wide)
+
+    def numpy(self):
+        """ convert the column to the smallest numpy array that holds all the values """
+        import numpy as np
+        if self.wide is None:
+            data = np.frombuffer(self.values, dtype=np.uint64) if len(self.values) else np.zeros(0, np.uint64)
+            top = int(data.max()) if len(data) else 0
+            for dtype in (np.uint8, np.uint16, np.uint32):
+                if top <= np.iinfo(dtype).max:
+                    return data.astype(dtype)
+            return data.copy()
+        # wide values are split into 64 bit limbs, limb 0 is the least significant
+        limbs = max(1, (max(v.bit_length() for v in self.wide) + 63) // 64)
+        data = np.zeros((len(self.wide), limbs), dtype=np.uint64)
+        for row, value in enumerate(self.wide):
+            for limb in range(limbs):
+                data[row, limb] = (value >> (64 * limb)) & 0xFFFFFFFFFFFFFFFF
+        return data
+
+class TraceRecorder():
+
+    def __init__(self, name, inputs=None, outputs=None, state=None, meta=None):
+        """
+        @param name: trace name, the trace is saved as <name>.trace.npz
+        @param inputs: dict of name -> signal handle driven by the testbench
+        @param outputs: dict of name -> signal handle sampled from the design
+        @param state: dict of name -> internal signal handle restored before replaying a window
+        @param meta: extra information stored with the trace (json serializable)
+        """
+        self.name = name
+        self.handles = {"in": inputs or {}, "out": outputs or {}, "state": state or {}}
+        self.columns = {kind: {} for kind in KINDS}
+        self.meta = dict(meta or {})
+        self.rows = 0
+        self.failure = None
+        self.message = None
+
+    def _append(self, kind, name, value):
+        column = self.columns[kind].setdefault(name, Column())
+        assert len(column) == self.rows, f"Trace column {kind}.{name} is missing a row"
+        column.append(int(value))
+
+    def sample(self, **values):
+        """
+        record one row. Signal handles given in the constructor are read from the design,
+        extra values (for example the data of a transaction) are given as keyword arguments
+        using the "<kind>_<name>" form, e.g. sample(in_din=0x12, out_crc=0x34)
+        """
+        for kind in KINDS:
+            for name, handle in self.handles[kind].items():
+                self._append(kind, name, handle.value.integer)
+        for key, value in values.items():
+            kind, name = key.split("_", 1)
+            self._append(kind, name, value)
+        self.rows += 1
+
+    def fail(self, message=None, row=None):
+        """ mark the failing row. Default is the last recorded row """
+        self.failure = self.rows - 1 if row is None else row
+        self.message = message
+
+    def save(self, path=None):
+        """ write the trace into a compressed npz file """
+        import numpy as np
+        path = path or f"{self.name}.trace.npz"
+        arrays = {}
+        for kind in KINDS:
+            for name, column in self.columns[kind].items():
+                arrays[f"{kind}.{name}"] = column.numpy()
+        meta = dict(self.meta, name=self.name, rows=self.rows, failure=self.failure, message=self.message)
+        arrays["meta"] = np.array(json.dumps(meta))
+        np.savez_compressed(path, **arrays)
+        return path
+
+class Trace():
+
+    def __init__(self, path):
+        """ Load a trace saved by TraceRecorder """
+        import numpy as np
+        with np.load(path) as data:
+            self.meta = json.loads(str(data["meta"]))
+            self.columns = {kind: {} for kind in KINDS}
+            for key in data.files:
+                if key == "meta":
+                    continue
+                kind, name = key.split(".", 1)
+                self.columns[kind][name] = data[key]
+        self.path = path
+        self.name = self.meta["name"]
+        self.rows = self.meta["rows"]
+        self.failure = self.meta["failure"]
+        self.message = self.meta["message"]
+
+    def __len__(self):
+        return self.rows
+
+    def value(self, kind, name, row):
+        column = self.columns[kind][name]
+        if column.ndim == 1:
+            return int(column[row])
+        value = 0
+        for limb in range(column.shape[1]):
+            value |= int(column[row, limb]) << (64 * limb)
+        return value
+
+    def row(self, row, kind="in"):
+        """ values of all the signals of a kind at a row """
+        return {name: self.value(kind, name, row) for name in self.columns[kind]}
+
+    def window(self, before=8, after=8, center=None):
+        """ row range around the failure (or around center) """
+        if center is None:
+            center = self.failure if self.failure is not None else self.rows - 1
+        return range(max(0, center - before), min(self.rows, center + after + 1))
+
+    def __str__(self):
+        string = f"Trace '{self.name}': {self.rows} rows"
+        if self.failure is not None:
+            string += f", failed at row {self.failure}: {self.message}"
+        return string
+
+########################################
+# Replay and offline check
+########################################
+
+async def replay(dut, trace, clk, rows, model, settle=2, handles=None):
+    """
+    Re-drive a window of a trace into the design and check the outputs against a python model.
+    The recorded outputs are not used: they are the outputs of the failing design, so a failure
+    that reproduces would match them.
+    The state columns of the first row are deposited into the design before driving it, the model
+    has to start from the same state.
+    Each row is driven at the falling edge of clk and the outputs are sampled settle ns later.
+    @param model: model(inputs, meta) called for every row in order, returns a dict of expected
+                  outputs (same as check)
+    @param handles: optional dict of name -> handle, default is getattr(dut, name)
+    @return: list of mismatches (row, name, expected, actual)
+    """
+    from cocotb.triggers import FallingEdge, Timer
+    handles = handles or {}
+    get = lambda name: handles[name] if name in handles else getattr(dut, name)
+    mismatches = []
+    for i, row in enumerate(rows):
+        await FallingEdge(clk)
+        if i == 0:
+            for name, value in trace.row(row, "state").items():
+                get(name).value = value
+        inputs = trace.row(row, "in")
+        for name, value in inputs.items():
+            get(name).value = value
+        await Timer(settle, "ns")
+        for name, expected in model(inputs, trace.meta).items():
+            actual = get(name).value.integer
+            if actual != expected:
+                mismatches.append((row, name, expected, actual))
+    return mismatches
+
+def check(trace, model, rows=None):
+    """
+    Check a trace against a python model without simulator.
+    model(inputs, meta) is called for every row in order and returns a dict of expected outputs.
+    @return: list of mismatches (row, name, expected, actual)
+    """
+    mismatches = []
+    for row in (rows if rows is not None else range(trace.rows)):
+        expected = model(trace.row(row, "in"), trace.meta)
+        actual = trace.row(row, "out")
+        for name, value in expected.items():
+            if actual[name] != value:
+                mismatches.append((row, name, value, actual[name]))
+    return mismatches
+
+def load_model(spec):
+    """ load a model from "path/to/file.py:function" """
+    path, func = spec.rsplit(":", 1)
+    module_spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return getattr(module, func)
+
+def show(trace, rows):
+    for row in rows:
+        marker = ">>" if row == trace.failure else "  "
+        values = []
+        for kind in KINDS:
+            values += [f"{kind}.{name}={hex(value)}" for name, value in trace.row(row, kind).items()]
+        print(f"{marker} {row:8d}: " + " ".join(values))
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or check a recorded trace")
+    parser.add_argument('command',           type=str, choices=['show', 'check'], help="show the trace or check it against a model")
+    parser.add_argument('trace',             type=str,                help="trace file")
+    parser.add_argument('-m', '--model',     type=str,                help="model for check: path/to/file.py:function")
+    parser.add_argument('-w', '--window',    type=int, default=None,  help="only use rows within this distance of the failure")
+    args = parser.parse_args()
+
+    trace = Trace(args.trace)
+    print(trace)
+    rows = trace.window(args.window, args.window) if args.window is not None else range(trace.rows)
+    if args.command == 'show':
+        show(trace, rows)
+    else:
+        # stateful models have to start from the first row
+        rows = range(rows.stop) if args.window is not None else rows
+        mismatches = check(trace, load_model(args.model), rows)
+        for row, name, expected, actual in mismatches[:20]:
+            print(f"row {row}: {name} expected {hex(expected)}, actual {hex(actual)}")
+        print(f"{len(mismatches)} mismatches in {len(rows)} rows")
+        sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
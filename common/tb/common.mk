@@ -0,0 +1,76 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Common make rules for the cocotb testbenches
+# ------------------------------------------------------------------------------------------------
+# Included at the end of each tb Makefile, after VERILOG_SOURCES, TOPLEVEL and MODULE:
+#
+#   include $(GIT_ROOT)/common/tb/common.mk
+#
+# Simulator:
+#   make                    icarus (default)
+#   make SIM=verilator      verilator
+#
+# Verilator model cache:
+# The verilated model is built in $(SIM_CACHE_DIR)/<TOPLEVEL>-<hash> instead of sim_build. The
+# hash covers the content of the sources, the toplevel, the compile arguments and the verilator
+# and cocotb versions, so running a tb again, or going back to sources built before, reuses the
+# compiled model and skips the C++ build.
+#   make SIM=verilator SIM_CACHE=0      build in sim_build
+#   make cache-clean                    remove all the cached models
+#
+# Parameter override:
+#   make PARAMS="WIDTH=16"              override parameters of TOPLEVEL (integer values)
+# Each NAME=VALUE is passed to the simulator and exported as an environment variable so the
+# python test can read it (os.environ["WIDTH"]). The build goes into its own directory
+# (sim_build/WIDTH16, or its own cached model with verilator) so several parameter sets can be
+# built and run at the same time, see common/scripts/Sweep.py.
+# ------------------------------------------------------------------------------------------------
+
+# defaults
+SIM ?= icarus
+TOPLEVEL_LANG ?= verilog
+
+SIM_CACHE ?= 1
+SIM_CACHE_DIR ?= $(GIT_ROOT)/.sim_cache
+
+# parameter override, before the compile arguments go into the model hash
+ifneq ($(strip $(PARAMS)),)
+ifeq ($(SIM),verilator)
+COMPILE_ARGS += $(addprefix -G,$(PARAMS))
+else
+COMPILE_ARGS += $(addprefix -P$(TOPLEVEL).,$(PARAMS))
+endif
+$(foreach param,$(PARAMS),$(eval export $(param)))
+SIM_BUILD ?= sim_build/$(subst =,,$(subst $(eval) ,_,$(strip $(PARAMS))))
+endif
+
+ifeq ($(SIM),verilator)
+
+# the testbenches are written for icarus, do not stop on lint warnings
+COMPILE_ARGS += -Wno-fatal
+
+ifeq ($(SIM_CACHE),1)
+SIM_HASH := $(shell (cat $(VERILOG_SOURCES); \
+                     echo $(TOPLEVEL) $(COMPILE_ARGS) $(EXTRA_ARGS); \
+                     verilator --version; cocotb-config --version) | sha1sum | cut -c1-16)
+SIM_BUILD := $(SIM_CACHE_DIR)/$(TOPLEVEL)-$(SIM_HASH)
+# The cached model matches the content of the sources. Make the model newer than the sources so
+# a new timestamp alone (e.g. after git checkout) does not rebuild it.
+ifneq ($(wildcard $(SIM_BUILD)/Vtop),)
+$(shell touch $(SIM_BUILD)/Vtop.mk && touch $(SIM_BUILD)/Vtop)
+endif
+endif
+
+endif
+
+# include cocotb's make rules to take care of the simulator setup
+include $(shell cocotb-config --makefiles)/Makefile.sim
+
+cache-clean:
+	$(RM) -r $(SIM_CACHE_DIR)
+
+.PHONY: cache-clean
@@ -93,7 +93,7 @@ module crc_gen_p #(
         end
         else if (DW > CW) begin
             assign lfsr_init = din[DW-1:DW-CW] ^ crc_in;
-            assign data_remaining = {din[DW-CW-1:0], {(DW-CW){1'b0}}};
+            assign data_remaining = {din[DW-CW-1:0], {CW{1'b0}}};
         end
 
         // Use a parallel Galois LFSR
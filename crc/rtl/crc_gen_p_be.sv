@@ -0,0 +1,78 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Parallel CRC generator with byte enable
+// This module calculates the CRC of a wide data beat in one cycle. The last beat of a packet
+// can be partially filled, the valid bytes are given by the byte enable.
+// ------------------------------------------------------------------------------------------------
+
+/*
+------------------------------------------------------------------------------------------------
+Byte enable:
+------------------------------------------------------------------------------------------------
+Same as crc_gen_p, the MSB of the data is calculated first, so the first byte of the beat is at
+the MSB. The valid bytes in the beat are continuous starting from the MSB byte. For example, for
+a 64 bit data beat:
+
+byte enable:  1 1 1 0 0 0 0 0   => din[63:40] is valid, 3 bytes.
+byte enable:  1 1 1 1 1 1 1 1   => full beat, 8 bytes.
+
+(For AXI-Stream, tkeep[0] is the first byte, so the byte enable is tkeep bit reversed and the
+data is byte swapped.)
+
+------------------------------------------------------------------------------------------------
+Implementation:
+------------------------------------------------------------------------------------------------
+The CRC is calculated for every possible number of valid bytes in parallel, each one with its own
+set of equations (a crc_gen_p instance with 8, 16, ... DW bit of data). The result is selected by
+the number of valid bytes. A beat with no valid byte passes crc_in through.
+
+There is no serial fall back for the tail of the packet so the CRC is always calculated in one
+cycle, at the cost of DW/8 sets of equations.
+*/
+
+module crc_gen_p_be #(
+    parameter DW = 64,              // data width, must be multiple of 8
+    parameter CW = 32,              // crc width
+    parameter POLY = 32'h04c11db7   // polynomial represented using normal form.
+) (
+    input  logic [DW-1:0]   din,    // data for crc calculation
+    input  logic [DW/8-1:0] be,     // byte enable, valid bytes start from the MSB
+    input  logic [CW-1:0]   crc_in, // initial polynomial value or prevoious CRC value
+    output logic [CW-1:0]   crc_out // generated crc
+);
+
+    localparam NB = DW / 8;         // number of bytes
+
+    // crc_bytes[k] is the CRC when there are k valid bytes
+    logic [CW-1:0] crc_bytes[NB:1];
+
+    genvar k;
+    generate
+        for (k = 1; k <= NB; k = k + 1) begin: crc_byte
+            crc_gen_p #(
+                .DW(8*k),
+                .CW(CW),
+                .POLY(POLY)
+            )
+            u_crc_gen_p(
+                .din(din[DW-1:DW-8*k]),
+                .crc_in(crc_in),
+                .crc_out(crc_bytes[k])
+            );
+        end
+    endgenerate
+
+    // select the CRC based on the number of valid bytes.
+    // be is continuous from MSB, so be[NB-k] is set if there are at least k valid bytes.
+    always @(*) begin
+        crc_out = crc_in;
+        for (int i = 1; i <= NB; i = i + 1) begin
+            if (be[NB-i]) crc_out = crc_bytes[i];
+        end
+    end
+
+endmodule
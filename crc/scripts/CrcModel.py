@@ -0,0 +1,215 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+CRC model with combine / zero-extension support, and script to generate the
+"CRC shift-by-N-zeros" module used to combine CRC in hardware.
+jinja is required to generate verilog
+https://github.com/pallets/jinja
+------------------------------------------------------------------------------------------------
+The CRC uses the normal (MSB-first) representation, same as crc_gen_s/crc_gen_p.
+
+Shifting the CRC register by one zero bit is a linear operation over GF(2):
+
+    crc' = M * crc          M is the WIDTH x WIDTH matrix of the Galois LFSR
+
+So shifting by n zero bits is M^n * crc. M^n is calculated by squaring the matrix (same as
+crc32_combine in zlib), so the cost is log2(n) matrix multiplications instead of n shifts.
+
+Combine:
+Given crc_a = CRC(A) and crc_b = CRC(B), where both are calculated with initial value INIT and
+final xor value XOROUT, and len_b is the number of bytes in B:
+
+    CRC(A + B) = M^(8*len_b) * (crc_a ^ XOROUT ^ INIT) ^ crc_b
+
+When INIT == XOROUT (for example CRC-32/BZIP2) this is simply M^(8*len_b) * crc_a ^ crc_b
+------------------------------------------------------------------------------------------------
+Example:
+Generate a module shifting a CRC-32 value by 64 zero bits
+    python3 CrcModel.py -w 32 -p 0x04c11db7 -s 64
+------------------------------------------------------------------------------------------------
+"""
+
+from multiprocessing import Pool
+import argparse
+
+########################################
+# GF(2) matrix
+# A matrix is stored as a list of columns.
+# Each column is an integer, bit i is row i.
+########################################
+
+def gf2_matrix_times(mat, vec):
+    """ multiply a matrix with a vector """
+    result = 0
+    idx = 0
+    while vec:
+        if vec & 0x1:
+            result ^= mat[idx]
+        vec >>= 1
+        idx += 1
+    return result
+
+def gf2_matrix_multiply(a, b):
+    """ multiply 2 matrices: a * b """
+    return [gf2_matrix_times(a, col) for col in b]
+
+def gf2_matrix_square(mat):
+    return gf2_matrix_multiply(mat, mat)
+
+def gf2_matrix_rows(mat, width):
+    """ convert the matrix into rows. Each row is an integer, bit j is column j """
+    rows = []
+    for i in range(width):
+        row = 0
+        for j, col in enumerate(mat):
+            row |= ((col >> i) & 0x1) << j
+        rows.append(row)
+    return rows
+
+class CrcModel():
+
+    def __init__(self, width, poly, init=0, xorout=0):
+        """
+        @param width: CRC width
+        @param poly: CRC polynomial, normal representation
+        @param init: initial value of the CRC register
+        @param xorout: value xored to the final CRC
+        """
+        self.width = width
+        self.poly = poly
+        self.init = init
+        self.xorout = xorout
+        self.mask = (1 << width) - 1
+        # M^(2^k) for k = 0, 1, 2, ...
+        # shifting by one zero bit: bit j moves to bit j+1, the MSB is fed back through the polynomial
+        self.pow2 = [[1 << (j + 1) for j in range(width - 1)] + [poly]]
+
+    def update(self, crc, data):
+        """ process the data bytes (MSB first) starting from a raw CRC register value """
+        for byte in data:
+            for i in range(7, -1, -1):
+                xor_bit = ((byte >> i) & 0x1) ^ (crc >> (self.width - 1))
+                crc = ((crc << 1) & self.mask) ^ (self.poly if xor_bit else 0)
+        return crc
+
+    def checksum(self, data):
+        """ calculate the CRC of the data """
+        return self.update(self.init, data) ^ self.xorout
+
+    def matrix(self, nbits):
+        """ the matrix that shift the CRC register by nbits zero bits """
+        result = None
+        k = 0
+        while nbits:
+            if k == len(self.pow2):
+                self.pow2.append(gf2_matrix_square(self.pow2[-1]))
+            if nbits & 0x1:
+                result = self.pow2[k] if result is None else gf2_matrix_multiply(self.pow2[k], result)
+            nbits >>= 1
+            k += 1
+        if result is None:
+            result = [1 << j for j in range(self.width)]
+        return result
+
+    def shift(self, crc, nbits):
+        """ shift the raw CRC register value by nbits zero bits """
+        k = 0
+        while nbits:
+            if k == len(self.pow2):
+                self.pow2.append(gf2_matrix_square(self.pow2[-1]))
+            if nbits & 0x1:
+                crc = gf2_matrix_times(self.pow2[k], crc)
+            nbits >>= 1
+            k += 1
+        return crc
+
+    def combine(self, crc_a, crc_b, len_b):
+        """
+        combine the CRC of 2 segments
+        @param crc_a: CRC of the first segment
+        @param crc_b: CRC of the second segment
+        @param len_b: length of the second segment in bytes
+        """
+        return self.shift(crc_a ^ self.xorout ^ self.init, 8 * len_b) ^ crc_b
+
+    def checksum_segmented(self, data, segment, processes=None):
+        """
+        calculate the CRC of the data by splitting it into segments of segment bytes.
+        Each segment is calculated independently (in a process pool if processes is not None)
+        and the results are combined.
+        """
+        chunks = [data[i:i+segment] for i in range(0, len(data), segment)] or [b""]
+        if processes:
+            with Pool(processes) as pool:
+                crcs = pool.map(self.checksum, chunks)
+        else:
+            crcs = [self.checksum(chunk) for chunk in chunks]
+        crc = crcs[0]
+        for chunk, crc_b in zip(chunks[1:], crcs[1:]):
+            crc = self.combine(crc, crc_b, len(chunk))
+        return crc
+
+    def verilog(self, nbits, name=None, output=None):
+        """
+        generate verilog code to shift the CRC register by nbits zero bits
+        """
+        from jinja2 import Template
+        rows = gf2_matrix_rows(self.matrix(nbits), self.width)
+        if not name:
+            name = f"crc_shift_{hex(self.poly)}_W{self.width}_N{nbits}"
+        if not output:
+            output = f"{name}.sv"
+        verilog_code = ""
+        for i, row in enumerate(rows):
+            terms = [f"crc_in[{j}]" for j in range(self.width) if (row >> j) & 0x1]
+            verilog_code += f"assign crc_out[{i}] = " + (" ^ ".join(terms) if terms else "1'b0") + ";\n"
+        with open(output, 'w') as output_file:
+            output_file.write(Template(TEMPLATE).render(
+                poly=hex(self.poly),
+                width=self.width,
+                N=nbits,
+                name=name,
+                verilog_code=verilog_code))
+        return output
+
+TEMPLATE = u"""
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Generated by CrcModel.py
+// ------------------------------------------------------------------------------------------------
+// Polynomial: {{poly}}
+// CRC width: {{width}}
+// Shift {{N}} zero bits into the CRC register.
+// Combine: CRC(A + B) = crc_shift(crc_a ^ XOROUT ^ INIT) ^ crc_b where B is {{N}} bits.
+// ------------------------------------------------------------------------------------------------
+
+module {{name}}  (
+    input  logic [{{width}}-1:0]    crc_in,
+    output logic [{{width}}-1:0]    crc_out
+);
+
+{{verilog_code}}
+
+endmodule
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the CRC shift-by-N-zeros module")
+    parser.add_argument('-w', '--width',     type=int, default=32,           help="CRC width (default 32)")
+    parser.add_argument('-p', '--poly',      type=str, default='0x04c11db7', help="CRC polynomial (default 0x04c11db7)")
+    parser.add_argument('-s', '--shift',     type=int, default=64,           help="number of zero bits to shift (default 64)")
+    parser.add_argument('-n', '--name',      type=str,                       help="module name")
+    parser.add_argument('-o', '--output',    type=str,                       help="output file name")
+    args = parser.parse_args()
+
+    crc = CrcModel(args.width, int(args.poly, 16))
+    crc.verilog(args.shift, args.name, args.output)
+
+if __name__ == "__main__":
+    main()
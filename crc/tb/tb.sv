@@ -279,6 +279,40 @@ module tb();
         .crc(crc_32c)
     );
 
+    ////////////////////////////////////////
+    // Test for CRC32 combine (shift 64 bits)
+    ////////////////////////////////////////
+
+    logic [31:0]    crc_shift_in_32;
+    logic [31:0]    crc_shift_out_32;
+
+    crc_shift_0x4c11db7_W32_N64
+    u_crc_shift_32(
+        .crc_in(crc_shift_in_32),
+        .crc_out(crc_shift_out_32)
+    );
+
+    ////////////////////////////////////////////////////
+    // Test for CRC32 with 64 bit data and byte enable
+    ////////////////////////////////////////////////////
+
+    logic [63:0]    din_32be;
+    logic [7:0]     be_32be;
+    logic [31:0]    crc_in_32be;
+    logic [31:0]    crc_32be;
+
+    crc_gen_p_be #(
+        .DW(64),
+        .CW(32),
+        .POLY(32'h04c11db7)
+    )
+    u_crc32be(
+        .din(din_32be),
+        .be(be_32be),
+        .crc_in(crc_in_32be),
+        .crc_out(crc_32be)
+    );
+
     //`ifdef COCOTB_SIM
     //    initial begin
     //        $dumpfile("dump.vcd");
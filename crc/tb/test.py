@@ -14,7 +14,14 @@ from cocotb.triggers import Timer, RisingEdge, FallingEdge
 from cocotb.clock import Clock
 
 from crc import Calculator, Configuration
+from TraceRecorder import TraceRecorder
+from Scoreboard import Scoreboard
+from CrcModel import CrcModel
+from Coverage import Coverage
+from cocotb.utils import get_sim_time
+from dataclasses import asdict
 from random import randint
+import os
 
 ########################################
 # Test functions
@@ -22,6 +29,10 @@ from random import randint
 
 PRINT_INTO = False
 
+# Set TRACE=1 to always save the trace of each test. The trace is saved on failure anyway.
+# Set COVERAGE=<dir> to save the coverage of the crc_gen_p tests, merge the runs with Coverage.py merge.
+TRACE = int(os.environ.get("TRACE", 0))
+
 class Signals():
     """ Signal used for serial crc calculation """
     def __init__(self, din, req, ready, valid, crc):
@@ -31,12 +42,13 @@ class Signals():
         self.valid = valid
         self.crc = crc
 
-async def setup(dut, signals):
-    """ Setup the design """
+async def setup(dut, signals=()):
+    """ Setup the design: start the clock and reset, with the req/din of the serial crc cleared """
     cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
     dut.rst_b.value = 0
-    signals.req.value = 0
-    signals.din.value = 0
+    for s in signals:
+        s.req.value = 0
+        s.din.value = 0
     await Timer(20, units="ns")
     dut.rst_b.value = 1
 
@@ -53,30 +65,77 @@ async def crc_gen_s(dut, data, signals):
     await RisingEdge(signals.valid)
     return signals.crc.value.integer
 
-async def crc_gen_s_tester(dut, calc, signals, num_bytes, first=0, last=0xff, iters=100):
-    """ test the crc_gen_s module """
-    await setup(dut, signals)
-    for i in range(iters):
-        num = randint(first, last)
-        checksum = calc.checksum(num.to_bytes(num_bytes, byteorder='big'))
-        crc = await crc_gen_s(dut, num, signals)
-        await Timer(20, "ns")
-        if PRINT_INTO:
-            dut._log.info(f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
-        assert (crc == checksum), dut._log.error(f"ERROR: Got wrong CRC result. Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+def trace_model(inputs, meta):
+    """ Model used to check a recorded trace offline with TraceRecorder.py """
+    calc = Calculator(Configuration(**meta["cfg"]))
+    return {"crc": calc.checksum(inputs["din"].to_bytes(meta["num_bytes"], byteorder='big'))}
 
-async def crc_gen_p_tester(dut, calc, din, crc_out, num_bytes, first=0, last=0xff, iters=100):
-    """ test the crc_gen_p module """
-    for i in range(iters):
-        num = randint(first, last)
-        checksum = calc.checksum(num.to_bytes(num_bytes, byteorder='big'))
-        din.value = num
-        await Timer(20, "ns")
-        crc = crc_out.value.integer
-        if PRINT_INTO:
-            dut._log.info(f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
-        assert (crc == checksum), dut._log.error(f"ERROR: Got wrong CRC result. Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
-    pass
+def save_trace(dut, recorder):
+    if TRACE or recorder.failure is not None:
+        dut._log.info(f"Trace saved to {recorder.save()}")
+
+async def crc_gen_s_tester(dut, cfg, signals, num_bytes, first=0, last=0xff, iters=100, scoreboard=None, reset=True):
+    """
+    test the crc_gen_s module
+    @param scoreboard: check the results, default a fail fast scoreboard
+    @param reset: start the clock and reset the design first
+    """
+    calc = Calculator(cfg)
+    scoreboard = scoreboard or Scoreboard(signals.crc._name)
+    recorder = TraceRecorder(f"crc_gen_s_{signals.crc._name}", meta={"cfg": asdict(cfg), "num_bytes": num_bytes})
+    if reset:
+        await setup(dut, [signals])
+    try:
+        for i in range(iters):
+            num = randint(first, last)
+            checksum = calc.checksum(num.to_bytes(num_bytes, byteorder='big'))
+            crc = await crc_gen_s(dut, num, signals)
+            recorder.sample(in_din=num, out_crc=crc)
+            await Timer(20, "ns")
+            if PRINT_INTO:
+                dut._log.info(f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+            if crc != checksum:
+                recorder.fail(f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+            scoreboard.check(dut, crc, checksum, f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+    finally:
+        save_trace(dut, recorder)
+
+async def crc_gen_p_tester(dut, cfg, din, crc_out, num_bytes, first=0, last=0xff, iters=5000, scoreboard=None):
+    """
+    test the crc_gen_p module with random data until every byte lane has seen every value and every
+    crc bit has been 0 and 1
+    @param iters: max number of data
+    """
+    calc = Calculator(cfg)
+    scoreboard = scoreboard or Scoreboard(crc_out._name)
+    recorder = TraceRecorder(f"crc_gen_p_{crc_out._name}", meta={"cfg": asdict(cfg), "num_bytes": num_bytes})
+    cov = Coverage(f"crc_gen_p_{crc_out._name}")
+    cov.cross("lane_x_byte", cov.point("lane", num_bytes), cov.point("byte", 256))
+    cov.cross("crc_bit_x_value", cov.point("crc_bit", cfg.width), cov.point("value", 2))
+    count = 0
+    try:
+        while not cov.done and count < iters:
+            count += 1
+            num = randint(first, last)
+            checksum = calc.checksum(num.to_bytes(num_bytes, byteorder='big'))
+            din.value = num
+            await Timer(20, "ns")
+            crc = crc_out.value.integer
+            recorder.sample(in_din=num, out_crc=crc)
+            for lane in range(num_bytes):
+                cov.sample(lane=lane, byte=(num >> (8 * lane)) & 0xff)
+            for bit in range(cfg.width):
+                cov.sample(crc_bit=bit, value=(crc >> bit) & 1)
+            if PRINT_INTO:
+                dut._log.info(f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+            if crc != checksum:
+                recorder.fail(f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+            scoreboard.check(dut, crc, checksum, f"Data: {hex(num)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+    finally:
+        save_trace(dut, recorder)
+    dut._log.info(f"{count} data\n{cov.report(holes=8)}")
+    cov.save()
+    assert cov.done, dut._log.error(f"Coverage not closed after {iters} data")
 
 ########################################
 # Test 8 bit crc module
@@ -94,28 +153,24 @@ cfg8 = Configuration(
 @cocotb.test()
 async def test_crc_gen_s_8c_8d(dut):
     """ 8 bit serial crc with 8 bit data"""
-    calc = Calculator(cfg8)
     signals = Signals(dut.din_8, dut.req_8, dut.ready_8, dut.valid_8, dut.crc_8)
-    await crc_gen_s_tester(dut, calc, signals, 1, 0x0, 0x0)
+    await crc_gen_s_tester(dut, cfg8, signals, 1, 0x0, 0x0)
 
 @cocotb.test()
 async def test_crc_gen_s_8c_16d(dut):
     """ 8 bit serial crc with 16 bit data"""
-    calc = Calculator(cfg8)
     signals = Signals(dut.din_8a, dut.req_8a, dut.ready_8a, dut.valid_8a, dut.crc_8a)
-    await crc_gen_s_tester(dut, calc, signals, 2, 0x0000, 0xffff)
+    await crc_gen_s_tester(dut, cfg8, signals, 2, 0x0000, 0xffff)
 
 @cocotb.test()
 async def test_crc_gen_p_8c_8d(dut):
     """ 8 bit parallel crc with 8 bit data"""
-    calc = Calculator(cfg8)
-    await crc_gen_p_tester(dut, calc, dut.din_8p, dut.crc_8p, 1)
+    await crc_gen_p_tester(dut, cfg8, dut.din_8p, dut.crc_8p, 1)
 
 @cocotb.test()
 async def test_crc_gen_p_8c_16d(dut):
     """ 8 bit parallel crc with 16 bit data"""
-    calc = Calculator(cfg8)
-    await crc_gen_p_tester(dut, calc, dut.din_8pa, dut.crc_8pa, 2, 0x0000, 0xffff)
+    await crc_gen_p_tester(dut, cfg8, dut.din_8pa, dut.crc_8pa, 2, 0x0000, 0xffff)
 
 ########################################
 # Test 16 bit crc module
@@ -133,24 +188,21 @@ cfg16 = Configuration(
 @cocotb.test()
 async def test_crc_gen_16(dut):
     """ 16 bit crc with 16 bit data"""
-    calc = Calculator(cfg16)
     signals = Signals(dut.din_16, dut.req_16, dut.ready_16, dut.valid_16, dut.crc_16)
-    await crc_gen_s_tester(dut, calc, signals, 2, 0x0000, 0xffff)
+    await crc_gen_s_tester(dut, cfg16, signals, 2, 0x0000, 0xffff)
 
 
 @cocotb.test()
 async def test_crc_gen_16_8bit(dut):
     """ 16 bit crc with 8 bit data"""
-    calc = Calculator(cfg16)
     signals = Signals(dut.din_16a, dut.req_16a, dut.ready_16a, dut.valid_16a, dut.crc_16a)
-    await crc_gen_s_tester(dut, calc, signals, 1)
+    await crc_gen_s_tester(dut, cfg16, signals, 1)
 
 @cocotb.test()
 async def test_crc_gen_16_32bit(dut):
     """ 16 bit crc with 32 bit data"""
-    calc = Calculator(cfg16)
     signals = Signals(dut.din_16b, dut.req_16b, dut.ready_16b, dut.valid_16b, dut.crc_16b)
-    await crc_gen_s_tester(dut, calc, signals, 4, 0x00000000, 0xffffffff)
+    await crc_gen_s_tester(dut, cfg16, signals, 4, 0x00000000, 0xffffffff)
 
 ########################################
 # Test 32 bit crc module
@@ -168,27 +220,134 @@ cfg32 = Configuration(
 @cocotb.test()
 async def test_crc_gen_32(dut):
     """ 32 bit crc with 32 bit data"""
-    calc = Calculator(cfg32)
     signals = Signals(dut.din_32, dut.req_32, dut.ready_32, dut.valid_32, dut.crc_32)
-    await crc_gen_s_tester(dut, calc, signals, 4, 0x0, 0xffffffff)
+    await crc_gen_s_tester(dut, cfg32, signals, 4, 0x0, 0xffffffff)
 
 @cocotb.test()
 async def test_crc_gen_32_8bit(dut):
     """ 32 bit crc with 8 bit data"""
-    calc = Calculator(cfg32)
     signals = Signals(dut.din_32a, dut.req_32a, dut.ready_32a, dut.valid_32a, dut.crc_32a)
-    await crc_gen_s_tester(dut, calc, signals, 1, 0x0, 0xff)
+    await crc_gen_s_tester(dut, cfg32, signals, 1, 0x0, 0xff)
 
 @cocotb.test()
 async def test_crc_gen_32_16bit(dut):
     """ 32 bit crc with 16 bit data"""
-    calc = Calculator(cfg32)
-    signals = Signals(dut.din_32b, dut.req_32b, dut.ready_32a, dut.valid_32b, dut.crc_32b)
-    await crc_gen_s_tester(dut, calc, signals, 2, 0x0, 0xffff)
+    signals = Signals(dut.din_32b, dut.req_32b, dut.ready_32b, dut.valid_32b, dut.crc_32b)
+    await crc_gen_s_tester(dut, cfg32, signals, 2, 0x0, 0xffff)
 
 @cocotb.test()
 async def test_crc_gen_32_64bit(dut):
     """ 32 bit crc with 64 bit data"""
-    calc = Calculator(cfg32)
     signals = Signals(dut.din_32c, dut.req_32c, dut.ready_32c, dut.valid_32c, dut.crc_32c)
-    await crc_gen_s_tester(dut, calc, signals, 8, 0x0, 0xffffffff)
+    await crc_gen_s_tester(dut, cfg32, signals, 8, 0x0, 0xffffffff)
+
+async def crc_gen_p_be_tester(dut, cfg, din, be, crc_in, crc_out, num_bytes, max_len=100, iters=100, scoreboard=None):
+    """ test the crc_gen_p_be module with random packet length """
+    calc = Calculator(cfg)
+    scoreboard = scoreboard or Scoreboard(crc_out._name)
+    for i in range(iters):
+        packet = bytes(randint(0, 0xff) for _ in range(randint(1, max_len)))
+        checksum = calc.checksum(packet)
+        crc = cfg.init_value
+        for pos in range(0, len(packet), num_bytes):
+            beat = packet[pos:pos+num_bytes]
+            # first byte at the MSB, byte enable is continuous starting from the MSB
+            din.value = int.from_bytes(beat.ljust(num_bytes, b'\x00'), byteorder='big')
+            be.value = ((1 << len(beat)) - 1) << (num_bytes - len(beat))
+            crc_in.value = crc
+            await Timer(20, "ns")
+            crc = crc_out.value.integer
+        crc = crc ^ cfg.final_xor_value
+        if PRINT_INTO:
+            dut._log.info(f"Length: {len(packet)}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+        scoreboard.check(dut, crc, checksum, f"Data: {packet.hex()}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}")
+
+@cocotb.test()
+async def test_crc_gen_p_be_32_64bit(dut):
+    """ 32 bit parallel crc with 64 bit data and byte enable """
+    await crc_gen_p_be_tester(dut, cfg32, dut.din_32be, dut.be_32be, dut.crc_in_32be, dut.crc_32be, 8)
+
+########################################
+# Test crc combine
+########################################
+
+async def crc_combine_tester(dut, cfg, crc_in, crc_out, len_b, iters=100, scoreboard=None):
+    """ test the crc shift module: CRC(A + B) = crc_shift(crc_a ^ XOROUT ^ INIT) ^ crc_b """
+    calc = Calculator(cfg)
+    scoreboard = scoreboard or Scoreboard(crc_out._name)
+    model = CrcModel(cfg.width, cfg.polynomial, cfg.init_value, cfg.final_xor_value)
+    for i in range(iters):
+        seg_a = bytes(randint(0, 0xff) for _ in range(randint(0, 32)))
+        seg_b = bytes(randint(0, 0xff) for _ in range(len_b))
+        crc_a = calc.checksum(seg_a)
+        crc_b = calc.checksum(seg_b)
+        checksum = calc.checksum(seg_a + seg_b)
+        crc_in.value = crc_a ^ cfg.final_xor_value ^ cfg.init_value
+        await Timer(20, "ns")
+        crc = crc_out.value.integer ^ crc_b
+        msg = f"A: {seg_a.hex()}, B: {seg_b.hex()}, Expected CRC: {hex(checksum)}, Actual CRC: {hex(crc)}"
+        if PRINT_INTO:
+            dut._log.info(msg)
+        assert model.combine(crc_a, crc_b, len_b) == checksum, dut._log.error(f"ERROR: Wrong CRC model result. {msg}")
+        scoreboard.check(dut, crc, checksum, msg)
+
+@cocotb.test()
+async def test_crc_combine_32(dut):
+    """ 32 bit crc combine with 8 bytes second segment """
+    await crc_combine_tester(dut, cfg32, dut.crc_shift_in_32, dut.crc_shift_out_32, 8)
+
+########################################
+# Test all the instances concurrently
+########################################
+
+def workers(dut):
+    """ @return: {instance name: (serial crc signals or None, tester)}, tester(scoreboard) is a coroutine """
+    serial = {
+        "crc_8":  (Signals(dut.din_8, dut.req_8, dut.ready_8, dut.valid_8, dut.crc_8), cfg8, 1, 0x0, 0x0),
+        "crc_8a": (Signals(dut.din_8a, dut.req_8a, dut.ready_8a, dut.valid_8a, dut.crc_8a), cfg8, 2, 0x0, 0xffff),
+        "crc_16":  (Signals(dut.din_16, dut.req_16, dut.ready_16, dut.valid_16, dut.crc_16), cfg16, 2, 0x0, 0xffff),
+        "crc_16a": (Signals(dut.din_16a, dut.req_16a, dut.ready_16a, dut.valid_16a, dut.crc_16a), cfg16, 1, 0x0, 0xff),
+        "crc_16b": (Signals(dut.din_16b, dut.req_16b, dut.ready_16b, dut.valid_16b, dut.crc_16b), cfg16, 4, 0x0, 0xffffffff),
+        "crc_32":  (Signals(dut.din_32, dut.req_32, dut.ready_32, dut.valid_32, dut.crc_32), cfg32, 4, 0x0, 0xffffffff),
+        "crc_32a": (Signals(dut.din_32a, dut.req_32a, dut.ready_32a, dut.valid_32a, dut.crc_32a), cfg32, 1, 0x0, 0xff),
+        "crc_32b": (Signals(dut.din_32b, dut.req_32b, dut.ready_32b, dut.valid_32b, dut.crc_32b), cfg32, 2, 0x0, 0xffff),
+        "crc_32c": (Signals(dut.din_32c, dut.req_32c, dut.ready_32c, dut.valid_32c, dut.crc_32c), cfg32, 8, 0x0, 0xffffffff),
+    }
+    table = {name: (sig, lambda sb, sig=sig, cfg=cfg, n=n, first=first, last=last:
+                    crc_gen_s_tester(dut, cfg, sig, n, first, last, scoreboard=sb, reset=False))
+             for name, (sig, cfg, n, first, last) in serial.items()}
+    table["crc_8p"] = (None, lambda sb: crc_gen_p_tester(dut, cfg8, dut.din_8p, dut.crc_8p, 1, scoreboard=sb))
+    table["crc_8pa"] = (None, lambda sb: crc_gen_p_tester(dut, cfg8, dut.din_8pa, dut.crc_8pa, 2, 0x0000, 0xffff, scoreboard=sb))
+    table["crc_32be"] = (None, lambda sb: crc_gen_p_be_tester(dut, cfg32, dut.din_32be, dut.be_32be, dut.crc_in_32be,
+                                                              dut.crc_32be, 8, scoreboard=sb))
+    table["crc_shift_32"] = (None, lambda sb: crc_combine_tester(dut, cfg32, dut.crc_shift_in_32, dut.crc_shift_out_32, 8,
+                                                                 scoreboard=sb))
+    return table
+
+async def timed(dut, tester, scoreboard, finish):
+    """ run the tester and record the simulation time it takes """
+    start = get_sim_time("ns")
+    try:
+        await tester(scoreboard)
+    except AssertionError as e:
+        scoreboard.errors.append(f"aborted: {e}")
+    finish[scoreboard.name] = get_sim_time("ns") - start
+
+@cocotb.test()
+async def test_crc_all_concurrent(dut):
+    """ all the instances at the same time, sharing the clock and the reset, one scoreboard each """
+    table = workers(dut)
+    await setup(dut, [sig for sig, _ in table.values() if sig is not None])
+    start = get_sim_time("ns")
+    scoreboards = {name: Scoreboard(name, fail_fast=False) for name in table}
+    finish = {}
+    tasks = [cocotb.start_soon(timed(dut, tester, scoreboards[name], finish)) for name, (_, tester) in table.items()]
+    for task in tasks:
+        await task
+    total = get_sim_time("ns") - start
+    for name, scoreboard in scoreboards.items():
+        dut._log.info(f"{scoreboard.report()}, {finish[name]:.0f} ns")
+    dut._log.info(f"{len(table)} instances in {total:.0f} ns, slowest instance {max(finish.values()):.0f} ns, "
+                  f"sum of the instances {sum(finish.values()):.0f} ns")
+    failed = [sb.report() for sb in scoreboards.values() if sb.errors]
+    assert not failed, "\n".join(failed)
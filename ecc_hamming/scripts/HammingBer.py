@@ -0,0 +1,297 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Monte-Carlo bit error rate simulation of the Hamming/SECDED code
+numpy is required
+https://numpy.org/
+------------------------------------------------------------------------------------------------
+The code is the same as ecc_hamming_encoder.sv/ecc_hamming_decoder.sv with the same parameters
+D, C, DW and SECDED. A codeword is CW = DW + P bits, bit j (from 0) is the position j+1 of the
+hamming code. With SECDED the extra parity is sent as bit CW, so N = CW + 1 bits are sent.
+
+Each word is sent through a random channel and decoded. The result of each word is one of:
+
+    clean:      no bit is flipped
+    corrected:  bits are flipped, the data is correct and no double bit error is flagged
+    detected:   double bit error is flagged (error_double_bit)
+    silent:     the data is wrong and no double bit error is flagged (silent data corruption)
+
+Vectorized implementation:
+    - The words are numpy arrays: data is uint64 (DW <= 64), a codeword is (L,) uint64 (N <= 128)
+    - The encoder, the syndrome and the data extraction are linear, so each of them is a XOR of
+      one 256 entry lookup table per byte
+    - The decoder looks up the syndrome and the parity error in a table with the correction mask
+      and the error flags, same as the decoder rtl
+    - The words are simulated in chunks in a process pool, only the counts of each chunk are
+      returned and accumulated so the memory does not grow with the number of words
+
+Channels:
+    ber:    each bit is flipped independently with probability BER
+    burst:  with probability RATE a word gets a burst of LENGTH bits at a random position, the
+            first and the last bit of the burst are flipped, the bits between them are flipped
+            with probability 0.5
+------------------------------------------------------------------------------------------------
+Example:
+(72, 64) SECDED with BER 1e-3, 10M words
+    python3 HammingBer.py -d 120 -c 127 -w 64 --ber 1e-3 -n 10000000
+(7, 4) SECDED with 4 bit bursts in 1% of the words
+    python3 HammingBer.py --burst 4 --rate 0.01
+------------------------------------------------------------------------------------------------
+"""
+
+from multiprocessing import Pool
+import numpy as np
+import argparse
+import time
+
+OUTCOMES = ["clean", "corrected", "detected", "silent"]
+
+class HammingCode():
+
+    def __init__(self, D=4, C=7, DW=None, SECDED=1):
+        """
+        @param D, C, DW, SECDED: same as the encoder/decoder rtl parameters
+        """
+        self.D = D
+        self.C = C
+        self.DW = D if DW is None else DW
+        self.SECDED = SECDED
+        self.P = C - D
+        self.CW = self.DW + self.P
+        self.N = self.CW + (1 if SECDED else 0)
+        self.L = (self.N + 63) // 64
+        assert self.P >= 2 and self.C < (1 << self.P), "Not a hamming code"
+        assert self.DW <= min(D, 64), "DW must be <= D and <= 64"
+        assert self.N <= 128, "Codeword is too large"
+        # codeword bit of each data bit, same order as the rtl
+        self.data_pos = [j - 1 for j in range(1, self.C + 1) if j & (j - 1)][:self.DW]
+        # parity matrix: H[i, j] = 1 if codeword bit j is covered by parity i
+        self.H = np.array([[((j + 1) >> i) & 1 for j in range(self.CW)] for i in range(self.P)], dtype=np.uint8)
+        self._build_tables()
+
+    def _mask(self, bits):
+        """ (L,) uint64 array with the bits set """
+        mask = np.zeros(self.L, dtype=np.uint64)
+        for b in bits:
+            mask[b >> 6] |= np.uint64(1 << (b & 63))
+        return mask
+
+    def _codeword_bits(self, k):
+        """ codeword bits of data bit k """
+        pos = self.data_pos[k]
+        bits = [pos] + [(1 << i) - 1 for i in range(self.P) if self.H[i, pos]]
+        if self.SECDED and len(bits) % 2:
+            bits.append(self.CW)
+        return bits
+
+    def _build_tables(self):
+        """ byte lookup tables of the encoder, the syndrome and the data extraction """
+        bits = 1 << np.arange(8)
+        # encoder: data byte -> codeword
+        gen = np.array([self._mask(self._codeword_bits(k)) for k in range(self.DW)])
+        self.enc_lut = self._byte_lut(gen, bits, (self.DW + 7) // 8)
+        # syndrome: codeword byte -> {parity error, syndrome}
+        syn = [sum(int(self.H[i, j]) << i for i in range(self.P)) for j in range(self.CW)]
+        if self.SECDED:
+            syn = [s | (1 << self.P) for s in syn] + [1 << self.P]
+        self.syn_lut = self._byte_lut(np.array(syn, dtype=np.uint64), bits, (self.N + 7) // 8)
+        # data: codeword byte -> data
+        dat = np.zeros(self.N, dtype=np.uint64)
+        for k, pos in enumerate(self.data_pos):
+            dat[pos] = np.uint64(1 << k)
+        self.dat_lut = self._byte_lut(dat, bits, (self.N + 7) // 8)
+        # decoder: {parity error, syndrome} -> correction mask, single bit error, double bit error
+        size = 1 << (self.P + (1 if self.SECDED else 0))
+        self.fix = np.zeros((size, self.L), dtype=np.uint64)
+        self.single = np.zeros(size, dtype=bool)
+        self.double = np.zeros(size, dtype=bool)
+        for v in range(size):
+            s = v & ((1 << self.P) - 1)
+            parity_error = (v >> self.P) & 1 if self.SECDED else 1
+            self.single[v] = s != 0 and parity_error
+            self.double[v] = s != 0 and not parity_error
+            # correction_mask = (1 << syndrome) >> 1, the bits above CW are not sent
+            if self.single[v] and s <= self.CW:
+                self.fix[v] = self._mask([s - 1])
+
+    @staticmethod
+    def _byte_lut(rows, bits, nbytes):
+        """
+        table[b][v] = XOR of the rows of the bits set in v, for byte b
+        @param rows: one row (or value) for each bit
+        """
+        rows = np.concatenate([rows, np.zeros((nbytes * 8 - len(rows),) + rows.shape[1:], dtype=rows.dtype)])
+        lut = np.zeros((nbytes, 256) + rows.shape[1:], dtype=rows.dtype)
+        for b in range(nbytes):
+            for i in range(8):
+                sel = (np.arange(256) & bits[i]) != 0
+                lut[b, sel] ^= rows[b * 8 + i]
+        return lut
+
+    @staticmethod
+    def _lookup(lut, words):
+        """ XOR of lut[b][byte b of the words] """
+        data = np.ascontiguousarray(words).view(np.uint8).reshape(len(words), -1)
+        out = lut[0][data[:, 0]].copy()
+        for b in range(1, len(lut)):
+            out ^= lut[b][data[:, b]]
+        return out
+
+    def encode(self, data):
+        """
+        @param data: (n,) uint64 data
+        @return: (n, L) uint64 codewords, the extra parity is bit CW
+        """
+        return self._lookup(self.enc_lut, np.asarray(data, dtype=np.uint64))
+
+    def decode(self, codeword):
+        """
+        @param codeword: (n, L) uint64 received codewords
+        @return: data, error_single_bit, error_double_bit, syndrome
+        """
+        v = self._lookup(self.syn_lut, codeword).astype(np.int64)
+        corrected = codeword ^ self.fix[v]
+        data = self._lookup(self.dat_lut, corrected)
+        return data, self.single[v], self.double[v], v & ((1 << self.P) - 1)
+
+class BerChannel():
+
+    def __init__(self, ber):
+        self.ber = ber
+
+    def __str__(self):
+        return f"BER = {self.ber:g}"
+
+    def errors(self, rng, n, nbits):
+        """ @return: (n, nbits) bool array of the flipped bits, one row per word """
+        count = rng.binomial(nbits, self.ber, n)
+        flips = np.zeros((n, nbits), dtype=bool)
+        # only the words with errors need the positions
+        for k in np.unique(count[count > 0]):
+            rows = np.nonzero(count == k)[0]
+            pos = np.argpartition(rng.random((len(rows), nbits)), k - 1, axis=1)[:, :k]
+            flips[rows[:, None], pos] = True
+        return flips
+
+class BurstChannel():
+
+    def __init__(self, length, rate):
+        self.length = length
+        self.rate = rate
+
+    def __str__(self):
+        return f"{self.length} bit burst, rate = {self.rate:g}"
+
+    def errors(self, rng, n, nbits):
+        length = min(self.length, nbits)
+        flips = np.zeros((n, nbits), dtype=bool)
+        rows = np.nonzero(rng.random(n) < self.rate)[0]
+        burst = rng.integers(0, 2, (len(rows), length)).astype(bool)
+        burst[:, 0] = burst[:, -1] = True
+        start = rng.integers(0, nbits - length + 1, len(rows))
+        flips[rows[:, None], start[:, None] + np.arange(length)] = burst
+        return flips
+
+class BerResult():
+
+    def __init__(self, nbits):
+        """ counts[k, outcome]: number of words with k flipped bits and the outcome """
+        self.counts = np.zeros((nbits + 1, len(OUTCOMES)), dtype=np.int64)
+        self.seconds = 0.0
+
+    def add(self, counts, seconds=0.0):
+        self.counts += counts
+        self.seconds += seconds
+
+    @property
+    def words(self):
+        return int(self.counts.sum())
+
+    def rate(self, outcome):
+        return self.counts[:, OUTCOMES.index(outcome)].sum() / max(self.words, 1)
+
+    def report(self):
+        lines = [f"{self.words} words"]
+        for outcome in OUTCOMES:
+            n = int(self.counts[:, OUTCOMES.index(outcome)].sum())
+            lines.append(f"    {outcome:<10} {n:>12}  rate = {self.rate(outcome):.3e}")
+        lines.append("    flipped bits: " + ", ".join(
+            f"{k}: {'/'.join(str(c) for c in self.counts[k, 1:])}"
+            for k in range(1, len(self.counts)) if self.counts[k].any()) + "  (corrected/detected/silent)")
+        return "\n".join(lines)
+
+def flips_to_mask(flips, L):
+    """ (n, nbits) bool -> (n, L) uint64 """
+    packed = np.packbits(flips, axis=1, bitorder="little")
+    packed = np.pad(packed, ((0, 0), (0, L * 8 - packed.shape[1])))
+    return packed.view(np.uint64)
+
+def simulate(code, channel, n, rng):
+    """
+    send n random words through the channel
+    @return: counts[k, outcome], same as BerResult.counts
+    """
+    data = rng.integers(0, 1 << code.DW, n, dtype=np.uint64)
+    flips = channel.errors(rng, n, code.N)
+    received = code.encode(data) ^ flips_to_mask(flips, code.L)
+    dout, _, double, _ = code.decode(received)
+    k = flips.sum(axis=1)
+    outcome = np.where(k == 0, 0, np.where(double, 2, np.where(dout == data, 1, 3)))
+    counts = np.zeros((code.N + 1, len(OUTCOMES)), dtype=np.int64)
+    np.add.at(counts, (k, outcome), 1)
+    return counts
+
+def _simulate_chunk(job):
+    code, channel, n, seed = job
+    start = time.time()
+    counts = simulate(code, channel, n, np.random.default_rng(seed))
+    return counts, time.time() - start
+
+def run(code, channel, words, chunk=1 << 18, processes=None, seed=None):
+    """
+    simulate the words in chunks, in a process pool if processes != 1
+    @return: BerResult
+    """
+    sizes = [chunk] * (words // chunk) + ([words % chunk] if words % chunk else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = ((code, channel, n, s) for n, s in zip(sizes, seeds))
+    result = BerResult(code.N)
+    if processes == 1:
+        for counts, seconds in map(_simulate_chunk, jobs):
+            result.add(counts, seconds)
+    else:
+        with Pool(processes) as pool:
+            for counts, seconds in pool.imap_unordered(_simulate_chunk, jobs):
+                result.add(counts, seconds)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte-Carlo BER simulation of the Hamming code")
+    parser.add_argument('-d', '--data',      type=int, default=4,    help="number of data bits D (default 4)")
+    parser.add_argument('-c', '--codeword',  type=int, default=7,    help="number of codeword bits C (default 7)")
+    parser.add_argument('-w', '--datawidth', type=int, default=None, help="data bits used DW (default D)")
+    parser.add_argument('--no-secded',       action='store_true',    help="no extra parity")
+    parser.add_argument('--ber',             type=float, default=1e-3, help="bit error rate (default 1e-3)")
+    parser.add_argument('--burst',           type=int, default=0,    help="burst length, use the burst channel")
+    parser.add_argument('--rate',            type=float, default=1e-2, help="burst rate per word (default 1e-2)")
+    parser.add_argument('-n', '--words',     type=int, default=1000000, help="number of words (default 1000000)")
+    parser.add_argument('--chunk',           type=int, default=1 << 18, help="words per chunk (default 262144)")
+    parser.add_argument('-j', '--jobs',      type=int, default=None, help="number of processes (default cpu count)")
+    parser.add_argument('-s', '--seed',      type=int, default=None, help="random seed")
+    args = parser.parse_args()
+    code = HammingCode(args.data, args.codeword, args.datawidth, 0 if args.no_secded else 1)
+    channel = BurstChannel(args.burst, args.rate) if args.burst else BerChannel(args.ber)
+    start = time.time()
+    result = run(code, channel, args.words, args.chunk, args.jobs, args.seed)
+    wall = time.time() - start
+    print(f"({code.N}, {code.DW}) {'SECDED' if code.SECDED else 'SEC'} hamming code, {channel}")
+    print(result.report())
+    print(f"{result.words / wall:.0f} words/s, {result.words / max(result.seconds, 1e-9):.0f} words/s per process")
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,9 @@ from cocotb.triggers import Timer, RisingEdge, FallingEdge
 from cocotb.clock import Clock
 
 from random import randint
+from itertools import combinations
+from HammingBer import HammingCode
+import numpy as np
 
 async def encoder(dut, data):
     dut.din.value = data
@@ -118,3 +121,25 @@ async def test_hamming_decoder_2b_error(dut):
                     if j != k:
                         await decoder(dut, i, True, j, True, k)
         await Timer(20, "ns")
+
+@cocotb.test()
+async def test_hamming_model(dut):
+    """ the BER model should match the rtl for all the data and all the 0, 1 and 2 bit errors """
+    code = HammingCode(4, 7)
+    flips = [()] + [(i,) for i in range(code.N)] + list(combinations(range(code.N), 2))
+    for data in range(1 << code.DW):
+        cw = int(code.encode(np.array([data], dtype=np.uint64))[0, 0])
+        dut.din.value = data
+        await Timer(10, "ns")
+        assert dut.codeword.value.integer == cw & 0x7f, "ERROR: codeword does not match the model"
+        assert dut.extra_parity.value.integer == cw >> 7, "ERROR: extra parity does not match the model"
+        for flip in flips:
+            received = cw ^ sum(1 << i for i in flip)
+            dout, single, double, syndrome = code.decode(np.array([[received]], dtype=np.uint64))
+            dut.dec_codeword.value = received & 0x7f
+            dut.dec_extra_parity.value = received >> 7
+            await Timer(10, "ns")
+            assert dut.dec_dout.value.integer == int(dout[0]), f"ERROR: data does not match the model, flip {flip}"
+            assert dut.dec_error_single_bit.value.integer == int(single[0]), f"ERROR: single bit error does not match, flip {flip}"
+            assert dut.dec_error_double_bit.value.integer == int(double[0]), f"ERROR: double bit error does not match, flip {flip}"
+            assert dut.syndrome.value.integer == int(syndrome[0]), f"ERROR: syndrome does not match the model, flip {flip}"
@@ -0,0 +1,95 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Parallel Galois LFSR with the XOR matrix calculated at elaboration
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+Same equations as the modules generated by ParallelLFSR.py (Galois LFSR shifting towards MSB),
+without the generation step: the XOR matrix of STEPS shifts is calculated by constant functions
+at elaboration, for any WIDTH/POLY/D_WIDTH.
+
+Each output bit is an XOR of LFSR input bits and data bits:
+
+    lfsr_out[i] = ^(lfsr_in & LFSR_MATRIX[i]) ^ ^(data & DATA_MATRIX[i])
+
+The matrix rows are kept in a flat vector, row i is at [i*WIDTH +: WIDTH] (or [i*DW +: DW]).
+The constant functions follow the shift of ParallelLFSR.py: on each step bit i gets bit i-1, xor-ed
+with the MSB if POLY[i] is set, and bit 0 gets the MSB xor-ed with the next data bit. The data MSB
+is shifted in first.
+
+D_WIDTH = 0 means no input data (the data port is one bit and not used), same as D0 in the name of
+the generated modules, STEPS is then the number of shifts.
+*/
+
+module lfsr_galois_p_matrix #(
+    parameter WIDTH = 16,                               // Width of the LFSR
+    parameter POLY = 16'h6801,                          // Feedback polynomial, x^WIDTH is omitted
+    parameter D_WIDTH = 16,                             // Data width, 0 means no input data
+    parameter STEPS = (D_WIDTH > 0) ? D_WIDTH : WIDTH   // Number of shifts, must be D_WIDTH with data
+) (
+    input  logic [WIDTH-1:0]                        lfsr_in,    // lfsr initial value
+    input  logic [(D_WIDTH > 0 ? D_WIDTH : 1)-1:0]  data,       // data input, MSB is calculated first
+    output logic [WIDTH-1:0]                        lfsr_out    // lfsr output
+);
+
+    localparam DW = (D_WIDTH > 0) ? D_WIDTH : 1;
+
+    // lfsr bits of each output bit after n shifts
+    function automatic [WIDTH*WIDTH-1:0] lfsr_matrix;
+        input integer n;
+        reg [WIDTH*WIDTH-1:0]   m;
+        reg [WIDTH-1:0]         poly;
+        reg [WIDTH-1:0]         msb;
+        integer s, i;
+        begin
+            poly = POLY;
+            m = {WIDTH*WIDTH{1'b0}};
+            for (i = 0; i < WIDTH; i = i + 1)
+                m[i*WIDTH+i] = 1'b1;
+            for (s = 0; s < n; s = s + 1) begin
+                msb = m[(WIDTH-1)*WIDTH +: WIDTH];
+                for (i = WIDTH - 1; i > 0; i = i - 1)
+                    m[i*WIDTH +: WIDTH] = m[(i-1)*WIDTH +: WIDTH] ^ (poly[i] ? msb : {WIDTH{1'b0}});
+                m[0 +: WIDTH] = msb;
+            end
+            lfsr_matrix = m;
+        end
+    endfunction
+
+    // data bits of each output bit after n shifts
+    function automatic [WIDTH*DW-1:0] data_matrix;
+        input integer n;
+        reg [WIDTH*DW-1:0]      m;
+        reg [WIDTH-1:0]         poly;
+        reg [DW-1:0]            msb;
+        integer s, i;
+        begin
+            poly = POLY;
+            m = {WIDTH*DW{1'b0}};
+            for (s = 0; s < n; s = s + 1) begin
+                msb = m[(WIDTH-1)*DW +: DW];
+                for (i = WIDTH - 1; i > 0; i = i - 1)
+                    m[i*DW +: DW] = m[(i-1)*DW +: DW] ^ (poly[i] ? msb : {DW{1'b0}});
+                m[0 +: DW] = msb;
+                if (D_WIDTH > 0)
+                    m[D_WIDTH-1-s] = ~m[D_WIDTH-1-s];
+            end
+            data_matrix = m;
+        end
+    endfunction
+
+    localparam [WIDTH*WIDTH-1:0]    LFSR_MATRIX = lfsr_matrix(STEPS);
+    localparam [WIDTH*DW-1:0]       DATA_MATRIX = data_matrix(STEPS);
+
+    genvar i;
+    generate
+        for (i = 0; i < WIDTH; i = i + 1) begin: xor_row
+            assign lfsr_out[i] = ^(lfsr_in & LFSR_MATRIX[i*WIDTH +: WIDTH]) ^ ^(data & DATA_MATRIX[i*DW +: DW]);
+        end
+    endgenerate
+
+endmodule
@@ -0,0 +1,176 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Multi-lane PRBS checker
+// Self-synchronizing PRBS checker with lock detection and error/bit counters
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Prediction                 *
+------------------------------
+The PRBS sequence follows the recurrence of the polynomial (see prbs_gen.sv):
+
+    b[t+WIDTH] = XOR of b[t+i] for every i where POLY[i] = 1
+
+So the next bit can be predicted from the previous WIDTH bits. The checker keeps the previous
+WIDTH bits in the history register (hist[WIDTH-1] is the newest bit) and predicts N bits per cycle.
+The first received bit is at the MSB of the lane, same as prbs_gen.
+
+    seq[WIDTH-1:0] = hist
+    seq[WIDTH+i]   = i-th bit of this cycle
+    expected[i]    = ^(seq[i +: WIDTH] & POLY)
+    hist          <= seq[N +: WIDTH]
+
+------------------------------
+* Lock                       *
+------------------------------
+Unlocked: seq is built from the received bits (self-synchronizing). Once LOCK_CNT cycles in a row
+          are received without error, the checker is locked.
+
+Locked:   seq is built from the expected bits, so the checker runs as a local PRBS generator and
+          an error in the received data is counted only once (in the self-synchronizing mode, one
+          error bit would corrupt the prediction of the following bits).
+          Errors are accumulated in a window of WINDOW cycles. If there are more than ERR_THRESH
+          errors in a window, the lock is lost and the checker re-synchronize to the received data.
+
+------------------------------
+* Counters                   *
+------------------------------
+err_cnt and bit_cnt count the error bits and the received bits while locked.
+BER = err_cnt / bit_cnt. Both counters are cleared by clear.
+*/
+
+module prbs_chk #(
+    parameter WIDTH = 31,                   // Width of the LFSR (PRBS order)
+    parameter POLY = 31'h00000009,          // Feedback polynomial. Default PRBS31
+    parameter N = 32,                       // Number of bits checked per cycle per lane
+    parameter LANES = 1,                    // Number of lanes
+    parameter LOCK_CNT = 16,                // Number of clean cycles to get lock
+    parameter WINDOW = 256,                 // Error window size in cycles
+    parameter ERR_THRESH = 64,              // Lose lock if there are more errors in a window
+    parameter CNT_W = 48                    // Width of the error/bit counters
+) (
+    input  logic                    clk,
+    input  logic                    rst_b,
+    input  logic                    clear,      // clear the error and bit counters
+    input  logic                    din_vld,    // din is valid
+    input  logic [LANES*N-1:0]      din,        // received data, lane l is din[l*N+N-1:l*N]
+    output logic [LANES-1:0]        lock,       // checker is locked to the PRBS sequence
+    output logic [LANES-1:0]        err,        // error detected in this cycle (while locked)
+    output logic [LANES*CNT_W-1:0]  err_cnt,    // number of error bits while locked
+    output logic [LANES*CNT_W-1:0]  bit_cnt     // number of bits received while locked
+);
+
+    localparam ERR_W = $clog2(N+1);
+    localparam WIN_W = $clog2(WINDOW+1);
+    localparam WIN_ERR_W = $clog2(N*WINDOW+1);
+    localparam LOCK_W = $clog2(LOCK_CNT+1);
+
+    genvar l, i;
+    generate
+        for (l = 0; l < LANES; l = l + 1) begin: lane
+
+            logic [WIDTH-1:0]       hist;
+            logic [WIDTH+N-1:0]     seq_r;      // sequence using received bits
+            logic [WIDTH+N-1:0]     seq_l;      // sequence using expected bits
+            logic [N-1:0]           exp_r;
+            logic [N-1:0]           exp_l;
+            logic [N-1:0]           err_bits;
+            logic [ERR_W-1:0]       err_num;
+
+            logic                   lock_q;
+            logic [LOCK_W-1:0]      good_cnt;
+            logic [WIN_W-1:0]       win_cnt;
+            logic [WIN_ERR_W-1:0]   win_err;
+            logic [WIN_ERR_W-1:0]   win_err_next;
+            logic [CNT_W-1:0]       err_cnt_q;
+            logic [CNT_W-1:0]       bit_cnt_q;
+
+            assign seq_r[WIDTH-1:0] = hist;
+            assign seq_l[WIDTH-1:0] = hist;
+
+            for (i = 0; i < N; i = i + 1) begin: predict
+                assign seq_r[WIDTH+i] = din[l*N+N-1-i];
+                assign exp_r[i] = ^(seq_r[i+WIDTH-1:i] & POLY);
+                assign exp_l[i] = ^(seq_l[i+WIDTH-1:i] & POLY);
+                assign seq_l[WIDTH+i] = exp_l[i];
+                assign err_bits[i] = seq_r[WIDTH+i] ^ (lock_q ? exp_l[i] : exp_r[i]);
+            end
+
+            // count the number of error bits
+            always @(*) begin
+                err_num = 0;
+                for (int j = 0; j < N; j = j + 1) begin
+                    err_num = err_num + err_bits[j];
+                end
+            end
+
+            assign win_err_next = win_err + err_num;
+
+            // lock state machine
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    hist <= 0;
+                    lock_q <= 0;
+                    good_cnt <= 0;
+                    win_cnt <= 0;
+                    win_err <= 0;
+                end
+                else if (din_vld) begin
+                    hist <= lock_q ? seq_l[N+WIDTH-1:N] : seq_r[N+WIDTH-1:N];
+                    if (!lock_q) begin
+                        good_cnt <= (err_num == 0) ? good_cnt + 1'b1 : 0;
+                        if (err_num == 0 && good_cnt == LOCK_CNT - 1) begin
+                            lock_q <= 1;
+                            good_cnt <= 0;
+                        end
+                        win_cnt <= 0;
+                        win_err <= 0;
+                    end
+                    else begin
+                        if (win_err_next > ERR_THRESH) begin
+                            lock_q <= 0;
+                            win_cnt <= 0;
+                            win_err <= 0;
+                        end
+                        else if (win_cnt == WINDOW - 1) begin
+                            win_cnt <= 0;
+                            win_err <= 0;
+                        end
+                        else begin
+                            win_cnt <= win_cnt + 1'b1;
+                            win_err <= win_err_next;
+                        end
+                    end
+                end
+            end
+
+            // error and bit counters
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    err_cnt_q <= 0;
+                    bit_cnt_q <= 0;
+                end
+                else if (clear) begin
+                    err_cnt_q <= 0;
+                    bit_cnt_q <= 0;
+                end
+                else if (din_vld && lock_q) begin
+                    err_cnt_q <= err_cnt_q + err_num;
+                    bit_cnt_q <= bit_cnt_q + N;
+                end
+            end
+
+            assign lock[l] = lock_q;
+            assign err[l] = din_vld & lock_q & (err_num != 0);
+            assign err_cnt[l*CNT_W+CNT_W-1:l*CNT_W] = err_cnt_q;
+            assign bit_cnt[l*CNT_W+CNT_W-1:l*CNT_W] = bit_cnt_q;
+
+        end
+    endgenerate
+
+endmodule
@@ -0,0 +1,102 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Multi-lane PRBS generator
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* PRBS generation            *
+------------------------------
+Each lane has a Galois LFSR shifting towards MSB (same as lfsr_galois_s with din = 0).
+The PRBS bit is the MSB of the LFSR before each shift.
+
+To generate N bits per cycle, the LFSR is unrolled N times (same as lfsr_galois_p):
+
+    state[0] = lfsr
+    state[i] = next_lfsr(state[i-1])
+    prbs bit i = state[i-1][WIDTH-1]
+    lfsr <= state[N]
+
+The first bit generated is at the MSB of the lane.
+
+------------------------------
+* PRBS polynomials           *
+------------------------------
+The output sequence of the Galois LFSR follows the recurrence of POLY (x^WIDTH is omitted):
+
+    b[t+WIDTH] = XOR of b[t+i] for every i where POLY[i] = 1
+
+ITU-T O.150 specifies the PRBS with the shift register feedback polynomial, whose recurrence is
+the reciprocal polynomial. So to generate the standard sequences POLY is set as below:
+
+Name    O.150 polynomial    WIDTH   POLY
+PRBS7   x^7  + x^6  + 1     7       7'h03        (x^7  + x   + 1)
+PRBS9   x^9  + x^5  + 1     9       9'h011       (x^9  + x^4 + 1)
+PRBS15  x^15 + x^14 + 1     15      15'h0003     (x^15 + x   + 1)
+PRBS23  x^23 + x^18 + 1     23      23'h000021   (x^23 + x^5 + 1)
+PRBS31  x^31 + x^28 + 1     31      31'h00000009 (x^31 + x^3 + 1)
+
+O.150 also inverts the PRBS15/23/31 output, this can be done outside of this module.
+
+------------------------------
+* Multi-lane                 *
+------------------------------
+Lane l is seeded with SEED ^ l so each lane sends a different phase of the sequence.
+*/
+
+module prbs_gen #(
+    parameter WIDTH = 31,                   // Width of the LFSR (PRBS order)
+    parameter POLY = 31'h00000009,          // Feedback polynomial. Default PRBS31
+    parameter N = 32,                       // Number of bits generated per cycle per lane
+    parameter LANES = 1,                    // Number of lanes
+    parameter [WIDTH-1:0] SEED = {WIDTH{1'b1}}  // Initial seed for the LFSR
+) (
+    input  logic                clk,
+    input  logic                rst_b,
+    input  logic                en,         // generate the next N bits
+    output logic [LANES*N-1:0]  prbs        // prbs output, lane l is prbs[l*N+N-1:l*N]
+);
+
+    genvar l, i;
+    generate
+        for (l = 0; l < LANES; l = l + 1) begin: lane
+
+            logic [WIDTH-1:0] lfsr;
+            // Big array to capture the LFSR value for each iteration
+            logic [WIDTH-1:0] state[N:0];
+
+            assign state[0] = lfsr;
+            for (i = 1; i <= N; i = i + 1) begin: unroll
+                assign state[i] = next_lfsr(state[i-1]);
+                assign prbs[l*N+N-i] = state[i-1][WIDTH-1];
+            end
+
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    lfsr <= SEED ^ l;
+                end
+                else if (en) begin
+                    lfsr <= state[N];
+                end
+            end
+
+        end
+    endgenerate
+
+    // Function used to calculte the next lfsr value.
+    // Same algorithm used in lfsr_galois_s with din = 0
+    function automatic [WIDTH-1:0] next_lfsr;
+        input [WIDTH-1:0] lfsr_input;
+        if (lfsr_input[WIDTH-1]) begin
+            next_lfsr = {lfsr_input[WIDTH-2:0], 1'b0} ^ POLY;
+        end
+        else begin
+            next_lfsr = {lfsr_input[WIDTH-2:0], 1'b0};
+        end
+    endfunction
+
+endmodule
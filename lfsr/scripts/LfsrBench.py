@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Benchmark of ParallelLFSR used as a library
+------------------------------------------------------------------------------------------------
+startup:    time of a new python process importing ParallelLFSR, minus an empty python process,
+            and whether jinja2 has been imported (it should only be imported when rendering)
+matrix:     ParallelLFSR(...).matrix(n), the equations as integer masks
+render:     ParallelLFSR(...).render(n), the verilog as a string
+verilog:    ParallelLFSR(...).verilog(n, output=StringIO), the verilog into a file-like object
+------------------------------------------------------------------------------------------------
+Example:
+    python3 LfsrBench.py
+    python3 LfsrBench.py -r 20 -c 32:0x04c11db7:32 -c 64:0x42f0e1eba9ea3693:64
+------------------------------------------------------------------------------------------------
+"""
+
+from ParallelLFSR import ParallelLFSR
+import subprocess
+import argparse
+import timeit
+import sys
+import io
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# width:poly:data width[:steps]
+CONFIGS = ["16:0x6801:0:16", "32:0x04c11db7:32", "32:0x04c11db7:128", "64:0x42f0e1eba9ea3693:64"]
+
+def startup(repeat):
+    """ @return: best import time in seconds, jinja2 imported """
+    def run(code):
+        best = None
+        out = ""
+        for _ in range(repeat):
+            start = timeit.default_timer()
+            out = subprocess.run([sys.executable, "-c", code], cwd=SCRIPT_DIR, check=True,
+                                 stdout=subprocess.PIPE, text=True).stdout
+            wall = timeit.default_timer() - start
+            best = wall if best is None else min(best, wall)
+        return best, out
+    empty, _ = run("pass")
+    wall, out = run("import sys, ParallelLFSR; print('jinja2' in sys.modules)")
+    return wall - empty, out.strip() == "True"
+
+def per_call(func, repeat):
+    """ @return: best time per call in seconds """
+    number, _ = timeit.Timer(func).autorange()
+    return min(timeit.Timer(func).repeat(repeat, number)) / number
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ParallelLFSR startup and per-call time")
+    parser.add_argument('-c', '--config', type=str, action='append', default=None,
+                        help="width:poly:datawidth[:steps], can be repeated (default: some CRC and LFSR)")
+    parser.add_argument('-r', '--repeat', type=int, default=5, help="number of repeats, the best is reported (default 5)")
+    args = parser.parse_args()
+
+    wall, jinja = startup(args.repeat)
+    print(f"startup: {wall * 1e3:.1f} ms, jinja2 imported: {jinja}")
+    print()
+    print(f"{'width':>6}{'poly':>20}{'data':>6}{'steps':>6}{'matrix us':>12}{'render us':>12}{'verilog us':>12}{'calls/s':>10}")
+    for config in args.config or CONFIGS:
+        fields = config.split(":")
+        width, poly, datawidth = int(fields[0]), int(fields[1], 16), int(fields[2])
+        steps = int(fields[3]) if len(fields) > 3 else (datawidth or width)
+        if datawidth and steps > datawidth:
+            parser.error(f"{config}: {steps} steps exceed the data width {datawidth}")
+        matrix = per_call(lambda: ParallelLFSR(width, poly, "MSB", datawidth).matrix(steps), args.repeat)
+        render = per_call(lambda: ParallelLFSR(width, poly, "MSB", datawidth).render(steps), args.repeat)
+        verilog = per_call(lambda: ParallelLFSR(width, poly, "MSB", datawidth).verilog(steps, output=io.StringIO()), args.repeat)
+        print(f"{width:>6}{hex(poly):>20}{datawidth:>6}{steps:>6}{matrix * 1e6:>12.1f}{render * 1e6:>12.1f}"
+              f"{verilog * 1e6:>12.1f}{1 / verilog:>10.0f}")
+
+if __name__ == "__main__":
+    main()
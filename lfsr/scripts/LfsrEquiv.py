@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Prove lfsr_galois_p_matrix.sv equivalent to the modules generated by ParallelLFSR.py
+yosys is required: https://github.com/YosysHQ/yosys
+------------------------------------------------------------------------------------------------
+For each polynomial the generated module is the gold design and lfsr_galois_p_matrix with the
+same WIDTH/POLY/D_WIDTH/STEPS (in a wrapper with the same ports) is the gate design.
+
+A SAT proof over all the inputs of a miter of two XOR networks does not finish for wide LFSR, so
+the proof uses linearity instead:
+
+1. After elaboration and const folding, both designs only have XOR/XNOR/NOT cells, so both are
+   affine functions over GF(2): f(x) = A*x ^ c.
+2. Two affine functions are equal if they are equal for x = 0 and for each unit vector x = e_i.
+   yosys builds a miter of the two designs and checks it is not triggered for these
+   1 + WIDTH + D_WIDTH input values.
+
+The polynomials are the fixed ones below and --polys random polynomials for each width and data
+width. Any polynomial (with x^0) works since the equations do not depend on the period.
+
+The elaboration time (read, hierarchy, proc) of both designs is measured in separate yosys runs,
+for the generated module the generation time with ParallelLFSR is added.
+------------------------------------------------------------------------------------------------
+Example:
+    python3 LfsrEquiv.py
+    python3 LfsrEquiv.py -w 8 16 32 64 -d 0 8 32 -n 4 --yosys yowasp-yosys
+------------------------------------------------------------------------------------------------
+"""
+
+from multiprocessing import Pool
+from ParallelLFSR import ParallelLFSR
+import subprocess
+import argparse
+import tempfile
+import random
+import time
+import os
+import sys
+
+RTL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "rtl", "lfsr_galois_p_matrix.sv")
+
+# (width, poly, data width, steps)
+FIXED = [
+    (16, 0x6801, 0, 16),            # lfsr_0x6801_W16_D0.sv
+    (32, 0x04c11db7, 32, 32),       # CRC-32, 32 bit data
+    (32, 0x04c11db7, 8, 8),         # CRC-32, 8 bit data
+    (31, 0x00000009, 0, 64),        # PRBS31, 64 bits per cycle
+    (7, 0x03, 0, 8),                # PRBS7, 8 bits per cycle
+]
+
+GATE = u"""
+module gate (
+    input  logic [{width}-1:0]    lfsr_in,
+    {data_port}
+    output logic [{width}-1:0]    lfsr_out
+);
+    lfsr_galois_p_matrix #(.WIDTH({width}), .POLY({width}'h{poly:x}), .D_WIDTH({datawidth}), .STEPS({steps}))
+    u_lfsr (.lfsr_in(lfsr_in), .data({data}), .lfsr_out(lfsr_out));
+endmodule
+"""
+
+def gate(width, poly, datawidth, steps):
+    """ lfsr_galois_p_matrix in a wrapper with the same ports as the generated module """
+    data_port = f"input  logic [{datawidth}-1:0]    data," if datawidth else ""
+    return GATE.format(width=width, poly=poly, datawidth=datawidth, steps=steps,
+                       data_port=data_port, data="data" if datawidth else "1'b0")
+
+def yosys_run(yosys, script, cwd):
+    """ @return: wall time, error message or None """
+    start = time.time()
+    proc = subprocess.run(yosys + ["-q", "-p", script], cwd=cwd, capture_output=True, text=True)
+    wall = time.time() - start
+    return wall, (proc.stdout + proc.stderr).strip()[-2000:] if proc.returncode else None
+
+def unit(width, i):
+    """ sized binary constant with bit i set, i = None for zero """
+    value = 0 if i is None else 1 << i
+    return f"{width}'b{value:0{width}b}"
+
+def proof(width, datawidth):
+    """ yosys commands of the proof """
+    script = [
+        f"read -sv {RTL} gate.sv gold.sv",
+        "hierarchy -check",
+        "proc",
+        "opt -full",
+        # only XOR/XNOR/NOT cells (and the lfsr_galois_p_matrix instance in the wrapper)
+        "select -assert-none t:$* t:$paramod* t:$xor t:$reduce_xor t:$xnor t:$reduce_xnor t:$not %u %u %u %u %u %d",
+        "miter -equiv -flatten gold gate miter",
+        "hierarchy -top miter",
+    ]
+    inputs = [("in_lfsr_in", width, i) for i in range(width)]
+    inputs += [("in_data", datawidth, i) for i in range(datawidth)]
+    for port, _, i in [(None, 0, None)] + inputs:
+        sets = [f"-set in_lfsr_in {unit(width, i if port == 'in_lfsr_in' else None)}"]
+        if datawidth:
+            sets.append(f"-set in_data {unit(datawidth, i if port == 'in_data' else None)}")
+        script.append(f"sat -verify -prove trigger 0 {' '.join(sets)} miter")
+    return "; ".join(script)
+
+def check(job):
+    """ worker: prove one configuration, measure the elaboration time """
+    width, poly, datawidth, steps, yosys = job
+    result = {"width": width, "poly": poly, "datawidth": datawidth, "steps": steps}
+    with tempfile.TemporaryDirectory() as cwd:
+        start = time.time()
+        gold = ParallelLFSR(width, poly, "MSB", datawidth).render(steps, "gold")
+        generate = time.time() - start
+        with open(os.path.join(cwd, "gold.sv"), "w") as f:
+            f.write(gold)
+        with open(os.path.join(cwd, "gate.sv"), "w") as f:
+            f.write(gate(width, poly, datawidth, steps))
+        result["elab_gen"], _ = yosys_run(yosys, "read -sv gold.sv; hierarchy -top gold; proc", cwd)
+        result["elab_gen"] += generate
+        result["elab_matrix"], _ = yosys_run(yosys, f"read -sv {RTL} gate.sv; hierarchy -top gate; proc", cwd)
+        _, result["error"] = yosys_run(yosys, proof(width, datawidth), cwd)
+    return result
+
+def jobs(widths, datawidths, polys, rng):
+    for width in widths:
+        for datawidth in datawidths:
+            for _ in range(polys):
+                yield width, rng.getrandbits(width) | 0x1, datawidth, datawidth or width
+
+def main():
+    parser = argparse.ArgumentParser(description="Prove lfsr_galois_p_matrix equivalent to the ParallelLFSR output")
+    parser.add_argument('-w', '--widths',     type=int, nargs='+', default=[4, 8, 16, 24, 32], help="LFSR widths of the random polynomials")
+    parser.add_argument('-d', '--datawidths', type=int, nargs='+', default=[0, 8, 32],         help="data widths of the random polynomials, 0 means no data")
+    parser.add_argument('-n', '--polys',      type=int, default=2,    help="random polynomials per width and data width (default 2)")
+    parser.add_argument('-s', '--seed',       type=int, default=None, help="random seed")
+    parser.add_argument('-j', '--jobs',       type=int, default=None, help="number of processes (default cpu count)")
+    parser.add_argument('--yosys',            type=str, default=os.environ.get("YOSYS", "yosys"), help="yosys command")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    configs = FIXED + list(jobs(args.widths, args.datawidths, args.polys, rng))
+    with Pool(args.jobs) as pool:
+        results = pool.map(check, [config + (args.yosys.split(),) for config in configs])
+
+    failed = 0
+    print(f"{'width':>6}{'poly':>20}{'data':>6}{'steps':>6}{'elab gen s':>12}{'elab matrix s':>15}  result")
+    for r in results:
+        failed += r["error"] is not None
+        status = "PASS" if r["error"] is None else "FAIL\n" + r["error"]
+        print(f"{r['width']:>6}{hex(r['poly']):>20}{r['datawidth']:>6}{r['steps']:>6}"
+              f"{r['elab_gen']:>12.2f}{r['elab_matrix']:>15.2f}  {status}")
+    print(f"{len(results) - failed}/{len(results)} equivalent")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
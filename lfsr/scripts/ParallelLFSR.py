@@ -7,7 +7,7 @@ Author: Heqing Huang
 Date Created: 03/15/2023
 ------------------------------------------------------------------------------------------------
 Python script to generate a specific parallel Galois LFSR
-jinja is required to generate verilog
+jinja is required to generate verilog (only imported when the verilog is rendered)
 https://github.com/pallets/jinja
 ------------------------------------------------------------------------------------------------
 Example:
@@ -43,55 +43,35 @@ The data going out of the tap bit is xored before sending to the next bit
 
 (pic generated by https://textik.com/)
 ------------------------------------------------------------------------------------------------
+Library usage:
+Each output bit is an XOR of LFSR input bits and data bits, stored as two integer masks per
+output bit (bit j of the mask is lfsr_in[j] / data[j]):
+
+    lfsr = ParallelLFSR(32, 0x04c11db7, N=32)
+    lfsr_rows, data_rows = lfsr.matrix(32)      # equations after 32 steps
+    code = lfsr.render(32)                      # verilog as a string
+    lfsr.verilog(32, output=f)                  # write into a file name or a file-like object
+------------------------------------------------------------------------------------------------
+Example:
+Parallel CRC-32 equations for 32 bit data
+    python3 ParallelLFSR.py -w 32 -p 0x04c11db7 -d 32
+16 steps of the 16 bit LFSR without input data (lfsr_0x6801_W16_D0.sv)
+    python3 ParallelLFSR.py -w 16 -p 0x6801 -s 16
+------------------------------------------------------------------------------------------------
 """
 
-from jinja2 import Template
 import argparse
 
-class Entry():
-
-    def __init__(self, idx):
-        """ Create a new entry """
-        self.idx = idx
-        self.lfsr = [idx]
-        self.data = []
-        self.lfsr_next = []
-        self.data_next = []
-
-    def xor(self, a, b):
-        """ xor this entry with another entry """
-        def _xor_list(x, y):
-            xs = set(x)
-            ys = set(y)
-            return list(xs ^ ys)
-
-        self.lfsr_next = _xor_list(a.lfsr, b.lfsr)
-        self.data_next = _xor_list(a.data, b.data)
-
-    def xor_data(self, other, data):
-        self.lfsr_next = list(other.lfsr)
-        self.data_next = list(other.data)
-        self.data_next.append(data)
-
-    def shift(self, other):
-        """ Shifted from another entry """
-        self.lfsr_next = list(other.lfsr)
-        self.data_next = list(other.data)
-
-    def update(self):
-        """ update the entry """
-        self.lfsr = self.lfsr_next
-        self.data = self.data_next
-
-    def __str__(self):
-        string = f"lfsr_out[{self.idx}] = "
-        for i in range(len(self.lfsr)):
-            if i != 0:
-                string += " ^ "
-            string += f"lfsr_in[{self.lfsr[i]}]"
-        for i in range(len(self.data)):
-            string += f" ^ data[{self.data[i]}]"
-        return string
+def mask_terms(mask, name):
+    """ verilog terms of a mask: name[j] for each bit j set """
+    terms = []
+    j = 0
+    while mask:
+        if mask & 0x1:
+            terms.append(f"{name}[{j}]")
+        mask >>= 1
+        j += 1
+    return terms
 
 class ParallelLFSR():
 
@@ -101,80 +81,104 @@ class ParallelLFSR():
         @param poly: LFSR polynomial
         @param N: number of cycle or input data width. 0 means no input data
         """
-        self.lfsr = []
+        if direction != "MSB":
+            raise ValueError(f"Direction {direction} not supported")
         self.N = N
         self.width = width
         self.poly = poly
         self.direction = direction
+        self.reset()
+
+    def reset(self):
+        """ go back to step 0: each output bit is its own input bit """
         self.iter = 0
-        # create entry for each bit position
-        for i in range(width):
-            self.lfsr.append(Entry(i))
+        self.lfsr = [1 << i for i in range(self.width)]
+        self.data = [0] * self.width
 
     def _next_msb(self):
         """
         generate the next LFSR when shifting toward MSB
         """
         self.iter += 1
-        for i in range(1, self.width):
-            # if tap is one, then we need to xor the MSB with the previous entry
+        msb_lfsr = self.lfsr[self.width-1]
+        msb_data = self.data[self.width-1]
+        # the entry from previous bit is shifted to this bit,
+        # if tap is one, then we need to xor the MSB with the previous entry
+        for i in range(self.width-1, 0, -1):
             if (self.poly >> i) & 0x1:
-                self.lfsr[i].xor(self.lfsr[i-1], self.lfsr[self.width-1])
-            # else, the entry from previous bit is shifted to this bit
+                self.lfsr[i] = self.lfsr[i-1] ^ msb_lfsr
+                self.data[i] = self.data[i-1] ^ msb_data
             else:
-                self.lfsr[i].shift(self.lfsr[i-1])
-            # the LSB gets the msb and the data input. MSB of data is shifted in first
-        if self.N == 0: # no data
-            self.lfsr[0].shift(self.lfsr[self.width-1])
-        else:           # has data
-            self.lfsr[0].xor_data(self.lfsr[self.width-1], (self.N)-self.iter)
-
-        # update all the entries
-        for entry in self.lfsr:
-            entry.update()
-
+                self.lfsr[i] = self.lfsr[i-1]
+                self.data[i] = self.data[i-1]
+        # the LSB gets the msb and the data input. MSB of data is shifted in first
+        self.lfsr[0] = msb_lfsr
+        self.data[0] = msb_data
+        if self.N > 0:
+            self.data[0] ^= 1 << (self.N - self.iter)
 
     def equation(self, n):
         """
-            generate parallel LFSR calculation equation
+        advance the parallel LFSR calculation equation by n steps
         """
-        if self.direction == "MSB":
-            for _ in range(n):
-                self._next_msb()
-        else:
-            print(f"ERROR: Direction {direction} not supported!")
+        if self.N > 0 and self.iter + n > self.N:
+            raise ValueError(f"{self.iter + n} steps exceed the data width {self.N}")
+        for _ in range(n):
+            self._next_msb()
+        return self
+
+    def matrix(self, n=None):
+        """
+        @param n: number of steps from step 0, None keeps the current equations
+        @return: lfsr rows, data rows. Output bit i = parity(lfsr_in & lfsr rows[i]) ^
+                 parity(data & data rows[i])
+        """
+        if n is not None:
+            self.reset()
+            self.equation(n)
+        return list(self.lfsr), list(self.data)
 
     def __str__(self):
         string = ""
-        for entry in self.lfsr:
-            string += (str(entry) + "\n")
+        for i in range(self.width):
+            terms = mask_terms(self.lfsr[i], "lfsr_in") + mask_terms(self.data[i], "data")
+            string += f"lfsr_out[{i}] = " + (" ^ ".join(terms) if terms else "1'b0") + "\n"
         return string
 
-    def verilog(self, n, name=None, output=None):
+    def name(self):
+        return f"lfsr_{hex(self.poly)}_W{self.width}_D{self.N}"
+
+    def render(self, n, name=None):
         """
-        generate verilog code to calculate LFSR after n cycle
+        @return: verilog code to calculate LFSR after n cycle
         """
-        self.equation(n)
-        if not name:
-            name = f"lfsr_{hex(self.poly)}_W{self.width}_D{self.N}"
-        if not output:
-            output = f"{name}.sv"
-        print("Opening file '%s'..." % output)
-        output_file = open(output, 'w')
-        verilog_code = ""
-        for entry in self.lfsr:
-            verilog_code += "assign " + str(entry) + ";\n"
-
-        output_file.write(t.render(
+        self.matrix(n)
+        verilog_code = "".join(f"assign {line};\n" for line in str(self).splitlines())
+        return template().render(
                 poly=hex(self.poly),
                 width=self.width,
                 N = self.N,
-                name=name,
-                verilog_code=verilog_code))
+                name=name or self.name(),
+                verilog_code=verilog_code)
 
-        print("Done!")
+    def verilog(self, n, name=None, output=None):
+        """
+        generate verilog code to calculate LFSR after n cycle
+        @param output: file name or file-like object, default <name>.sv
+        @return: the output
+        """
+        name = name or self.name()
+        code = self.render(n, name)
+        if output is None:
+            output = f"{name}.sv"
+        if hasattr(output, "write"):
+            output.write(code)
+        else:
+            with open(output, 'w') as output_file:
+                output_file.write(code)
+        return output
 
-t = Template(u"""
+TEMPLATE = u"""
 // ------------------------------------------------------------------------------------------------
 // Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
 // ------------------------------------------------------------------------------------------------
@@ -196,29 +200,38 @@ module {{name}}  (
 {{verilog_code}}
 
 endmodule
-""")
+"""
 
-def test():
-    lfsr = ParallelLFSR(16, 0x6801)
-    lfsr.verilog(16)
+_template = None
 
+def template():
+    """ the jinja template, compiled on first use """
+    global _template
+    if _template is None:
+        from jinja2 import Template
+        _template = Template(TEMPLATE)
+    return _template
 
 def main():
     parser = argparse.ArgumentParser(description="")
     parser.add_argument('-w', '--width',     type=int, default=16,       help="width of Polynomial (default 16)")
-    parser.add_argument('-d', '--datawidth', type=int, default=0,        help="width of input data bus (default 16). 0 means no input data used.")
+    parser.add_argument('-d', '--datawidth', type=int, default=0,        help="width of input data bus (default 0). 0 means no input data used.")
+    parser.add_argument('-s', '--steps',     type=int, default=None,     help="number of steps (default: data width, or LFSR width without input data)")
     parser.add_argument('-p', '--poly',      type=str, default='0x6801', help="LFSR polynomial (default 0x6801)")
     parser.add_argument('-c', '--config',    type=str, default='galois',
                                 choices=['galois', 'fibonacci'],         help="LFSR configuration (default galois)")
     parser.add_argument('-dir', '--direction',  type=str, default='MSB',
                                 choices=['MSB', 'LSB'],                  help="LFSR shift direction (default MSB)")
     parser.add_argument('-n', '--name',      type=str,                   help="module name")
-    parser.add_argument('-o', '--output',    type=str,                   help="output file name")
+    parser.add_argument('-o', '--output',    type=str,                   help="output file name, - for stdout")
     args = parser.parse_args()
 
-    lfsr = ParallelLFSR(int(args.width), int(args.poly, 16), args.direction, int(args.datawidth))
-    lfsr.verilog(int(args.datawidth), args.name, args.output)
+    steps = args.steps if args.steps is not None else (args.datawidth or args.width)
+    lfsr = ParallelLFSR(args.width, int(args.poly, 16), args.direction, args.datawidth)
+    if args.output == "-":
+        print(lfsr.render(steps, args.name))
+    else:
+        print(f"Generated {lfsr.verilog(steps, args.name, args.output)}")
 
 if __name__ == "__main__":
-    #test()
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+Search maximal-length (primitive) LFSR polynomials and rank them by the cost of the parallel
+LFSR equations generated by ParallelLFSR.
+------------------------------------------------------------------------------------------------
+Primitive test:
+A polynomial f(x) of degree W gives a maximal-length LFSR (period 2^W-1) if and only if x has
+order 2^W-1 modulo f(x):
+
+    x^(2^W-1) = 1 mod f(x)
+    x^((2^W-1)/q) != 1 mod f(x)     for every prime factor q of 2^W-1
+
+So only the prime factors of 2^W-1 are needed, instead of running the LFSR for 2^W-1 cycles.
+
+Cost:
+The candidates are ranked by the XOR equations of the N-step parallel LFSR (ParallelLFSR with
+the given data width). Each equation with k terms needs k-1 two input XOR and ceil(log2(k))
+levels of logic:
+
+    xor:    total number of two input XOR (no sharing between equations)
+    terms:  max number of terms in one equation
+    depth:  max number of XOR levels
+
+The polynomial uses the normal representation (x^W is omitted), same as ParallelLFSR.
+With --catalog the results are cached in a json file so a width is only searched once.
+------------------------------------------------------------------------------------------------
+Example:
+Search the trinomials and pentanomials of width 32 and rank them for 32 steps per cycle
+    python3 PolySearch.py -w 32 -n 32 -t 3
+Check a single polynomial
+    python3 PolySearch.py -w 16 -p 0x6801
+Rank the width 16 polynomials for a CRC with 8 bit data (8 steps per cycle)
+    python3 PolySearch.py -w 16 -d 8
+------------------------------------------------------------------------------------------------
+"""
+
+from multiprocessing import Pool
+from itertools import combinations
+from ParallelLFSR import ParallelLFSR
+import argparse
+import random
+import json
+import math
+import os
+
+########################################
+# Factorization of 2^W-1
+########################################
+
+SMALL_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+def is_prime(n):
+    """ Miller-Rabin test with the bases 2 to 41, deterministic for n < 3.3e24 """
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in SMALL_PRIMES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_rho(n):
+    """ find a non-trivial factor of a composite n """
+    if n % 2 == 0:
+        return 2
+    while True:
+        c = random.randrange(1, n)
+        x = y = random.randrange(2, n)
+        d = 1
+        while d == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            d = math.gcd(abs(x - y), n)
+        if d != n:
+            return d
+
+def prime_factors(n):
+    """ set of the prime factors of n """
+    factors = set()
+    stack = [n]
+    while stack:
+        m = stack.pop()
+        if m == 1:
+            continue
+        if is_prime(m):
+            factors.add(m)
+            continue
+        d = pollard_rho(m)
+        stack += [d, m // d]
+    return factors
+
+########################################
+# GF(2) polynomial
+# A polynomial is an integer, bit i is the coefficient of x^i.
+########################################
+
+def poly_mulmod(a, b, mod, degree):
+    """ a * b mod the polynomial mod of the given degree """
+    result = 0
+    while b:
+        if b & 0x1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if (a >> degree) & 0x1:
+            a ^= mod
+    return result
+
+def poly_powmod(a, e, mod, degree):
+    """ a^e mod the polynomial mod of the given degree """
+    result = 1
+    while e:
+        if e & 0x1:
+            result = poly_mulmod(result, a, mod, degree)
+        a = poly_mulmod(a, a, mod, degree)
+        e >>= 1
+    return result
+
+def is_primitive(width, poly, factors=None):
+    """
+    check if the polynomial (normal representation) gives a maximal-length LFSR
+    @param factors: prime factors of 2^width-1, calculated if not given
+    """
+    if not poly & 0x1:
+        return False
+    mod = (1 << width) | poly
+    order = (1 << width) - 1
+    if width == 1:
+        return True
+    if factors is None:
+        factors = prime_factors(order)
+    if poly_powmod(0b10, order, mod, width) != 1:
+        return False
+    return all(poly_powmod(0b10, order // q, mod, width) != 1 for q in factors)
+
+########################################
+# Cost of the parallel equations
+########################################
+
+def equation_cost(width, poly, n, datawidth=0):
+    """
+    cost of the parallel LFSR equations after n steps
+    @param datawidth: data width of the parallel LFSR, 0 means no input data
+    """
+    lfsr_rows, data_rows = ParallelLFSR(width, poly, "MSB", datawidth).matrix(n)
+    terms = [bin(row).count("1") + bin(data).count("1") for row, data in zip(lfsr_rows, data_rows)]
+    return {
+        "xor": sum(max(k - 1, 0) for k in terms),
+        "terms": max(terms),
+        "depth": max(math.ceil(math.log2(k)) if k > 1 else 0 for k in terms),
+    }
+
+def candidates(width, max_taps):
+    """
+    polynomials with x^width, 1 and up to max_taps other terms.
+    The number of taps must be odd, otherwise (x+1) is a factor.
+    """
+    for taps in range(1, max_taps + 1, 2):
+        for bits in combinations(range(1, width), taps):
+            yield sum(1 << b for b in bits) | 0x1
+
+def evaluate(job):
+    """ worker: primitive test and cost of one polynomial """
+    width, poly, n, datawidth, factors = job
+    if not is_primitive(width, poly, factors):
+        return poly, None
+    return poly, equation_cost(width, poly, n, datawidth)
+
+########################################
+# Catalog
+########################################
+
+class Catalog():
+
+    def __init__(self, path=None):
+        """
+        @param path: json file storing the results, None means no cache
+        """
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path) as catalog_file:
+                self.entries = json.load(catalog_file)
+
+    @staticmethod
+    def key(width, poly, n, datawidth):
+        return f"W{width}_{hex(poly)}_N{n}_D{datawidth}"
+
+    def get(self, width, poly, n, datawidth):
+        return self.entries.get(self.key(width, poly, n, datawidth))
+
+    def put(self, width, poly, n, datawidth, cost):
+        self.entries[self.key(width, poly, n, datawidth)] = {
+            "width": width, "poly": hex(poly), "n": n, "datawidth": datawidth,
+            "primitive": cost is not None, "cost": cost}
+
+    def save(self):
+        if self.path:
+            with open(self.path, 'w') as catalog_file:
+                json.dump(self.entries, catalog_file, indent=1, sort_keys=True)
+
+def search(width, polys, n, datawidth=0, catalog=None, processes=None):
+    """
+    test and rank the polynomials
+    @param n: number of steps, at most datawidth with input data (checked here instead of in the workers)
+    @return: list of (poly, cost) of the primitive polynomials, best first
+    """
+    if datawidth and n > datawidth:
+        raise ValueError(f"{n} steps exceed the data width {datawidth}")
+    catalog = catalog or Catalog()
+    factors = prime_factors((1 << width) - 1)
+    results = {}
+    jobs = []
+    for poly in polys:
+        entry = catalog.get(width, poly, n, datawidth)
+        if entry is None:
+            jobs.append((width, poly, n, datawidth, factors))
+        else:
+            results[poly] = entry["cost"]
+    if jobs:
+        if processes == 1:
+            evaluated = map(evaluate, jobs)
+        else:
+            pool = Pool(processes)
+            evaluated = pool.imap_unordered(evaluate, jobs, chunksize=64)
+        for poly, cost in evaluated:
+            catalog.put(width, poly, n, datawidth, cost)
+            results[poly] = cost
+        if processes != 1:
+            pool.close()
+            pool.join()
+        catalog.save()
+    ranked = [(poly, cost) for poly, cost in results.items() if cost is not None]
+    ranked.sort(key=lambda item: (item[1]["xor"], item[1]["depth"], item[0]))
+    return ranked
+
+def main():
+    parser = argparse.ArgumentParser(description="Search primitive LFSR polynomials")
+    parser.add_argument('-w', '--width',     type=int, default=16,  help="width of Polynomial (default 16)")
+    parser.add_argument('-n', '--steps',     type=int, default=0,   help="number of steps of the parallel LFSR (default data width, or width without input data)")
+    parser.add_argument('-d', '--datawidth', type=int, default=0,   help="width of input data bus (default 0, no input data)")
+    parser.add_argument('-p', '--poly',      type=str, nargs='+',   help="only check these polynomials")
+    parser.add_argument('-t', '--max-taps',  type=int, default=3,   help="max number of taps besides x^W and 1 (default 3)")
+    parser.add_argument('-k', '--top',       type=int, default=10,  help="number of results to print (default 10)")
+    parser.add_argument('-j', '--jobs',      type=int, default=None, help="number of processes (default cpu count)")
+    parser.add_argument('-c', '--catalog',   type=str, default=None, help="json catalog file caching the results (default no cache)")
+    args = parser.parse_args()
+
+    n = args.steps or args.datawidth or args.width
+    if args.datawidth and n > args.datawidth:
+        parser.error(f"{n} steps exceed the data width {args.datawidth}")
+    if args.poly:
+        polys = [int(poly, 16) for poly in args.poly]
+    else:
+        polys = candidates(args.width, args.max_taps)
+    ranked = search(args.width, polys, n, args.datawidth, Catalog(args.catalog), args.jobs)
+    if args.poly:
+        for poly in polys:
+            status = "primitive" if poly in dict(ranked) else "NOT primitive"
+            print(f"{hex(poly)}: {status}")
+    print(f"{len(ranked)} primitive polynomials, width {args.width}, {n} steps, data width {args.datawidth}")
+    print(f"{'poly':>20} {'xor':>6} {'terms':>6} {'depth':>6}")
+    for poly, cost in ranked[:args.top]:
+        print(f"{hex(poly):>20} {cost['xor']:>6} {cost['terms']:>6} {cost['depth']:>6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+PRBS generator and checker model, same as prbs_gen.sv and prbs_chk.sv
+------------------------------------------------------------------------------------------------
+The generator is a Galois LFSR shifting towards MSB, the PRBS bit is the MSB before each shift.
+
+The next LFSR value after one cycle (N shifts) and the N output bits are linear functions of the
+current LFSR value. They are calculated once with ParallelLFSR and stored as row masks:
+
+    lfsr_next[i] = parity(lfsr & rows[i])
+    prbs bit k   = parity(lfsr & outs[k])
+
+Jumping ahead by any number of cycles uses the same rows, squared as many times as needed, so a
+long sequence can be skipped in log2(cycles) steps.
+------------------------------------------------------------------------------------------------
+Example:
+Print the first 8 words of PRBS31 with 32 bits per cycle
+    python3 Prbs.py -o 31 -n 32 -c 8
+------------------------------------------------------------------------------------------------
+"""
+
+from ParallelLFSR import ParallelLFSR
+import argparse
+
+# ITU-T O.150 PRBS. The value is POLY used in prbs_gen/prbs_chk (reciprocal of the O.150 polynomial)
+PRBS = {
+    7:  0x03,           # x^7  + x^6  + 1
+    9:  0x011,          # x^9  + x^5  + 1
+    15: 0x0003,         # x^15 + x^14 + 1
+    23: 0x000021,       # x^23 + x^18 + 1
+    31: 0x00000009,     # x^31 + x^28 + 1
+}
+
+def parity(value):
+    return bin(value).count("1") & 0x1
+
+def rows_apply(rows, value):
+    """ apply the rows to a value """
+    result = 0
+    for i, row in enumerate(rows):
+        result |= parity(value & row) << i
+    return result
+
+def rows_compose(a, b):
+    """ rows of applying b first then a """
+    result = []
+    for row in a:
+        composed = 0
+        j = 0
+        while row:
+            if row & 0x1:
+                composed ^= b[j]
+            row >>= 1
+            j += 1
+        result.append(composed)
+    return result
+
+class PrbsGen():
+
+    def __init__(self, width, poly, n, seed=None):
+        """
+        @param width: LFSR width (PRBS order)
+        @param poly: LFSR polynomial, same as POLY in prbs_gen
+        @param n: number of bits generated per cycle
+        @param seed: initial LFSR value, default all ones
+        """
+        self.width = width
+        self.poly = poly
+        self.n = n
+        self.lfsr = (1 << width) - 1 if seed is None else seed
+        # output bit k is the MSB after k shifts, the LFSR after n shifts is the next value
+        lfsr = ParallelLFSR(width, poly)
+        self.outs = []
+        for _ in range(n):
+            self.outs.append(lfsr.matrix()[0][width-1])
+            lfsr.equation(1)
+        # rows for 2^k cycles
+        self.pow2 = [lfsr.matrix()[0]]
+
+    def next(self):
+        """ generate the next n bits. The first bit is at the MSB """
+        word = 0
+        for out in self.outs:
+            word = (word << 1) | parity(self.lfsr & out)
+        self.lfsr = rows_apply(self.pow2[0], self.lfsr)
+        return word
+
+    def jump(self, cycles):
+        """ skip the next cycles * n bits """
+        k = 0
+        while cycles:
+            if k == len(self.pow2):
+                self.pow2.append(rows_compose(self.pow2[-1], self.pow2[-1]))
+            if cycles & 0x1:
+                self.lfsr = rows_apply(self.pow2[k], self.lfsr)
+            cycles >>= 1
+            k += 1
+
+class PrbsChecker():
+
+    def __init__(self, width, poly, n, lock_cnt=16, window=256, err_thresh=64):
+        """
+        @param width: LFSR width (PRBS order)
+        @param poly: LFSR polynomial, same as POLY in prbs_chk
+        @param n: number of bits checked per cycle
+        @param lock_cnt: number of clean cycles to get lock
+        @param window: error window size in cycles
+        @param err_thresh: lose lock if there are more errors in a window
+        """
+        self.width = width
+        self.poly = poly
+        self.n = n
+        self.lock_cnt = lock_cnt
+        self.window = window
+        self.err_thresh = err_thresh
+        self.hist = 0
+        self.lock = False
+        self.good_cnt = 0
+        self.win_cnt = 0
+        self.win_err = 0
+        self.clear()
+
+    def clear(self):
+        self.err_cnt = 0
+        self.bit_cnt = 0
+
+    def ber(self):
+        return self.err_cnt / self.bit_cnt if self.bit_cnt else 0.0
+
+    def check(self, word):
+        """
+        check the next n received bits (first bit at the MSB)
+        @return: number of error bits in this word
+        """
+        seq_r = self.hist       # bit k is b[t+k]
+        seq_l = self.hist
+        errors = 0
+        for i in range(self.n):
+            bit = (word >> (self.n - 1 - i)) & 0x1
+            exp_r = parity((seq_r >> i) & self.poly)
+            exp_l = parity((seq_l >> i) & self.poly)
+            seq_r |= bit << (self.width + i)
+            seq_l |= exp_l << (self.width + i)
+            errors += bit ^ (exp_l if self.lock else exp_r)
+        mask = (1 << self.width) - 1
+        self.hist = ((seq_l if self.lock else seq_r) >> self.n) & mask
+        if self.lock:
+            self.err_cnt += errors
+            self.bit_cnt += self.n
+        if not self.lock:
+            self.good_cnt = self.good_cnt + 1 if errors == 0 else 0
+            if errors == 0 and self.good_cnt == self.lock_cnt:
+                self.lock = True
+                self.good_cnt = 0
+        elif self.win_err + errors > self.err_thresh:
+            self.lock = False
+            self.win_cnt = 0
+            self.win_err = 0
+        elif self.win_cnt == self.window - 1:
+            self.win_cnt = 0
+            self.win_err = 0
+        else:
+            self.win_cnt += 1
+            self.win_err += errors
+        return errors
+
+def main():
+    parser = argparse.ArgumentParser(description="Print a PRBS sequence")
+    parser.add_argument('-o', '--order',     type=int, default=31, choices=sorted(PRBS), help="PRBS order (default 31)")
+    parser.add_argument('-n', '--bits',      type=int, default=32,  help="number of bits per word (default 32)")
+    parser.add_argument('-c', '--cycles',    type=int, default=8,   help="number of words (default 8)")
+    parser.add_argument('-j', '--jump',      type=int, default=0,   help="skip this number of words first (default 0)")
+    parser.add_argument('-s', '--seed',      type=str, default=None, help="initial LFSR value (default all ones)")
+    args = parser.parse_args()
+
+    seed = int(args.seed, 16) if args.seed else None
+    gen = PrbsGen(args.order, PRBS[args.order], args.bits, seed)
+    gen.jump(args.jump)
+    for _ in range(args.cycles):
+        print(f"{gen.next():0{(args.bits + 3) // 4}x}")
+
+if __name__ == "__main__":
+    main()
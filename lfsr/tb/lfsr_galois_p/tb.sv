@@ -16,6 +16,7 @@ module tb();
     logic [N-1:0]        data;
     logic [WIDTH-1:0]    lfsr_outa;
     logic [WIDTH-1:0]    lfsr_outb;
+    logic [WIDTH-1:0]    lfsr_outc;
 
     lfsr_galois_p
     u_lfsr_galois_p (
@@ -28,4 +29,10 @@ module tb();
         .lfsr_in(lfsr_in),
         .lfsr_out(lfsr_outb));
 
+    lfsr_galois_p_matrix #(.WIDTH(WIDTH), .POLY(16'h6801), .D_WIDTH(0), .STEPS(N))
+    u_lfsr_galois_p_matrix (
+        .lfsr_in(lfsr_in),
+        .data(1'b0),
+        .lfsr_out(lfsr_outc));
+
 endmodule
\ No newline at end of file
@@ -54,4 +54,8 @@ async def test_msb1(dut):
 
 @cocotb.test()
 async def test_msb2(dut):
-    await tester(dut, "MSB", dut.lfsr_outb)
\ No newline at end of file
+    await tester(dut, "MSB", dut.lfsr_outb)
+
+@cocotb.test()
+async def test_msb3(dut):
+    await tester(dut, "MSB", dut.lfsr_outc)
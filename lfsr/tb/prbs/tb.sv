@@ -0,0 +1,113 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Testbench for PRBS generator and checker
+// The generator output is looped back to the checker. Errors are injected with err_mask.
+// ------------------------------------------------------------------------------------------------
+
+module tb();
+
+    logic            clk;
+    logic            rst_b;
+
+    ///////////////////////////////////////
+    // PRBS31, 32 bits per cycle, 2 lanes
+    ///////////////////////////////////////
+
+    localparam P31_N = 32;
+    localparam P31_LANES = 2;
+
+    logic                       en_31;
+    logic                       clear_31;
+    logic [P31_LANES*P31_N-1:0] prbs_31;
+    logic [P31_LANES*P31_N-1:0] err_mask_31;
+    logic [P31_LANES-1:0]       lock_31;
+    logic [P31_LANES-1:0]       err_31;
+    logic [P31_LANES*48-1:0]    err_cnt_31;
+    logic [P31_LANES*48-1:0]    bit_cnt_31;
+
+    prbs_gen #(
+        .WIDTH(31),
+        .POLY(31'h00000009),
+        .N(P31_N),
+        .LANES(P31_LANES)
+    )
+    u_prbs_gen_31(
+        .clk(clk),
+        .rst_b(rst_b),
+        .en(en_31),
+        .prbs(prbs_31)
+    );
+
+    prbs_chk #(
+        .WIDTH(31),
+        .POLY(31'h00000009),
+        .N(P31_N),
+        .LANES(P31_LANES),
+        .LOCK_CNT(16),
+        .WINDOW(64),
+        .ERR_THRESH(32)
+    )
+    u_prbs_chk_31(
+        .clk(clk),
+        .rst_b(rst_b),
+        .clear(clear_31),
+        .din_vld(en_31),
+        .din(prbs_31 ^ err_mask_31),
+        .lock(lock_31),
+        .err(err_31),
+        .err_cnt(err_cnt_31),
+        .bit_cnt(bit_cnt_31)
+    );
+
+    ///////////////////////////////////////
+    // PRBS7, 8 bits per cycle
+    ///////////////////////////////////////
+
+    logic           en_7;
+    logic           clear_7;
+    logic [7:0]     prbs_7;
+    logic [7:0]     err_mask_7;
+    logic           lock_7;
+    logic           err_7;
+    logic [47:0]    err_cnt_7;
+    logic [47:0]    bit_cnt_7;
+
+    prbs_gen #(
+        .WIDTH(7),
+        .POLY(7'h03),
+        .N(8),
+        .LANES(1)
+    )
+    u_prbs_gen_7(
+        .clk(clk),
+        .rst_b(rst_b),
+        .en(en_7),
+        .prbs(prbs_7)
+    );
+
+    prbs_chk #(
+        .WIDTH(7),
+        .POLY(7'h03),
+        .N(8),
+        .LANES(1),
+        .LOCK_CNT(8),
+        .WINDOW(32),
+        .ERR_THRESH(8)
+    )
+    u_prbs_chk_7(
+        .clk(clk),
+        .rst_b(rst_b),
+        .clear(clear_7),
+        .din_vld(en_7),
+        .din(prbs_7 ^ err_mask_7),
+        .lock(lock_7),
+        .err(err_7),
+        .err_cnt(err_cnt_7),
+        .bit_cnt(bit_cnt_7)
+    );
+
+endmodule
@@ -0,0 +1,201 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Testbench for PRBS generator and checker
+# ------------------------------------------------------------------------------------------------
+
+import cocotb
+from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.clock import Clock
+from Prbs import PRBS, PrbsGen, PrbsChecker
+import random
+
+CNT_W = 48
+
+# same parameters as tb.sv
+CONFIG = {
+    31: {"n": 32, "lanes": 2, "lock_cnt": 16, "window": 64, "err_thresh": 32},
+    7:  {"n": 8,  "lanes": 1, "lock_cnt": 8,  "window": 32, "err_thresh": 8},
+}
+
+class PrbsBench():
+
+    def __init__(self, dut, order):
+        """
+        @param dut: the tb top
+        @param order: PRBS order, select the instance in tb.sv
+        """
+        cfg = CONFIG[order]
+        self.dut = dut
+        self.n = cfg["n"]
+        self.lanes = cfg["lanes"]
+        self.en = getattr(dut, f"en_{order}")
+        self.clear = getattr(dut, f"clear_{order}")
+        self.prbs = getattr(dut, f"prbs_{order}")
+        self.err_mask = getattr(dut, f"err_mask_{order}")
+        self.lock = getattr(dut, f"lock_{order}")
+        self.err = getattr(dut, f"err_{order}")
+        self.err_cnt = getattr(dut, f"err_cnt_{order}")
+        self.bit_cnt = getattr(dut, f"bit_cnt_{order}")
+        seed = (1 << order) - 1
+        self.gens = [PrbsGen(order, PRBS[order], self.n, seed ^ l) for l in range(self.lanes)]
+        self.chks = [PrbsChecker(order, PRBS[order], self.n, cfg["lock_cnt"], cfg["window"], cfg["err_thresh"])
+                     for _ in range(self.lanes)]
+        # number of errors injected while the checker is locked
+        self.injected = [0] * self.lanes
+        self.en.value = 0
+        self.clear.value = 0
+        self.err_mask.value = 0
+
+    def lane(self, value, l, width):
+        return (value >> (l * width)) & ((1 << width) - 1)
+
+    def check_state(self):
+        """ compare the checker registers with the model """
+        lock = self.lock.value.integer
+        err_cnt = self.err_cnt.value.integer
+        bit_cnt = self.bit_cnt.value.integer
+        for l, chk in enumerate(self.chks):
+            assert ((lock >> l) & 0x1) == chk.lock, f"Lane {l}: lock = {(lock >> l) & 0x1}, expected {chk.lock}"
+            assert self.lane(err_cnt, l, CNT_W) == chk.err_cnt, \
+                f"Lane {l}: err_cnt = {self.lane(err_cnt, l, CNT_W)}, expected {chk.err_cnt}"
+            assert self.lane(bit_cnt, l, CNT_W) == chk.bit_cnt, \
+                f"Lane {l}: bit_cnt = {self.lane(bit_cnt, l, CNT_W)}, expected {chk.bit_cnt}"
+
+    async def cycle(self, masks=None):
+        """ run one cycle with the error masks (one per lane) """
+        masks = masks or [0] * self.lanes
+        await FallingEdge(self.dut.clk)
+        self.check_state()
+        self.en.value = 1
+        self.err_mask.value = sum(mask << (l * self.n) for l, mask in enumerate(masks))
+        await Timer(2, "ns")
+        prbs = self.prbs.value.integer
+        err = self.err.value.integer
+        for l, (gen, chk) in enumerate(zip(self.gens, self.chks)):
+            expected = gen.next()
+            assert self.lane(prbs, l, self.n) == expected, \
+                f"Lane {l}: prbs = {hex(self.lane(prbs, l, self.n))}, expected {hex(expected)}"
+            locked = chk.lock
+            errors = chk.check(expected ^ masks[l])
+            assert ((err >> l) & 0x1) == (locked and errors > 0), f"Lane {l}: wrong err output"
+            if locked:
+                self.injected[l] += bin(masks[l]).count("1")
+
+    async def run(self, cycles, rate=0.0):
+        """ run some cycles, each bit is flipped with probability rate """
+        for _ in range(cycles):
+            await self.cycle([error_mask(self.n, rate) for _ in range(self.lanes)])
+
+    async def idle(self, cycles):
+        """ disable the generator and the checker for some cycles """
+        await FallingEdge(self.dut.clk)
+        self.en.value = 0
+        self.err_mask.value = 0
+        for _ in range(cycles):
+            await FallingEdge(self.dut.clk)
+            self.check_state()
+
+    async def do_clear(self):
+        await FallingEdge(self.dut.clk)
+        self.en.value = 0
+        self.clear.value = 1
+        await FallingEdge(self.dut.clk)
+        self.clear.value = 0
+        for l, chk in enumerate(self.chks):
+            chk.clear()
+            self.injected[l] = 0
+        self.check_state()
+
+def error_mask(nbits, rate):
+    """ random error mask, each bit is set with probability rate """
+    mask = 0
+    if rate:
+        for i in range(nbits):
+            if random.random() < rate:
+                mask |= 1 << i
+    return mask
+
+async def setup(dut):
+    dut.rst_b.value = 0
+    benches = {order: PrbsBench(dut, order) for order in CONFIG}
+    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    await Timer(20, units="ns")
+    await FallingEdge(dut.clk)
+    dut.rst_b.value = 1
+    return benches
+
+async def lock_tester(bench, max_cycles):
+    """ run until all the lanes are locked """
+    for _ in range(max_cycles):
+        await bench.cycle()
+        if all(chk.lock for chk in bench.chks):
+            break
+    await FallingEdge(bench.dut.clk)
+    bench.check_state()
+    assert bench.lock.value.integer == (1 << bench.lanes) - 1, "Checker failed to lock"
+
+async def error_tester(bench, cycles, rate):
+    """ inject random errors and check the error counters """
+    await bench.run(cycles, rate)
+    await FallingEdge(bench.dut.clk)
+    bench.check_state()
+    err_cnt = bench.err_cnt.value.integer
+    for l, chk in enumerate(bench.chks):
+        assert chk.lock, f"Lane {l} lost lock with error rate {rate}"
+        # the checker runs as a local generator after lock so every error is counted once
+        assert bench.lane(err_cnt, l, CNT_W) == bench.injected[l], \
+            f"Lane {l}: err_cnt = {bench.lane(err_cnt, l, CNT_W)}, injected {bench.injected[l]}"
+        bench.dut._log.info(f"Lane {l}: {chk.err_cnt} errors in {chk.bit_cnt} bits, BER = {chk.ber():.2e}")
+
+async def relock_tester(bench, burst, cycles):
+    """ inject a burst of errors to lose lock, then check it relocks """
+    for _ in range(burst):
+        await bench.cycle([random.getrandbits(bench.n) for _ in range(bench.lanes)])
+    await FallingEdge(bench.dut.clk)
+    assert bench.lock.value.integer == 0, "Checker should lose lock after the error burst"
+    await lock_tester(bench, cycles)
+
+@cocotb.test()
+async def test_prbs31(dut):
+    benches = await setup(dut)
+    bench = benches[31]
+    await lock_tester(bench, 64)
+    await error_tester(bench, 2000, 1e-3)
+    await bench.do_clear()
+    await bench.idle(5)
+    await error_tester(bench, 500, 1e-4)
+    await relock_tester(bench, 8, 64)
+    await error_tester(bench, 500, 1e-3)
+
+@cocotb.test()
+async def test_prbs7(dut):
+    benches = await setup(dut)
+    bench = benches[7]
+    await lock_tester(bench, 32)
+    await error_tester(bench, 2000, 1e-3)
+    await relock_tester(bench, 8, 32)
+    await error_tester(bench, 1000, 5e-3)
+
+@cocotb.test()
+async def test_prbs31_jump(dut):
+    """ run the generator without the model then jump ahead the model """
+    benches = await setup(dut)
+    bench = benches[31]
+    cycles = random.randint(1000, 5000)
+    await FallingEdge(dut.clk)
+    bench.en.value = 1
+    for _ in range(cycles):
+        await FallingEdge(dut.clk)
+    for gen in bench.gens:
+        gen.jump(cycles)
+    bench.en.value = 0
+    await Timer(2, "ns")
+    prbs = bench.prbs.value.integer
+    for l, gen in enumerate(bench.gens):
+        expected = gen.next()
+        assert bench.lane(prbs, l, bench.n) == expected, \
+            f"Lane {l}: prbs = {hex(bench.lane(prbs, l, bench.n))}, expected {hex(expected)} after {cycles} cycles"
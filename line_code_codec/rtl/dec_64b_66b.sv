@@ -0,0 +1,137 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// 64b/66b decoder
+// ------------------------------------------------------------------------------------------------
+// Reference: IEEE 802.3 Clause 49 (10GBASE-R PCS)
+//
+// Features:
+//      - Block lock: find the block boundary with the sync header and request bit slip
+//      - Descramble the 64 bit payload (scrambler_64b66b)
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Block lock                 *
+------------------------------
+A sync header is valid if the two bits are different (2'b01 or 2'b10). This is a simplified
+version of the lock state machine in IEEE 802.3 Figure 49-14:
+
+Not locked:
+    - valid header:   count it, lock after LOCK_CNT valid headers in a row
+    - invalid header: assert slip, restart the count
+Locked:
+    - headers are counted in windows of WINDOW blocks
+    - lose lock and assert slip on the INVLD_CNT-th invalid header of a window
+
+slip is combinational from the block input. gearbox_rx_66b drops one bit when it sees slip so
+the next block is shifted by one bit. After at most 65 slips the block boundary is found.
+
+------------------------------
+* Descrambler                *
+------------------------------
+The descrambler runs on every block, locked or not. It is self-synchronizing so the data is
+correct once the block is locked.
+*/
+
+module dec_64b_66b #(
+    parameter LOCK_CNT = 64,                // Number of valid headers in a row to get lock
+    parameter WINDOW = 64,                  // Window size in blocks when locked
+    parameter INVLD_CNT = 16                // Lose lock with this number of invalid headers in a window
+) (
+    input  logic            clk,
+    input  logic            rst_b,
+
+    input  logic            in_vld,
+    input  logic [65:0]     in_block,
+
+    output logic            slip,           // request to shift the block boundary by 1 bit
+    output logic            block_lock,
+
+    output logic            out_vld,        // only valid when locked
+    output logic            out_ctrl,       // 1 = control block, 0 = data block
+    output logic            out_err,        // invalid sync header
+    output logic [63:0]     out_data
+);
+
+    localparam CW = $clog2(LOCK_CNT > WINDOW ? LOCK_CNT : WINDOW);
+    localparam IW = $clog2(INVLD_CNT) + 1;
+
+    logic [CW-1:0]  sh_cnt;
+    logic [IW-1:0]  invld_cnt;
+    logic           sh_valid;
+    logic           lose_lock;
+    logic [63:0]    data_descrambled;
+
+    assign sh_valid = in_block[0] ^ in_block[1];
+    assign lose_lock = block_lock & ~sh_valid & (invld_cnt == INVLD_CNT - 1);
+    assign slip = in_vld & ~sh_valid & (~block_lock | lose_lock);
+
+    // block lock
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            block_lock <= 1'b0;
+            sh_cnt <= '0;
+            invld_cnt <= '0;
+        end
+        else if (in_vld) begin
+            if (!block_lock) begin
+                if (!sh_valid) begin
+                    sh_cnt <= '0;
+                end
+                else if (sh_cnt == LOCK_CNT - 1) begin
+                    block_lock <= 1'b1;
+                    sh_cnt <= '0;
+                    invld_cnt <= '0;
+                end
+                else begin
+                    sh_cnt <= sh_cnt + 1'b1;
+                end
+            end
+            else begin
+                if (lose_lock) begin
+                    block_lock <= 1'b0;
+                    sh_cnt <= '0;
+                    invld_cnt <= '0;
+                end
+                else if (sh_cnt == WINDOW - 1) begin
+                    sh_cnt <= '0;
+                    invld_cnt <= '0;
+                end
+                else begin
+                    sh_cnt <= sh_cnt + 1'b1;
+                    invld_cnt <= invld_cnt + {{(IW-1){1'b0}}, ~sh_valid};
+                end
+            end
+        end
+    end
+
+    scrambler_64b66b #(.W(64), .DESCRAMBLE(1))
+    u_descrambler (
+        .clk(clk),
+        .rst_b(rst_b),
+        .en(in_vld),
+        .din(in_block[65:2]),
+        .dout(data_descrambled));
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            out_vld <= 1'b0;
+        end
+        else begin
+            out_vld <= in_vld & block_lock & ~lose_lock;
+        end
+    end
+
+    always @(posedge clk) begin
+        if (in_vld) begin
+            out_ctrl <= in_block[0] & ~in_block[1];
+            out_err <= ~sh_valid;
+            out_data <= data_descrambled;
+        end
+    end
+
+endmodule
@@ -0,0 +1,135 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// 8b/10b decoder
+// ------------------------------------------------------------------------------------------------
+// Features:
+//      - Table based decoder, the table is dec_8b_10b_rom.sv generated by Codec8b10b.py
+//      - LANES codes per cycle, lane 0 is the first code on the line
+//      - Detect code violation and running disparity error
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Decode table               *
+------------------------------
+The table has one entry for each of the 1024 codes: {rd_ok[1:0], k, data[7:0]}.
+rd_ok[0] is set if the code is a valid encoding when RD = -1, rd_ok[1] when RD = +1.
+
+    code_err: rd_ok == 0, the code is not a valid 8b/10b code
+    disp_err: the code is valid but not for the current RD (rd_ok[rd] == 0)
+
+------------------------------
+* Running disparity          *
+------------------------------
+The RD after a code is +1 if the code has more 1s than 0s, -1 if it has more 0s than 1s, and not
+changed if it is balanced. The RD is updated the same way for a code with error so the decoder
+recovers after a few codes.
+
+With multiple lanes the RD goes through the lanes in the same cycle:
+    rd[0] = RD register
+    rd[l+1] = RD after the code of lane l
+    RD register <= rd[LANES]
+*/
+
+module dec_8b_10b #(
+    parameter LANES = 1,            // number of codes per cycle
+    parameter OUT_FLOP = 1          // Add flop for output
+) (
+    input  logic                    clk,
+    input  logic                    rst_b,
+
+    input  logic                    in_vld,
+    input  logic [LANES*10-1:0]     datain_10b,     // lane l: abcdeifghj at datain_10b[l*10+9:l*10]
+    output logic                    out_vld,
+    output logic [LANES*8-1:0]      dataout_8b,     // lane l: HGFEDCBA at dataout_8b[l*8+7:l*8]
+    output logic [LANES-1:0]        kout,           // control character
+    output logic [LANES-1:0]        code_err,       // code violation
+    output logic [LANES-1:0]        disp_err,       // running disparity error
+    output logic                    rdisp           // current running disparity. 0: RD = -1, 1: RD = +1
+);
+
+    logic [LANES:0]         rd;
+    logic [LANES*8-1:0]     data;
+    logic [LANES-1:0]       k;
+    logic [LANES-1:0]       cerr;
+    logic [LANES-1:0]       derr;
+
+    assign rd[0] = rdisp;
+
+    genvar l;
+    generate
+        for (l = 0; l < LANES; l = l + 1) begin: lane
+
+            logic [9:0]     code;
+            logic [10:0]    entry;
+            logic [1:0]     rd_ok;
+            logic [3:0]     ones;
+
+            assign code = datain_10b[l*10+9:l*10];
+
+            dec_8b_10b_rom u_rom (.code(code), .entry(entry));
+
+            assign rd_ok = entry[10:9];
+            assign k[l] = entry[8];
+            assign data[l*8+7:l*8] = entry[7:0];
+            assign cerr[l] = rd_ok == 2'b00;
+            assign derr[l] = !cerr[l] && !rd_ok[rd[l]];
+
+            always @(*) begin
+                ones = 0;
+                for (int i = 0; i < 10; i = i + 1) ones = ones + code[i];
+            end
+
+            assign rd[l+1] = (ones > 5) ? 1'b1 : (ones < 5) ? 1'b0 : rd[l];
+
+        end
+    endgenerate
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            rdisp <= 1'b0;      // default RD = -1
+        end
+        else if (in_vld) begin
+            rdisp <= rd[LANES];
+        end
+    end
+
+    generate
+        if (OUT_FLOP) begin: out_flop
+
+            always @(posedge clk or negedge rst_b) begin
+                if (!rst_b) begin
+                    out_vld <= 1'b0;
+                    dataout_8b <= '0;
+                    kout <= '0;
+                    code_err <= '0;
+                    disp_err <= '0;
+                end
+                else begin
+                    out_vld <= in_vld;
+                    if (in_vld) begin
+                        dataout_8b <= data;
+                        kout <= k;
+                        code_err <= cerr;
+                        disp_err <= derr;
+                    end
+                end
+            end
+
+        end: out_flop
+        else begin: no_out_flop
+
+            assign out_vld = in_vld;
+            assign dataout_8b = data;
+            assign kout = k;
+            assign code_err = cerr;
+            assign disp_err = derr;
+
+        end: no_out_flop
+    endgenerate
+
+endmodule
@@ -0,0 +1,485 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Generated by Codec8b10b.py
+// ------------------------------------------------------------------------------------------------
+// 8b/10b decode table
+// entry: {rd_ok[1:0], k, data[7:0]}, rd_ok[0]/rd_ok[1]: the code is valid for RD = -1/+1
+// ------------------------------------------------------------------------------------------------
+
+module dec_8b_10b_rom (
+    input  logic [9:0]  code,
+    output logic [10:0] entry
+);
+
+    always @(*) begin
+        case(code)
+            10'b0001010101: entry = 11'b10001010111;
+            10'b0001010110: entry = 11'b10011010111;
+            10'b0001010111: entry = 11'b10111110111;
+            10'b0001011001: entry = 11'b10000110111;
+            10'b0001011010: entry = 11'b10010110111;
+            10'b0001011011: entry = 11'b10000010111;
+            10'b0001011100: entry = 11'b10001110111;
+            10'b0001011101: entry = 11'b10010010111;
+            10'b0001011110: entry = 11'b10011110111;
+            10'b0001100101: entry = 11'b10001001000;
+            10'b0001100110: entry = 11'b10011001000;
+            10'b0001101001: entry = 11'b10000101000;
+            10'b0001101010: entry = 11'b10010101000;
+            10'b0001101011: entry = 11'b10000001000;
+            10'b0001101100: entry = 11'b10001101000;
+            10'b0001101101: entry = 11'b10010001000;
+            10'b0001101110: entry = 11'b10011101000;
+            10'b0001110001: entry = 11'b10011100111;
+            10'b0001110010: entry = 11'b10010000111;
+            10'b0001110011: entry = 11'b10001100111;
+            10'b0001110100: entry = 11'b10000000111;
+            10'b0001110101: entry = 11'b10001000111;
+            10'b0001110110: entry = 11'b10011000111;
+            10'b0001111001: entry = 11'b10000100111;
+            10'b0001111010: entry = 11'b10010100111;
+            10'b0010010101: entry = 11'b10001011011;
+            10'b0010010110: entry = 11'b10011011011;
+            10'b0010010111: entry = 11'b10111111011;
+            10'b0010011001: entry = 11'b10000111011;
+            10'b0010011010: entry = 11'b10010111011;
+            10'b0010011011: entry = 11'b10000011011;
+            10'b0010011100: entry = 11'b10001111011;
+            10'b0010011101: entry = 11'b10010011011;
+            10'b0010011110: entry = 11'b10011111011;
+            10'b0010100101: entry = 11'b10001000100;
+            10'b0010100110: entry = 11'b10011000100;
+            10'b0010101001: entry = 11'b10000100100;
+            10'b0010101010: entry = 11'b10010100100;
+            10'b0010101011: entry = 11'b10000000100;
+            10'b0010101100: entry = 11'b10001100100;
+            10'b0010101101: entry = 11'b10010000100;
+            10'b0010101110: entry = 11'b10011100100;
+            10'b0010110001: entry = 11'b10011110100;
+            10'b0010110010: entry = 11'b10010010100;
+            10'b0010110011: entry = 11'b10001110100;
+            10'b0010110100: entry = 11'b10000010100;
+            10'b0010110101: entry = 11'b11001010100;
+            10'b0010110110: entry = 11'b11011010100;
+            10'b0010110111: entry = 11'b01011110100;
+            10'b0010111001: entry = 11'b11000110100;
+            10'b0010111010: entry = 11'b11010110100;
+            10'b0010111011: entry = 11'b01000010100;
+            10'b0010111100: entry = 11'b01001110100;
+            10'b0010111101: entry = 11'b01010010100;
+            10'b0011000101: entry = 11'b10001011000;
+            10'b0011000110: entry = 11'b10011011000;
+            10'b0011001001: entry = 11'b10000111000;
+            10'b0011001010: entry = 11'b10010111000;
+            10'b0011001011: entry = 11'b10000011000;
+            10'b0011001100: entry = 11'b10001111000;
+            10'b0011001101: entry = 11'b10010011000;
+            10'b0011001110: entry = 11'b10011111000;
+            10'b0011010001: entry = 11'b10011101100;
+            10'b0011010010: entry = 11'b10010001100;
+            10'b0011010011: entry = 11'b10001101100;
+            10'b0011010100: entry = 11'b10000001100;
+            10'b0011010101: entry = 11'b11001001100;
+            10'b0011010110: entry = 11'b11011001100;
+            10'b0011011001: entry = 11'b11000101100;
+            10'b0011011010: entry = 11'b11010101100;
+            10'b0011011011: entry = 11'b01000001100;
+            10'b0011011100: entry = 11'b01001101100;
+            10'b0011011101: entry = 11'b01010001100;
+            10'b0011011110: entry = 11'b01011101100;
+            10'b0011100001: entry = 11'b10011111100;
+            10'b0011100010: entry = 11'b10010011100;
+            10'b0011100011: entry = 11'b10001111100;
+            10'b0011100100: entry = 11'b10000011100;
+            10'b0011100101: entry = 11'b11001011100;
+            10'b0011100110: entry = 11'b11011011100;
+            10'b0011101001: entry = 11'b11000111100;
+            10'b0011101010: entry = 11'b11010111100;
+            10'b0011101011: entry = 11'b01000011100;
+            10'b0011101100: entry = 11'b01001111100;
+            10'b0011101101: entry = 11'b01010011100;
+            10'b0011101110: entry = 11'b01011111100;
+            10'b0011110010: entry = 11'b01110011100;
+            10'b0011110011: entry = 11'b01101111100;
+            10'b0011110100: entry = 11'b01100011100;
+            10'b0011110101: entry = 11'b01101011100;
+            10'b0011110110: entry = 11'b01111011100;
+            10'b0011111000: entry = 11'b01111111100;
+            10'b0011111001: entry = 11'b01100111100;
+            10'b0011111010: entry = 11'b01110111100;
+            10'b0100010101: entry = 11'b10001011101;
+            10'b0100010110: entry = 11'b10011011101;
+            10'b0100010111: entry = 11'b10111111101;
+            10'b0100011001: entry = 11'b10000111101;
+            10'b0100011010: entry = 11'b10010111101;
+            10'b0100011011: entry = 11'b10000011101;
+            10'b0100011100: entry = 11'b10001111101;
+            10'b0100011101: entry = 11'b10010011101;
+            10'b0100011110: entry = 11'b10011111101;
+            10'b0100100101: entry = 11'b10001000010;
+            10'b0100100110: entry = 11'b10011000010;
+            10'b0100101001: entry = 11'b10000100010;
+            10'b0100101010: entry = 11'b10010100010;
+            10'b0100101011: entry = 11'b10000000010;
+            10'b0100101100: entry = 11'b10001100010;
+            10'b0100101101: entry = 11'b10010000010;
+            10'b0100101110: entry = 11'b10011100010;
+            10'b0100110001: entry = 11'b10011110010;
+            10'b0100110010: entry = 11'b10010010010;
+            10'b0100110011: entry = 11'b10001110010;
+            10'b0100110100: entry = 11'b10000010010;
+            10'b0100110101: entry = 11'b11001010010;
+            10'b0100110110: entry = 11'b11011010010;
+            10'b0100110111: entry = 11'b01011110010;
+            10'b0100111001: entry = 11'b11000110010;
+            10'b0100111010: entry = 11'b11010110010;
+            10'b0100111011: entry = 11'b01000010010;
+            10'b0100111100: entry = 11'b01001110010;
+            10'b0100111101: entry = 11'b01010010010;
+            10'b0101000101: entry = 11'b10001011111;
+            10'b0101000110: entry = 11'b10011011111;
+            10'b0101001001: entry = 11'b10000111111;
+            10'b0101001010: entry = 11'b10010111111;
+            10'b0101001011: entry = 11'b10000011111;
+            10'b0101001100: entry = 11'b10001111111;
+            10'b0101001101: entry = 11'b10010011111;
+            10'b0101001110: entry = 11'b10011111111;
+            10'b0101010001: entry = 11'b10011101010;
+            10'b0101010010: entry = 11'b10010001010;
+            10'b0101010011: entry = 11'b10001101010;
+            10'b0101010100: entry = 11'b10000001010;
+            10'b0101010101: entry = 11'b11001001010;
+            10'b0101010110: entry = 11'b11011001010;
+            10'b0101011001: entry = 11'b11000101010;
+            10'b0101011010: entry = 11'b11010101010;
+            10'b0101011011: entry = 11'b01000001010;
+            10'b0101011100: entry = 11'b01001101010;
+            10'b0101011101: entry = 11'b01010001010;
+            10'b0101011110: entry = 11'b01011101010;
+            10'b0101100001: entry = 11'b10011111010;
+            10'b0101100010: entry = 11'b10010011010;
+            10'b0101100011: entry = 11'b10001111010;
+            10'b0101100100: entry = 11'b10000011010;
+            10'b0101100101: entry = 11'b11001011010;
+            10'b0101100110: entry = 11'b11011011010;
+            10'b0101101001: entry = 11'b11000111010;
+            10'b0101101010: entry = 11'b11010111010;
+            10'b0101101011: entry = 11'b01000011010;
+            10'b0101101100: entry = 11'b01001111010;
+            10'b0101101101: entry = 11'b01010011010;
+            10'b0101101110: entry = 11'b01011111010;
+            10'b0101110001: entry = 11'b01011101111;
+            10'b0101110010: entry = 11'b01010001111;
+            10'b0101110011: entry = 11'b01001101111;
+            10'b0101110100: entry = 11'b01000001111;
+            10'b0101110101: entry = 11'b01001001111;
+            10'b0101110110: entry = 11'b01011001111;
+            10'b0101111001: entry = 11'b01000101111;
+            10'b0101111010: entry = 11'b01010101111;
+            10'b0110000101: entry = 11'b10001000000;
+            10'b0110000110: entry = 11'b10011000000;
+            10'b0110001001: entry = 11'b10000100000;
+            10'b0110001010: entry = 11'b10010100000;
+            10'b0110001011: entry = 11'b10000000000;
+            10'b0110001100: entry = 11'b10001100000;
+            10'b0110001101: entry = 11'b10010000000;
+            10'b0110001110: entry = 11'b10011100000;
+            10'b0110010001: entry = 11'b10011100110;
+            10'b0110010010: entry = 11'b10010000110;
+            10'b0110010011: entry = 11'b10001100110;
+            10'b0110010100: entry = 11'b10000000110;
+            10'b0110010101: entry = 11'b11001000110;
+            10'b0110010110: entry = 11'b11011000110;
+            10'b0110011001: entry = 11'b11000100110;
+            10'b0110011010: entry = 11'b11010100110;
+            10'b0110011011: entry = 11'b01000000110;
+            10'b0110011100: entry = 11'b01001100110;
+            10'b0110011101: entry = 11'b01010000110;
+            10'b0110011110: entry = 11'b01011100110;
+            10'b0110100001: entry = 11'b10011110110;
+            10'b0110100010: entry = 11'b10010010110;
+            10'b0110100011: entry = 11'b10001110110;
+            10'b0110100100: entry = 11'b10000010110;
+            10'b0110100101: entry = 11'b11001010110;
+            10'b0110100110: entry = 11'b11011010110;
+            10'b0110101001: entry = 11'b11000110110;
+            10'b0110101010: entry = 11'b11010110110;
+            10'b0110101011: entry = 11'b01000010110;
+            10'b0110101100: entry = 11'b01001110110;
+            10'b0110101101: entry = 11'b01010010110;
+            10'b0110101110: entry = 11'b01011110110;
+            10'b0110110001: entry = 11'b01011110000;
+            10'b0110110010: entry = 11'b01010010000;
+            10'b0110110011: entry = 11'b01001110000;
+            10'b0110110100: entry = 11'b01000010000;
+            10'b0110110101: entry = 11'b01001010000;
+            10'b0110110110: entry = 11'b01011010000;
+            10'b0110111001: entry = 11'b01000110000;
+            10'b0110111010: entry = 11'b01010110000;
+            10'b0111000010: entry = 11'b10010001110;
+            10'b0111000011: entry = 11'b10001101110;
+            10'b0111000100: entry = 11'b10000001110;
+            10'b0111000101: entry = 11'b11001001110;
+            10'b0111000110: entry = 11'b11011001110;
+            10'b0111001000: entry = 11'b10011101110;
+            10'b0111001001: entry = 11'b11000101110;
+            10'b0111001010: entry = 11'b11010101110;
+            10'b0111001011: entry = 11'b01000001110;
+            10'b0111001100: entry = 11'b01001101110;
+            10'b0111001101: entry = 11'b01010001110;
+            10'b0111001110: entry = 11'b01011101110;
+            10'b0111010001: entry = 11'b01011100001;
+            10'b0111010010: entry = 11'b01010000001;
+            10'b0111010011: entry = 11'b01001100001;
+            10'b0111010100: entry = 11'b01000000001;
+            10'b0111010101: entry = 11'b01001000001;
+            10'b0111010110: entry = 11'b01011000001;
+            10'b0111011001: entry = 11'b01000100001;
+            10'b0111011010: entry = 11'b01010100001;
+            10'b0111100001: entry = 11'b01011111110;
+            10'b0111100010: entry = 11'b01010011110;
+            10'b0111100011: entry = 11'b01001111110;
+            10'b0111100100: entry = 11'b01000011110;
+            10'b0111100101: entry = 11'b01001011110;
+            10'b0111100110: entry = 11'b01011011110;
+            10'b0111101000: entry = 11'b01111111110;
+            10'b0111101001: entry = 11'b01000111110;
+            10'b0111101010: entry = 11'b01010111110;
+            10'b1000010101: entry = 11'b10001011110;
+            10'b1000010110: entry = 11'b10011011110;
+            10'b1000010111: entry = 11'b10111111110;
+            10'b1000011001: entry = 11'b10000111110;
+            10'b1000011010: entry = 11'b10010111110;
+            10'b1000011011: entry = 11'b10000011110;
+            10'b1000011100: entry = 11'b10001111110;
+            10'b1000011101: entry = 11'b10010011110;
+            10'b1000011110: entry = 11'b10011111110;
+            10'b1000100101: entry = 11'b10001000001;
+            10'b1000100110: entry = 11'b10011000001;
+            10'b1000101001: entry = 11'b10000100001;
+            10'b1000101010: entry = 11'b10010100001;
+            10'b1000101011: entry = 11'b10000000001;
+            10'b1000101100: entry = 11'b10001100001;
+            10'b1000101101: entry = 11'b10010000001;
+            10'b1000101110: entry = 11'b10011100001;
+            10'b1000110001: entry = 11'b10011110001;
+            10'b1000110010: entry = 11'b10010010001;
+            10'b1000110011: entry = 11'b10001110001;
+            10'b1000110100: entry = 11'b10000010001;
+            10'b1000110101: entry = 11'b11001010001;
+            10'b1000110110: entry = 11'b11011010001;
+            10'b1000110111: entry = 11'b01011110001;
+            10'b1000111001: entry = 11'b11000110001;
+            10'b1000111010: entry = 11'b11010110001;
+            10'b1000111011: entry = 11'b01000010001;
+            10'b1000111100: entry = 11'b01001110001;
+            10'b1000111101: entry = 11'b01010010001;
+            10'b1001000101: entry = 11'b10001010000;
+            10'b1001000110: entry = 11'b10011010000;
+            10'b1001001001: entry = 11'b10000110000;
+            10'b1001001010: entry = 11'b10010110000;
+            10'b1001001011: entry = 11'b10000010000;
+            10'b1001001100: entry = 11'b10001110000;
+            10'b1001001101: entry = 11'b10010010000;
+            10'b1001001110: entry = 11'b10011110000;
+            10'b1001010001: entry = 11'b10011101001;
+            10'b1001010010: entry = 11'b10010001001;
+            10'b1001010011: entry = 11'b10001101001;
+            10'b1001010100: entry = 11'b10000001001;
+            10'b1001010101: entry = 11'b11001001001;
+            10'b1001010110: entry = 11'b11011001001;
+            10'b1001011001: entry = 11'b11000101001;
+            10'b1001011010: entry = 11'b11010101001;
+            10'b1001011011: entry = 11'b01000001001;
+            10'b1001011100: entry = 11'b01001101001;
+            10'b1001011101: entry = 11'b01010001001;
+            10'b1001011110: entry = 11'b01011101001;
+            10'b1001100001: entry = 11'b10011111001;
+            10'b1001100010: entry = 11'b10010011001;
+            10'b1001100011: entry = 11'b10001111001;
+            10'b1001100100: entry = 11'b10000011001;
+            10'b1001100101: entry = 11'b11001011001;
+            10'b1001100110: entry = 11'b11011011001;
+            10'b1001101001: entry = 11'b11000111001;
+            10'b1001101010: entry = 11'b11010111001;
+            10'b1001101011: entry = 11'b01000011001;
+            10'b1001101100: entry = 11'b01001111001;
+            10'b1001101101: entry = 11'b01010011001;
+            10'b1001101110: entry = 11'b01011111001;
+            10'b1001110001: entry = 11'b01011100000;
+            10'b1001110010: entry = 11'b01010000000;
+            10'b1001110011: entry = 11'b01001100000;
+            10'b1001110100: entry = 11'b01000000000;
+            10'b1001110101: entry = 11'b01001000000;
+            10'b1001110110: entry = 11'b01011000000;
+            10'b1001111001: entry = 11'b01000100000;
+            10'b1001111010: entry = 11'b01010100000;
+            10'b1010000101: entry = 11'b10001001111;
+            10'b1010000110: entry = 11'b10011001111;
+            10'b1010001001: entry = 11'b10000101111;
+            10'b1010001010: entry = 11'b10010101111;
+            10'b1010001011: entry = 11'b10000001111;
+            10'b1010001100: entry = 11'b10001101111;
+            10'b1010001101: entry = 11'b10010001111;
+            10'b1010001110: entry = 11'b10011101111;
+            10'b1010010001: entry = 11'b10011100101;
+            10'b1010010010: entry = 11'b10010000101;
+            10'b1010010011: entry = 11'b10001100101;
+            10'b1010010100: entry = 11'b10000000101;
+            10'b1010010101: entry = 11'b11001000101;
+            10'b1010010110: entry = 11'b11011000101;
+            10'b1010011001: entry = 11'b11000100101;
+            10'b1010011010: entry = 11'b11010100101;
+            10'b1010011011: entry = 11'b01000000101;
+            10'b1010011100: entry = 11'b01001100101;
+            10'b1010011101: entry = 11'b01010000101;
+            10'b1010011110: entry = 11'b01011100101;
+            10'b1010100001: entry = 11'b10011110101;
+            10'b1010100010: entry = 11'b10010010101;
+            10'b1010100011: entry = 11'b10001110101;
+            10'b1010100100: entry = 11'b10000010101;
+            10'b1010100101: entry = 11'b11001010101;
+            10'b1010100110: entry = 11'b11011010101;
+            10'b1010101001: entry = 11'b11000110101;
+            10'b1010101010: entry = 11'b11010110101;
+            10'b1010101011: entry = 11'b01000010101;
+            10'b1010101100: entry = 11'b01001110101;
+            10'b1010101101: entry = 11'b01010010101;
+            10'b1010101110: entry = 11'b01011110101;
+            10'b1010110001: entry = 11'b01011111111;
+            10'b1010110010: entry = 11'b01010011111;
+            10'b1010110011: entry = 11'b01001111111;
+            10'b1010110100: entry = 11'b01000011111;
+            10'b1010110101: entry = 11'b01001011111;
+            10'b1010110110: entry = 11'b01011011111;
+            10'b1010111001: entry = 11'b01000111111;
+            10'b1010111010: entry = 11'b01010111111;
+            10'b1011000010: entry = 11'b10010001101;
+            10'b1011000011: entry = 11'b10001101101;
+            10'b1011000100: entry = 11'b10000001101;
+            10'b1011000101: entry = 11'b11001001101;
+            10'b1011000110: entry = 11'b11011001101;
+            10'b1011001000: entry = 11'b10011101101;
+            10'b1011001001: entry = 11'b11000101101;
+            10'b1011001010: entry = 11'b11010101101;
+            10'b1011001011: entry = 11'b01000001101;
+            10'b1011001100: entry = 11'b01001101101;
+            10'b1011001101: entry = 11'b01010001101;
+            10'b1011001110: entry = 11'b01011101101;
+            10'b1011010001: entry = 11'b01011100010;
+            10'b1011010010: entry = 11'b01010000010;
+            10'b1011010011: entry = 11'b01001100010;
+            10'b1011010100: entry = 11'b01000000010;
+            10'b1011010101: entry = 11'b01001000010;
+            10'b1011010110: entry = 11'b01011000010;
+            10'b1011011001: entry = 11'b01000100010;
+            10'b1011011010: entry = 11'b01010100010;
+            10'b1011100001: entry = 11'b01011111101;
+            10'b1011100010: entry = 11'b01010011101;
+            10'b1011100011: entry = 11'b01001111101;
+            10'b1011100100: entry = 11'b01000011101;
+            10'b1011100101: entry = 11'b01001011101;
+            10'b1011100110: entry = 11'b01011011101;
+            10'b1011101000: entry = 11'b01111111101;
+            10'b1011101001: entry = 11'b01000111101;
+            10'b1011101010: entry = 11'b01010111101;
+            10'b1100000101: entry = 11'b10110111100;
+            10'b1100000110: entry = 11'b10100111100;
+            10'b1100000111: entry = 11'b10111111100;
+            10'b1100001001: entry = 11'b10111011100;
+            10'b1100001010: entry = 11'b10101011100;
+            10'b1100001011: entry = 11'b10100011100;
+            10'b1100001100: entry = 11'b10101111100;
+            10'b1100001101: entry = 11'b10110011100;
+            10'b1100010001: entry = 11'b10011100011;
+            10'b1100010010: entry = 11'b10010000011;
+            10'b1100010011: entry = 11'b10001100011;
+            10'b1100010100: entry = 11'b10000000011;
+            10'b1100010101: entry = 11'b11001000011;
+            10'b1100010110: entry = 11'b11011000011;
+            10'b1100011001: entry = 11'b11000100011;
+            10'b1100011010: entry = 11'b11010100011;
+            10'b1100011011: entry = 11'b01000000011;
+            10'b1100011100: entry = 11'b01001100011;
+            10'b1100011101: entry = 11'b01010000011;
+            10'b1100011110: entry = 11'b01011100011;
+            10'b1100100001: entry = 11'b10011110011;
+            10'b1100100010: entry = 11'b10010010011;
+            10'b1100100011: entry = 11'b10001110011;
+            10'b1100100100: entry = 11'b10000010011;
+            10'b1100100101: entry = 11'b11001010011;
+            10'b1100100110: entry = 11'b11011010011;
+            10'b1100101001: entry = 11'b11000110011;
+            10'b1100101010: entry = 11'b11010110011;
+            10'b1100101011: entry = 11'b01000010011;
+            10'b1100101100: entry = 11'b01001110011;
+            10'b1100101101: entry = 11'b01010010011;
+            10'b1100101110: entry = 11'b01011110011;
+            10'b1100110001: entry = 11'b01011111000;
+            10'b1100110010: entry = 11'b01010011000;
+            10'b1100110011: entry = 11'b01001111000;
+            10'b1100110100: entry = 11'b01000011000;
+            10'b1100110101: entry = 11'b01001011000;
+            10'b1100110110: entry = 11'b01011011000;
+            10'b1100111001: entry = 11'b01000111000;
+            10'b1100111010: entry = 11'b01010111000;
+            10'b1101000010: entry = 11'b10010001011;
+            10'b1101000011: entry = 11'b10001101011;
+            10'b1101000100: entry = 11'b10000001011;
+            10'b1101000101: entry = 11'b11001001011;
+            10'b1101000110: entry = 11'b11011001011;
+            10'b1101001000: entry = 11'b10011101011;
+            10'b1101001001: entry = 11'b11000101011;
+            10'b1101001010: entry = 11'b11010101011;
+            10'b1101001011: entry = 11'b01000001011;
+            10'b1101001100: entry = 11'b01001101011;
+            10'b1101001101: entry = 11'b01010001011;
+            10'b1101001110: entry = 11'b01011101011;
+            10'b1101010001: entry = 11'b01011100100;
+            10'b1101010010: entry = 11'b01010000100;
+            10'b1101010011: entry = 11'b01001100100;
+            10'b1101010100: entry = 11'b01000000100;
+            10'b1101010101: entry = 11'b01001000100;
+            10'b1101010110: entry = 11'b01011000100;
+            10'b1101011001: entry = 11'b01000100100;
+            10'b1101011010: entry = 11'b01010100100;
+            10'b1101100001: entry = 11'b01011111011;
+            10'b1101100010: entry = 11'b01010011011;
+            10'b1101100011: entry = 11'b01001111011;
+            10'b1101100100: entry = 11'b01000011011;
+            10'b1101100101: entry = 11'b01001011011;
+            10'b1101100110: entry = 11'b01011011011;
+            10'b1101101000: entry = 11'b01111111011;
+            10'b1101101001: entry = 11'b01000111011;
+            10'b1101101010: entry = 11'b01010111011;
+            10'b1110000101: entry = 11'b01001000111;
+            10'b1110000110: entry = 11'b01011000111;
+            10'b1110001001: entry = 11'b01000100111;
+            10'b1110001010: entry = 11'b01010100111;
+            10'b1110001011: entry = 11'b01000000111;
+            10'b1110001100: entry = 11'b01001100111;
+            10'b1110001101: entry = 11'b01010000111;
+            10'b1110001110: entry = 11'b01011100111;
+            10'b1110010001: entry = 11'b01011101000;
+            10'b1110010010: entry = 11'b01010001000;
+            10'b1110010011: entry = 11'b01001101000;
+            10'b1110010100: entry = 11'b01000001000;
+            10'b1110010101: entry = 11'b01001001000;
+            10'b1110010110: entry = 11'b01011001000;
+            10'b1110011001: entry = 11'b01000101000;
+            10'b1110011010: entry = 11'b01010101000;
+            10'b1110100001: entry = 11'b01011110111;
+            10'b1110100010: entry = 11'b01010010111;
+            10'b1110100011: entry = 11'b01001110111;
+            10'b1110100100: entry = 11'b01000010111;
+            10'b1110100101: entry = 11'b01001010111;
+            10'b1110100110: entry = 11'b01011010111;
+            10'b1110101000: entry = 11'b01111110111;
+            10'b1110101001: entry = 11'b01000110111;
+            10'b1110101010: entry = 11'b01010110111;
+            default: entry = 11'b0;
+        endcase
+    end
+
+endmodule
@@ -0,0 +1,80 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// 64b/66b encoder
+// ------------------------------------------------------------------------------------------------
+// Reference: IEEE 802.3 Clause 49 (10GBASE-R PCS)
+//
+// Features:
+//      - Scramble the 64 bit payload with x^58 + x^39 + 1 (scrambler_64b66b)
+//      - Insert the 2 bit sync header
+//      - valid/ready interface, one block per cycle
+// Notes:
+//      - The block type field and the control characters of a control block are not generated
+//        here, in_data is the whole 64 bit payload of the block.
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Block format               *
+------------------------------
+       65                   2   1   0
+      +-----------------------+---+---+
+      |  scrambled payload    |  sync |
+      +-----------------------+---+---+
+
+Bit 0 is the first bit on the line. The sync header is not scrambled:
+    - data block:    "01" on the line, out_block[1:0] = 2'b10
+    - control block: "10" on the line, out_block[1:0] = 2'b01
+The other two values are invalid and used by the decoder to find the block boundary.
+*/
+
+module enc_64b_66b #(
+    parameter [57:0] SEED = {58{1'b1}}      // Initial state of the scrambler
+) (
+    input  logic            clk,
+    input  logic            rst_b,
+
+    input  logic            in_vld,
+    output logic            in_ready,
+    input  logic            in_ctrl,        // 1 = control block, 0 = data block
+    input  logic [63:0]     in_data,
+
+    output logic            out_vld,
+    input  logic            out_ready,
+    output logic [65:0]     out_block
+);
+
+    logic           in_fire;
+    logic [63:0]    data_scrambled;
+
+    assign in_ready = out_ready | ~out_vld;
+    assign in_fire = in_vld & in_ready;
+
+    scrambler_64b66b #(.W(64), .DESCRAMBLE(0), .SEED(SEED))
+    u_scrambler (
+        .clk(clk),
+        .rst_b(rst_b),
+        .en(in_fire),
+        .din(in_data),
+        .dout(data_scrambled));
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            out_vld <= 1'b0;
+        end
+        else if (in_ready) begin
+            out_vld <= in_vld;
+        end
+    end
+
+    always @(posedge clk) begin
+        if (in_fire) begin
+            out_block <= {data_scrambled, in_ctrl ? 2'b01 : 2'b10};
+        end
+    end
+
+endmodule
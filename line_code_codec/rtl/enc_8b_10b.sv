@@ -106,8 +106,10 @@ module enc_8b_10b #(
         logic [5:0] kx_enc;     // x portion of the encoded control characters
         logic [3:0] ky_enc;     // y portion of the encoded control characters
         logic       kcorrect;
+        logic       rd_after_k;             // running disparity after encoding a control character
 
         logic [9:0] enc_10b;
+        logic       rd_out;
 
         assign x = datain_8b[4:0];
         assign y = datain_8b[7:5];
@@ -207,7 +209,7 @@ module enc_8b_10b #(
 
         assign kcorrect = kin & (
                                     (x == 5'd28) |
-                                    ((y == 3'd7) & ((x != 6'd23) | (x != 6'd27) | (x != 6'd29) | (x != 6'd30)))
+                                    ((y == 3'd7) & ((x == 5'd23) | (x == 5'd27) | (x == 5'd29) | (x == 5'd30)))
                                 );
 
         always @(*) begin
@@ -235,11 +237,16 @@ module enc_8b_10b #(
         assign kx_enc = rdispin ? ~kx_enc_rd_minus : kx_enc_rd_minus;
         assign ky_enc = rdispin ? ~ky_enc_rd_minus : ky_enc_rd_minus;
 
+        // The x portion of all the control characters is unbalanced so RD is inverted after it.
+        // The y portion is unbalanced for K.x.0, K.x.4 and K.x.7 and inverts RD again.
+        assign rd_after_k = ((y == 3'd0) || (y == 3'd4) || (y == 3'd7)) ? rdispin : ~rdispin;
+
         /////////////////////////////////
         // Final output
         /////////////////////////////////
 
         assign enc_10b = (kin && kcorrect) ? {kx_enc, ky_enc} : {dx_enc, dy_enc};
+        assign rd_out = (kin && kcorrect) ? rd_after_k : rd_after_y;
 
         if (OUT_FLOP) begin: out_flop
 
@@ -251,8 +258,8 @@ module enc_8b_10b #(
                 end
                 else begin
                     dataout_10b <= enc_10b;
-                    rdispout <= rd_after_y;
-                    k_err <= ~kcorrect;
+                    rdispout <= rd_out;
+                    k_err <= kin & ~kcorrect;
                 end
             end
 
@@ -260,8 +267,8 @@ module enc_8b_10b #(
         else begin: no_out_flop
 
             assign dataout_10b = enc_10b;
-            assign rdispout = rd_after_y;
-            assign k_err = ~kcorrect;
+            assign rdispout = rd_out;
+            assign k_err = kin & ~kcorrect;
 
         end: no_out_flop
 
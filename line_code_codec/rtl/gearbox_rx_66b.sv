@@ -0,0 +1,83 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// OW bit to 66b RX gearbox
+// ------------------------------------------------------------------------------------------------
+// Convert the OW bit words from the line into 66 bit blocks for dec_64b_66b
+//
+// Features:
+//      - OW = 64 or 32
+//      - Bit slip to move the block boundary
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Gearbox                    *
+------------------------------
+The gearbox holds cnt bits (at most 65) in buffer, bit 0 is the oldest one. Each valid cycle
+in_data is appended to the buffer. Once there are 66 bits, the oldest 66 bits are sent as a block.
+
+------------------------------
+* Bit slip                   *
+------------------------------
+When slip is set, the oldest bit is dropped so all the following blocks are shifted by one bit.
+slip comes from dec_64b_66b and is combinational from out_block, the block sent in the next
+cycles is already shifted.
+*/
+
+module gearbox_rx_66b #(
+    parameter OW = 64                       // Input width
+) (
+    input  logic            clk,
+    input  logic            rst_b,
+
+    input  logic            in_vld,
+    input  logic [OW-1:0]   in_data,        // bit 0 is the first bit on the line
+    input  logic            slip,
+
+    output logic            out_vld,
+    output logic [65:0]     out_block
+);
+
+    logic [65:0]    buffer;
+    logic [6:0]     cnt;
+    logic [6:0]     cnt_in;
+    logic           drop;
+    logic [7:0]     total;
+    logic [OW+65:0] bits;
+
+    assign cnt_in = in_vld ? OW : 0;
+    assign drop = slip & ((cnt != 0) | in_vld);
+    assign total = cnt + cnt_in - drop;
+    assign bits = ({{OW{1'b0}}, buffer} | ({{66{1'b0}}, in_data & {OW{in_vld}}} << cnt)) >> drop;
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            buffer <= '0;
+            cnt <= '0;
+            out_vld <= 1'b0;
+        end
+        else begin
+            if (total >= 66) begin
+                buffer <= bits[OW+65:66];
+                cnt <= total - 66;
+                out_vld <= 1'b1;
+            end
+            else begin
+                buffer <= bits[65:0];
+                cnt <= total;
+                out_vld <= 1'b0;
+            end
+        end
+    end
+
+    always @(posedge clk) begin
+        if (total >= 66) begin
+            out_block <= bits[65:0];
+        end
+    end
+
+endmodule
@@ -0,0 +1,80 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// 66b to OW bit TX gearbox
+// ------------------------------------------------------------------------------------------------
+// Convert the 66 bit blocks from enc_64b_66b into OW bit words (for example the SERDES width)
+//
+// Features:
+//      - OW = 64 or 32
+//      - One OW bit word per cycle as long as the blocks are available
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Gearbox                    *
+------------------------------
+The gearbox holds cnt bits (less than 66) not sent yet in buffer, bit 0 is the oldest one.
+
+    cnt < OW:  not enough bits for a word, take a new block (in_ready = 1).
+               send the OW bits from {in_block, buffer} and keep the rest
+    cnt >= OW: send a word from the buffer only, the input is stalled
+
+With OW = 64, 32 blocks are sent in 33 cycles, in_ready is low 1 cycle out of 33.
+With OW = 32, 16 blocks are sent in 33 cycles.
+*/
+
+module gearbox_tx_66b #(
+    parameter OW = 64                       // Output width
+) (
+    input  logic            clk,
+    input  logic            rst_b,
+
+    input  logic            in_vld,
+    output logic            in_ready,
+    input  logic [65:0]     in_block,
+
+    output logic            out_vld,
+    output logic [OW-1:0]   out_data        // bit 0 is the first bit on the line
+);
+
+    logic [65:0]    buffer;
+    logic [6:0]     cnt;
+    logic [OW+65:0] bits;
+
+    assign in_ready = cnt < OW;
+    assign bits = {{OW{1'b0}}, buffer} | ({{OW{1'b0}}, in_block} << cnt);
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            buffer <= '0;
+            cnt <= '0;
+            out_vld <= 1'b0;
+        end
+        else begin
+            if (in_ready && in_vld) begin
+                buffer <= bits[OW+65:OW];
+                cnt <= cnt + 66 - OW;
+                out_vld <= 1'b1;
+            end
+            else if (!in_ready) begin
+                buffer <= buffer >> OW;
+                cnt <= cnt - OW;
+                out_vld <= 1'b1;
+            end
+            else begin
+                out_vld <= 1'b0;
+            end
+        end
+    end
+
+    always @(posedge clk) begin
+        if (in_vld || !in_ready) begin
+            out_data <= bits[OW-1:0];
+        end
+    end
+
+endmodule
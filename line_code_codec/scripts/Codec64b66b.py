@@ -0,0 +1,269 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+64b/66b model, same as enc_64b_66b.sv, dec_64b_66b.sv, gearbox_tx_66b.sv, gearbox_rx_66b.sv
+and scrambler_64b66b.sv
+numpy is required
+https://numpy.org/
+------------------------------------------------------------------------------------------------
+Parallel scrambler:
+
+The scrambled bits of one cycle are linear functions of the data bits and the last 58 scrambled
+bits (the state). Same as ParallelLFSR, each bit is tracked as the set of variables it depends on
+while the serial equation s[n] = d[n] ^ s[n-39] ^ s[n-58] is unrolled W times. The result is two
+GF(2) matrices:
+
+    s = (A @ d + B @ state) % 2
+
+The scrambler applies the matrices block by block since each block depends on the previous one.
+The descrambler only uses the received bits so a whole stream is descrambled at once.
+
+Data representation:
+
+Payloads and line words are numpy uint64 arrays, bit 0 is the first bit on the line. A block is
+a sync header (uint8 array, 2'b10 for data and 2'b01 for control) and a payload.
+------------------------------------------------------------------------------------------------
+Example:
+Print the equations of the 64 bit parallel scrambler
+    python3 Codec64b66b.py -w 64
+------------------------------------------------------------------------------------------------
+"""
+
+import argparse
+import numpy as np
+
+SYNC_DATA = 0b10
+SYNC_CTRL = 0b01
+TAPS = (39, 58)
+STATE_W = 58
+SEED = (1 << STATE_W) - 1
+
+########################################
+# Bit helpers
+########################################
+
+def to_bits(words, width):
+    """ uint64 array of n words into a (n, width) uint8 bit array, bit 0 first """
+    words = np.ascontiguousarray(np.asarray(words, dtype=np.uint64).astype('<u8'))
+    bits = np.unpackbits(words.view(np.uint8), bitorder='little').reshape(-1, 64)
+    return bits[:, :width]
+
+def from_bits(bits):
+    """ (n, width) bit array into a uint64 array """
+    bits = np.asarray(bits, dtype=np.uint8)
+    padded = np.zeros((bits.shape[0], 64), dtype=np.uint8)
+    padded[:, :bits.shape[1]] = bits
+    return np.packbits(padded, axis=1, bitorder='little').view('<u8').reshape(-1).astype(np.uint64)
+
+def int_to_bits(value, width):
+    return np.array([(value >> i) & 0x1 for i in range(width)], dtype=np.uint8)
+
+def bits_to_int(bits):
+    return sum(int(b) << i for i, b in enumerate(bits))
+
+########################################
+# Scrambler
+########################################
+
+def scrambler_matrix(width):
+    """
+    matrices of the parallel scrambler
+    @return: A (width x width), B (width x 58), s = (A @ d + B @ state) % 2
+    """
+    # variable k < width is data bit k, variable width + k is state bit k
+    ext = [1 << (width + k) for k in range(STATE_W)]
+    for i in range(width):
+        ext.append((1 << i) ^ ext[i + STATE_W - TAPS[0]] ^ ext[i])
+    a = np.zeros((width, width), dtype=np.uint8)
+    b = np.zeros((width, STATE_W), dtype=np.uint8)
+    for i, mask in enumerate(ext[STATE_W:]):
+        for k in range(width + STATE_W):
+            if (mask >> k) & 0x1:
+                if k < width:
+                    a[i, k] = 1
+                else:
+                    b[i, k - width] = 1
+    return a, b
+
+def equations(width):
+    """ the equations of the parallel scrambler in verilog, for reference """
+    a, b = scrambler_matrix(width)
+    lines = []
+    for i in range(width):
+        terms = [f"din[{k}]" for k in np.nonzero(a[i])[0]] + [f"state[{k}]" for k in np.nonzero(b[i])[0]]
+        lines.append(f"assign dout[{i}] = {' ^ '.join(terms)};")
+    return lines
+
+class Scrambler64b66b():
+
+    def __init__(self, width=64, descramble=False, seed=SEED):
+        """
+        Same as scrambler_64b66b.sv
+        @param width: number of bits per cycle
+        @param descramble: scrambler or descrambler
+        @param seed: initial state
+        """
+        self.width = width
+        self.descramble = descramble
+        self.state = int_to_bits(seed, STATE_W)
+        self.a, self.b = scrambler_matrix(width)
+
+    def step(self, word):
+        """ scramble (or descramble) one word """
+        return int(self.run(np.array([word], dtype=np.uint64))[0])
+
+    def run(self, words):
+        """ scramble (or descramble) a uint64 array of words """
+        bits = to_bits(words, self.width)
+        if self.descramble:
+            stream = np.concatenate([self.state, bits.reshape(-1)])
+            n = bits.size
+            out = stream[STATE_W:] ^ stream[STATE_W - TAPS[0]:STATE_W - TAPS[0] + n] ^ stream[:n]
+            self.state = stream[-STATE_W:].copy()
+            return from_bits(out.reshape(-1, self.width))
+        out = np.zeros_like(bits)
+        for k, d in enumerate(bits):
+            out[k] = (self.a @ d + self.b @ self.state) & 0x1
+            self.state = np.concatenate([self.state, out[k]])[-STATE_W:]
+        return from_bits(out)
+
+########################################
+# Encoder/Decoder
+########################################
+
+class Encoder64b66b():
+
+    def __init__(self, seed=SEED):
+        """ Same as enc_64b_66b.sv """
+        self.scrambler = Scrambler64b66b(64, False, seed)
+
+    def run(self, data, ctrl):
+        """
+        encode the payloads
+        @param data: uint64 array of payloads
+        @param ctrl: bool array, control or data block
+        @return: sync headers, scrambled payloads
+        """
+        sync = np.where(np.asarray(ctrl, dtype=bool), SYNC_CTRL, SYNC_DATA).astype(np.uint8)
+        return sync, self.scrambler.run(data)
+
+class Decoder64b66b():
+
+    def __init__(self, lock_cnt=64, window=64, invld_cnt=16):
+        """
+        Same as dec_64b_66b.sv. Cycle model, step() is one clock
+        @param lock_cnt: number of valid headers in a row to get lock
+        @param window: window size in blocks when locked
+        @param invld_cnt: lose lock with this number of invalid headers in a window
+        """
+        self.lock_cnt = lock_cnt
+        self.window = window
+        self.invld_cnt = invld_cnt
+        self.descrambler = Scrambler64b66b(64, True)
+        self.block_lock = False
+        self.sh_cnt = 0
+        self.invld = 0
+        # registered outputs
+        self.out_vld = False
+        self.out_ctrl = False
+        self.out_err = False
+        self.out_data = 0
+
+    def lose_lock(self, sync):
+        return self.block_lock and sync in (0, 3) and self.invld == self.invld_cnt - 1
+
+    def slip(self, vld, sync):
+        """ combinational slip request for the current input block """
+        return vld and sync in (0, 3) and (not self.block_lock or self.lose_lock(sync))
+
+    def step(self, vld, sync, payload):
+        """ clock one cycle with the input block """
+        valid = sync in (SYNC_DATA, SYNC_CTRL)
+        lose_lock = vld and self.lose_lock(sync)
+        self.out_vld = vld and self.block_lock and not lose_lock
+        if not vld:
+            return
+        self.out_ctrl = sync == SYNC_CTRL
+        self.out_err = not valid
+        self.out_data = self.descrambler.step(payload)
+        if not self.block_lock:
+            if not valid:
+                self.sh_cnt = 0
+            elif self.sh_cnt == self.lock_cnt - 1:
+                self.block_lock = True
+                self.sh_cnt = 0
+                self.invld = 0
+            else:
+                self.sh_cnt += 1
+        elif lose_lock:
+            self.block_lock = False
+            self.sh_cnt = 0
+            self.invld = 0
+        elif self.sh_cnt == self.window - 1:
+            self.sh_cnt = 0
+            self.invld = 0
+        else:
+            self.sh_cnt += 1
+            self.invld += not valid
+
+########################################
+# Gearbox
+########################################
+
+def block_bits(sync, payload):
+    """ (n, 66) bit array of the blocks in line order """
+    sync_bits = np.stack([np.asarray(sync, dtype=np.uint8) & 0x1, np.asarray(sync, dtype=np.uint8) >> 1], axis=1)
+    return np.concatenate([sync_bits, to_bits(payload, 64)], axis=1)
+
+def gearbox_tx(sync, payload, ow):
+    """
+    Same as gearbox_tx_66b.sv with the blocks always available
+    @return: uint64 array of the ow bit words, the last partial word is not included
+    """
+    bits = block_bits(sync, payload).reshape(-1)
+    words = bits.size // ow
+    return from_bits(bits[:words * ow].reshape(words, ow))
+
+class GearboxRx():
+
+    def __init__(self, ow):
+        """ Same as gearbox_rx_66b.sv. Cycle model, step() is one clock """
+        self.ow = ow
+        self.buffer = 0
+        self.cnt = 0
+        # registered outputs
+        self.out_vld = False
+        self.out_block = 0
+
+    def step(self, vld, data, slip):
+        """ clock one cycle with the input word and the slip request """
+        bits = self.buffer | ((data if vld else 0) << self.cnt)
+        total = self.cnt + (self.ow if vld else 0)
+        if slip and total:
+            bits >>= 1
+            total -= 1
+        self.out_vld = total >= 66
+        if self.out_vld:
+            self.out_block = bits & ((1 << 66) - 1)
+            bits >>= 66
+            total -= 66
+        self.buffer = bits
+        self.cnt = total
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the equations of the 64b/66b parallel scrambler")
+    parser.add_argument('-w', '--width', type=int, default=64, help="number of bits per cycle (default 64)")
+    args = parser.parse_args()
+    a, b = scrambler_matrix(args.width)
+    for line in equations(args.width):
+        print(line)
+    terms = int(a.sum() + b.sum())
+    print(f"// {terms} terms, {terms - args.width} XOR2, at most {int((a.sum(axis=1) + b.sum(axis=1)).max())} terms per bit")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+8b/10b tables and model, same as enc_8b_10b.sv and dec_8b_10b.sv
+Generate the decoder ROM dec_8b_10b_rom.sv
+numpy is required
+https://numpy.org/
+------------------------------------------------------------------------------------------------
+The 10 bit code is abcdeifghj with a at bit 9, same as enc_8b_10b. RD is 0 for -1 and 1 for +1.
+
+The encode table is built from the 5b/6b and 3b/4b sub-block tables. The decode table has one
+entry for each of the 1024 codes:
+
+    data:   decoded byte
+    k:      control character
+    rd_ok:  bit 0 set if the code is a valid encoding with RD = -1, bit 1 for RD = +1
+    disp:   disparity of the code (-2, 0 or +2)
+
+A code with rd_ok = 0 is a code violation. A code that is valid but not for the current RD is a
+disparity error. The RD after a code is +1 (-1) if its disparity is positive (negative) and not
+changed otherwise.
+------------------------------------------------------------------------------------------------
+Example:
+Generate the decoder ROM
+    python3 Codec8b10b.py -o ../rtl/dec_8b_10b_rom.sv
+------------------------------------------------------------------------------------------------
+"""
+
+import argparse
+import numpy as np
+
+# 5b/6b code abcdei for (RD = -1, RD = +1)
+TABLE_5B6B = [
+    (0b100111, 0b011000), (0b011101, 0b100010), (0b101101, 0b010010), (0b110001, 0b110001),
+    (0b110101, 0b001010), (0b101001, 0b101001), (0b011001, 0b011001), (0b111000, 0b000111),
+    (0b111001, 0b000110), (0b100101, 0b100101), (0b010101, 0b010101), (0b110100, 0b110100),
+    (0b001101, 0b001101), (0b101100, 0b101100), (0b011100, 0b011100), (0b010111, 0b101000),
+    (0b011011, 0b100100), (0b100011, 0b100011), (0b010011, 0b010011), (0b110010, 0b110010),
+    (0b001011, 0b001011), (0b101010, 0b101010), (0b011010, 0b011010), (0b111010, 0b000101),
+    (0b110011, 0b001100), (0b100110, 0b100110), (0b010110, 0b010110), (0b110110, 0b001001),
+    (0b001110, 0b001110), (0b101110, 0b010001), (0b011110, 0b100001), (0b101011, 0b010100),
+]
+K28_6B = (0b001111, 0b110000)
+
+# 3b/4b code fghj for (RD = -1, RD = +1), RD after the 6b sub-block
+TABLE_3B4B = [
+    (0b1011, 0b0100), (0b1001, 0b1001), (0b0101, 0b0101), (0b1100, 0b0011),
+    (0b1101, 0b0010), (0b1010, 0b1010), (0b0110, 0b0110), (0b1110, 0b0001),
+]
+A7_4B = (0b0111, 0b1000)
+TABLE_K3B4B = [
+    (0b1011, 0b0100), (0b0110, 0b1001), (0b1010, 0b0101), (0b1100, 0b0011),
+    (0b1101, 0b0010), (0b0101, 0b1010), (0b1001, 0b0110), (0b0111, 0b1000),
+]
+
+# valid control characters
+K_CODES = [28 | (y << 5) for y in range(8)] + [x | (7 << 5) for x in (23, 27, 29, 30)]
+
+def disparity(code, width):
+    ones = bin(code).count("1")
+    return 2 * ones - width
+
+def next_rd(rd, disp):
+    return rd if disp == 0 else int(disp > 0)
+
+def encode(byte, k, rd):
+    """
+    encode one byte
+    @return: 10 bit code, RD after the code. None if k is set and byte is not a control character
+    """
+    x = byte & 0x1f
+    y = byte >> 5
+    if k:
+        if byte not in K_CODES:
+            return None
+        code6 = K28_6B[rd] if x == 28 else TABLE_5B6B[x][rd]
+        rd6 = next_rd(rd, disparity(code6, 6))
+        code4 = TABLE_K3B4B[y][rd6]
+    else:
+        code6 = TABLE_5B6B[x][rd]
+        rd6 = next_rd(rd, disparity(code6, 6))
+        use_a7 = y == 7 and ((rd6 == 0 and x in (17, 18, 20)) or (rd6 == 1 and x in (11, 13, 14)))
+        code4 = A7_4B[rd6] if use_a7 else TABLE_3B4B[y][rd6]
+    rd4 = next_rd(rd6, disparity(code4, 4))
+    return (code6 << 4) | code4, rd4
+
+def build_decode_table():
+    """ the 1024 entry decode table """
+    table = {
+        "data":  np.zeros(1024, dtype=np.uint8),
+        "k":     np.zeros(1024, dtype=np.uint8),
+        "rd_ok": np.zeros(1024, dtype=np.uint8),
+        "disp":  np.array([disparity(code, 10) for code in range(1024)], dtype=np.int8),
+    }
+    for k in (0, 1):
+        for byte in (K_CODES if k else range(256)):
+            for rd in (0, 1):
+                code, _ = encode(byte, k, rd)
+                table["data"][code] = byte
+                table["k"][code] = k
+                table["rd_ok"][code] |= 1 << rd
+    return table
+
+DECODE = build_decode_table()
+
+def running_disparity(codes, rd):
+    """
+    RD before each code of a stream, vectorized
+    @param codes: array of 10 bit codes
+    @param rd: RD before the first code
+    @return: RD before each code, RD after the last code
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    disp = DECODE["disp"][codes]
+    # the RD before code n is set by the last code before n with non zero disparity
+    sign = np.concatenate([[rd], (disp > 0).astype(np.int64)])
+    changed = np.concatenate([[True], disp != 0])
+    last = np.maximum.accumulate(np.where(changed, np.arange(len(codes) + 1), 0))
+    rds = sign[last]
+    return rds[:-1], int(rds[-1])
+
+def decode(codes, rd=0):
+    """
+    decode a stream of codes, same as dec_8b_10b
+    @return: dict of arrays data, k, code_err, disp_err and the RD after the last code
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    rds, rd_out = running_disparity(codes, rd)
+    rd_ok = DECODE["rd_ok"][codes]
+    code_err = rd_ok == 0
+    disp_err = ~code_err & (((rd_ok >> rds) & 0x1) == 0)
+    return {
+        "data": DECODE["data"][codes],
+        "k": DECODE["k"][codes],
+        "code_err": code_err.astype(np.uint8),
+        "disp_err": disp_err.astype(np.uint8),
+    }, rd_out
+
+def encode_stream(data, k, rd=0):
+    """ encode a stream of bytes, return the codes and the RD after the last code """
+    codes = np.zeros(len(data), dtype=np.int64)
+    for i, (byte, kk) in enumerate(zip(data, k)):
+        codes[i], rd = encode(int(byte), int(kk), rd)
+    return codes, rd
+
+def rom(name="dec_8b_10b_rom"):
+    """ the decoder ROM in verilog """
+    lines = [
+        "// ------------------------------------------------------------------------------------------------",
+        "// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)",
+        "// ------------------------------------------------------------------------------------------------",
+        "// Generated by Codec8b10b.py",
+        "// ------------------------------------------------------------------------------------------------",
+        "// 8b/10b decode table",
+        "// entry: {rd_ok[1:0], k, data[7:0]}, rd_ok[0]/rd_ok[1]: the code is valid for RD = -1/+1",
+        "// ------------------------------------------------------------------------------------------------",
+        "",
+        f"module {name} (",
+        "    input  logic [9:0]  code,",
+        "    output logic [10:0] entry",
+        ");",
+        "",
+        "    always @(*) begin",
+        "        case(code)",
+    ]
+    for code in range(1024):
+        if DECODE["rd_ok"][code]:
+            entry = (int(DECODE["rd_ok"][code]) << 9) | (int(DECODE["k"][code]) << 8) | int(DECODE["data"][code])
+            lines.append(f"            10'b{code:010b}: entry = 11'b{entry:011b};")
+    lines += [
+        "            default: entry = 11'b0;",
+        "        endcase",
+        "    end",
+        "",
+        "endmodule",
+        "",
+    ]
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the 8b/10b decoder ROM")
+    parser.add_argument('-o', '--output', type=str, default="dec_8b_10b_rom.sv", help="output file (default dec_8b_10b_rom.sv)")
+    args = parser.parse_args()
+    with open(args.output, 'w') as f:
+        f.write(rom())
+    print(f"{int(np.count_nonzero(DECODE['rd_ok']))} valid codes written to {args.output}")
+
+if __name__ == "__main__":
+    main()
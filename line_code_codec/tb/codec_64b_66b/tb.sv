@@ -0,0 +1,157 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Testbench for 64b/66b encoder/decoder and gearbox
+// Two chains, with 64 bit and 32 bit line width. Each chain has a TX side (encoder + gearbox) and
+// a RX side (gearbox + decoder). The line between them is driven by the test.
+// ------------------------------------------------------------------------------------------------
+
+module tb();
+
+    logic           clk;
+    logic           rst_b;
+
+    // ------------------------------
+    // 64 bit line
+    // ------------------------------
+
+    logic           enc_in_vld_64;
+    logic           enc_in_ready_64;
+    logic           enc_in_ctrl_64;
+    logic [63:0]    enc_in_data_64;
+    logic           enc_out_vld_64;
+    logic           enc_out_ready_64;
+    logic [65:0]    enc_out_block_64;
+    logic           tx_vld_64;
+    logic [63:0]    tx_data_64;
+
+    logic           rx_vld_64;
+    logic [63:0]    rx_data_64;
+    logic           rx_blk_vld_64;
+    logic [65:0]    rx_blk_64;
+    logic           slip_64;
+    logic           block_lock_64;
+    logic           dec_out_vld_64;
+    logic           dec_out_ctrl_64;
+    logic           dec_out_err_64;
+    logic [63:0]    dec_out_data_64;
+
+    enc_64b_66b
+    u_enc_64 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(enc_in_vld_64),
+        .in_ready(enc_in_ready_64),
+        .in_ctrl(enc_in_ctrl_64),
+        .in_data(enc_in_data_64),
+        .out_vld(enc_out_vld_64),
+        .out_ready(enc_out_ready_64),
+        .out_block(enc_out_block_64));
+
+    gearbox_tx_66b #(.OW(64))
+    u_gearbox_tx_64 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(enc_out_vld_64),
+        .in_ready(enc_out_ready_64),
+        .in_block(enc_out_block_64),
+        .out_vld(tx_vld_64),
+        .out_data(tx_data_64));
+
+    gearbox_rx_66b #(.OW(64))
+    u_gearbox_rx_64 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(rx_vld_64),
+        .in_data(rx_data_64),
+        .slip(slip_64),
+        .out_vld(rx_blk_vld_64),
+        .out_block(rx_blk_64));
+
+    dec_64b_66b
+    u_dec_64 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(rx_blk_vld_64),
+        .in_block(rx_blk_64),
+        .slip(slip_64),
+        .block_lock(block_lock_64),
+        .out_vld(dec_out_vld_64),
+        .out_ctrl(dec_out_ctrl_64),
+        .out_err(dec_out_err_64),
+        .out_data(dec_out_data_64));
+
+    // ------------------------------
+    // 32 bit line
+    // ------------------------------
+
+    logic           enc_in_vld_32;
+    logic           enc_in_ready_32;
+    logic           enc_in_ctrl_32;
+    logic [63:0]    enc_in_data_32;
+    logic           enc_out_vld_32;
+    logic           enc_out_ready_32;
+    logic [65:0]    enc_out_block_32;
+    logic           tx_vld_32;
+    logic [31:0]    tx_data_32;
+
+    logic           rx_vld_32;
+    logic [31:0]    rx_data_32;
+    logic           rx_blk_vld_32;
+    logic [65:0]    rx_blk_32;
+    logic           slip_32;
+    logic           block_lock_32;
+    logic           dec_out_vld_32;
+    logic           dec_out_ctrl_32;
+    logic           dec_out_err_32;
+    logic [63:0]    dec_out_data_32;
+
+    enc_64b_66b
+    u_enc_32 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(enc_in_vld_32),
+        .in_ready(enc_in_ready_32),
+        .in_ctrl(enc_in_ctrl_32),
+        .in_data(enc_in_data_32),
+        .out_vld(enc_out_vld_32),
+        .out_ready(enc_out_ready_32),
+        .out_block(enc_out_block_32));
+
+    gearbox_tx_66b #(.OW(32))
+    u_gearbox_tx_32 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(enc_out_vld_32),
+        .in_ready(enc_out_ready_32),
+        .in_block(enc_out_block_32),
+        .out_vld(tx_vld_32),
+        .out_data(tx_data_32));
+
+    gearbox_rx_66b #(.OW(32))
+    u_gearbox_rx_32 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(rx_vld_32),
+        .in_data(rx_data_32),
+        .slip(slip_32),
+        .out_vld(rx_blk_vld_32),
+        .out_block(rx_blk_32));
+
+    dec_64b_66b
+    u_dec_32 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(rx_blk_vld_32),
+        .in_block(rx_blk_32),
+        .slip(slip_32),
+        .block_lock(block_lock_32),
+        .out_vld(dec_out_vld_32),
+        .out_ctrl(dec_out_ctrl_32),
+        .out_err(dec_out_err_32),
+        .out_data(dec_out_data_32));
+
+endmodule
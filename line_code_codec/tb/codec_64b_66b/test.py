@@ -0,0 +1,229 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Testbench for 64b/66b encoder/decoder and gearbox
+# ------------------------------------------------------------------------------------------------
+
+import cocotb
+from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.clock import Clock
+from Codec64b66b import Encoder64b66b, Decoder64b66b, GearboxRx, gearbox_tx
+import numpy as np
+import random
+
+LOCK_CNT = 64
+
+class Chain():
+
+    def __init__(self, dut, ow, offset=0):
+        """
+        One TX/RX chain of tb.sv, the line is a bit queue between the TX gearbox and the RX gearbox
+        @param ow: line width, 64 or 32
+        @param offset: number of random bits sent on the line before the first block
+        """
+        self.dut = dut
+        self.ow = ow
+        self.sig = lambda name: getattr(dut, f"{name}_{ow}")
+        # the RX side is compared with the model every cycle
+        self.gearbox = GearboxRx(ow)
+        self.decoder = Decoder64b66b(LOCK_CNT)
+        # line
+        self.line = random.getrandbits(offset) if offset else 0
+        self.line_bits = offset
+        self.offset = offset
+        self.line_pos = 0           # position of the next TX bit in the block stream
+        self.corrupt = {}           # block index: bit flip mask of the block
+        # results
+        self.sent = 0
+        self.ready_cycles = []
+        self.tx_words = []
+        self.decoded = []
+        self.lock_cycles = []
+        for name in ["enc_in_vld", "enc_in_ctrl", "enc_in_data", "rx_vld", "rx_data"]:
+            self.sig(name).value = 0
+
+    def tx(self, data, ctrl, cycle):
+        """ drive the next block into the encoder and push the TX gearbox output onto the line """
+        ready = self.sig("enc_in_ready").value.integer
+        if ready and self.sent < len(data):
+            self.sig("enc_in_vld").value = 1
+            self.sig("enc_in_ctrl").value = int(ctrl[self.sent])
+            self.sig("enc_in_data").value = int(data[self.sent])
+            self.sent += 1
+            self.ready_cycles.append(cycle)
+        else:
+            self.sig("enc_in_vld").value = 0
+        if self.sig("tx_vld").value.integer:
+            word = self.sig("tx_data").value.integer
+            self.tx_words.append(word)
+            word ^= self.errors(self.line_pos)
+            self.line |= word << self.line_bits
+            self.line_bits += self.ow
+            self.line_pos += self.ow
+
+    def errors(self, pos):
+        """ bit flips of the line word starting at position pos of the block stream """
+        mask = 0
+        for block in range(pos // 66, (pos + self.ow - 1) // 66 + 1):
+            if block in self.corrupt:
+                shift = block * 66 - pos
+                mask |= (self.corrupt[block] << shift) if shift >= 0 else (self.corrupt[block] >> -shift)
+        return mask & ((1 << self.ow) - 1)
+
+    def rx(self, cycle):
+        """ compare the RX side with the model, then drive the next line word """
+        dut_blk_vld = self.sig("rx_blk_vld").value.integer
+        assert dut_blk_vld == self.gearbox.out_vld, f"cycle {cycle}: rx_blk_vld mismatch"
+        sync = payload = 0
+        if dut_blk_vld:
+            block = self.sig("rx_blk").value.integer
+            assert block == self.gearbox.out_block, \
+                f"cycle {cycle}: rx block = {hex(block)}, expected {hex(self.gearbox.out_block)}"
+            sync = block & 0x3
+            payload = block >> 2
+        slip = self.decoder.slip(dut_blk_vld, sync)
+        assert self.sig("slip").value.integer == slip, f"cycle {cycle}: slip mismatch"
+        lock = self.sig("block_lock").value.integer
+        assert lock == self.decoder.block_lock, f"cycle {cycle}: block_lock mismatch"
+        if lock:
+            self.lock_cycles.append(cycle)
+        out_vld = self.sig("dec_out_vld").value.integer
+        assert out_vld == self.decoder.out_vld, f"cycle {cycle}: dec_out_vld mismatch"
+        if out_vld:
+            out = (self.sig("dec_out_ctrl").value.integer, self.sig("dec_out_err").value.integer,
+                   self.sig("dec_out_data").value.integer)
+            expected = (int(self.decoder.out_ctrl), int(self.decoder.out_err), self.decoder.out_data)
+            assert out == expected, f"cycle {cycle}: decoder output = {out}, expected {expected}"
+            self.decoded.append(out)
+        # next line word
+        vld = self.line_bits >= self.ow
+        word = self.line & ((1 << self.ow) - 1) if vld else 0
+        if vld:
+            self.line >>= self.ow
+            self.line_bits -= self.ow
+        self.sig("rx_vld").value = int(vld)
+        self.sig("rx_data").value = word
+        self.decoder.step(dut_blk_vld, sync, payload)
+        self.gearbox.step(vld, word, slip)
+
+########################################
+# Test functions
+########################################
+
+async def setup(dut):
+    dut.rst_b.value = 0
+    chains = {ow: Chain(dut, ow) for ow in [64, 32]}
+    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    await Timer(20, units="ns")
+    return chains
+
+async def run(dut, chain, data, ctrl, cycles):
+    await FallingEdge(dut.clk)
+    dut.rst_b.value = 1
+    for cycle in range(cycles):
+        await FallingEdge(dut.clk)
+        chain.tx(data, ctrl, cycle)
+        chain.rx(cycle)
+
+def random_blocks(rng, n):
+    data = rng.integers(0, 1 << 64, n, dtype=np.uint64)
+    ctrl = rng.random(n) < 0.1
+    return data, ctrl
+
+def check_tx(chain, data, ctrl):
+    """ the line words are the same as the model """
+    sync, payload = Encoder64b66b().run(data, ctrl)
+    expected = gearbox_tx(sync, payload, chain.ow)
+    n = min(len(chain.tx_words), len(expected))
+    assert n > 0 and all(int(expected[i]) == chain.tx_words[i] for i in range(n)), "TX line words mismatch"
+
+def check_throughput(dut, chain, start, period=33):
+    """ the gearbox takes 66 bits per ow bits every cycle: ow * 33 / 66 blocks per 33 cycles """
+    ready = np.array(chain.ready_cycles)
+    ready = ready[ready >= start]
+    rounds = (ready[-1] - start) // period
+    counts = np.bincount((ready - start) // period, minlength=rounds)[:rounds]
+    expected = chain.ow * period // 66
+    dut._log.info(f"OW = {chain.ow}: {counts.mean():.2f} blocks per {period} cycles, "
+                  f"{counts.mean() * 64 / period:.2f} payload bits per cycle")
+    assert np.all(counts == expected), f"blocks per {period} cycles = {counts.tolist()}, expected {expected}"
+
+def first_decoded(chain, data):
+    """ index of the first decoded block in the sent blocks """
+    start = np.nonzero(data == np.uint64(chain.decoded[0][2]))[0]
+    assert len(start) == 1, "Can not find the decoded block in the sent blocks"
+    return int(start[0])
+
+def check_decoded(chain, data, ctrl):
+    """ the decoded blocks are a contiguous part of the sent blocks """
+    start = first_decoded(chain, data)
+    for k, (out_ctrl, out_err, out_data) in enumerate(chain.decoded):
+        assert out_data == int(data[start + k]) and out_ctrl == int(ctrl[start + k]) and not out_err, \
+            f"decoded block {k} = {hex(out_data)}, expected {hex(int(data[start + k]))}"
+
+async def tester_loopback(dut, ow, nblocks):
+    """ random blocks with a random bit offset on the line, the RX side should lock and decode them """
+    chains = await setup(dut)
+    chain = chains[ow] = Chain(dut, ow, random.randint(0, 65))
+    rng = np.random.default_rng(random.getrandbits(32))
+    data, ctrl = random_blocks(rng, nblocks)
+    # stop before running out of blocks
+    cycles = nblocks * 66 // ow - 10
+    await run(dut, chain, data, ctrl, cycles)
+    check_tx(chain, data, ctrl)
+    check_throughput(dut, chain, 10)
+    assert chain.lock_cycles, "Block lock is not acquired"
+    first_lock = chain.lock_cycles[0]
+    dut._log.info(f"OW = {ow}, offset = {chain.offset}: block lock after {first_lock} cycles")
+    assert first_lock * ow // 66 < 600, "Block lock takes too long"
+    assert len(chain.lock_cycles) == cycles - first_lock, "Block lock is lost"
+    check_decoded(chain, data, ctrl)
+
+@cocotb.test()
+async def test_loopback_64(dut):
+    await tester_loopback(dut, 64, 3000)
+
+@cocotb.test()
+async def test_loopback_32(dut):
+    await tester_loopback(dut, 32, 3000)
+
+@cocotb.test()
+async def test_lock_loss(dut):
+    """ less than 16 bad headers keep the lock, then 32 bad headers in a row lose it """
+    chains = await setup(dut)
+    chain = chains[64] = Chain(dut, 64, random.randint(0, 65))
+    rng = np.random.default_rng(random.getrandbits(32))
+    data, ctrl = random_blocks(rng, 2000)
+    for block in range(1000, 1015):
+        chain.corrupt[block] = 0x1
+    for block in range(1500, 1532):
+        chain.corrupt[block] = 0x1
+    await run(dut, chain, data, ctrl, 1900)
+    errors = sum(out[1] for out in chain.decoded)
+    dut._log.info(f"bad headers reported = {errors}, locked cycles = {len(chain.lock_cycles)}")
+    lost = [c for c, n in zip(chain.lock_cycles, chain.lock_cycles[1:]) if n != c + 1]
+    assert len(lost) == 1, f"Block lock should be lost once, lost {len(lost)} times"
+    assert chain.lock_cycles[-1] == 1899, "Block lock is not recovered"
+    assert errors >= 15, "Bad headers are not reported"
+
+@cocotb.test()
+async def test_bit_error(dut):
+    """ one bit error in the payload gives 3 bit errors after the descrambler """
+    chains = await setup(dut)
+    chain = chains[64] = Chain(dut, 64)
+    rng = np.random.default_rng(random.getrandbits(32))
+    data, ctrl = random_blocks(rng, 1000)
+    bit = random.randint(0, 63)
+    chain.corrupt[500] = 1 << (bit + 2)
+    await run(dut, chain, data, ctrl, 1000 * 64 // 66)
+    decoded = [out[2] for out in chain.decoded]
+    start = first_decoded(chain, data)
+    diff = [decoded[k] ^ int(data[start + k]) for k in range(len(decoded))]
+    error_bits = sum(bin(d).count("1") for d in diff)
+    dut._log.info(f"bit {bit} of block 500 flipped, {error_bits} bit errors after the descrambler")
+    expected = {500 * 64 + bit, 500 * 64 + bit + 39, 500 * 64 + bit + 58}
+    actual = {(start + k) * 64 + i for k, d in enumerate(diff) for i in range(64) if (d >> i) & 0x1}
+    assert actual == expected, f"error bits at {sorted(actual)}, expected {sorted(expected)}"
@@ -0,0 +1,147 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// Testbench for 8b/10b decoder
+// The encoder is looped back into the decoder at full rate, with 4 lanes and 1 lane.
+// The codes on the line are XOR-ed with err_mask to inject bit errors.
+// ------------------------------------------------------------------------------------------------
+
+module tb();
+
+    logic               clk;
+    logic               rst_b;
+
+    // ------------------------------
+    // 4 lanes
+    // ------------------------------
+
+    logic               enc_vld_4;
+    logic [31:0]        enc_data_4;
+    logic [3:0]         enc_k_4;
+    logic [4:0]         enc_rd_4;
+    logic [39:0]        enc_code_4;
+    logic               enc_rdisp_4;
+
+    logic               line_vld_4;
+    logic [39:0]        line_4;
+    logic [39:0]        err_mask_4;
+
+    logic               dec_vld_4;
+    logic [31:0]        dec_data_4;
+    logic [3:0]         dec_k_4;
+    logic [3:0]         code_err_4;
+    logic [3:0]         disp_err_4;
+    logic               dec_rdisp_4;
+
+    assign enc_rd_4[0] = enc_rdisp_4;
+
+    for (genvar l = 0; l < 4; l = l + 1) begin: enc_lane_4
+        enc_8b_10b #(.OUT_FLOP(0))
+        u_enc (
+            .clk(clk),
+            .rst_b(rst_b),
+            .datain_8b(enc_data_4[l*8+7:l*8]),
+            .kin(enc_k_4[l]),
+            .rdispin(enc_rd_4[l]),
+            .dataout_10b(enc_code_4[l*10+9:l*10]),
+            .rdispout(enc_rd_4[l+1]),
+            .k_err());
+    end
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            enc_rdisp_4 <= 1'b0;
+            line_vld_4 <= 1'b0;
+            line_4 <= '0;
+        end
+        else begin
+            line_vld_4 <= enc_vld_4;
+            if (enc_vld_4) begin
+                enc_rdisp_4 <= enc_rd_4[4];
+                line_4 <= enc_code_4;
+            end
+        end
+    end
+
+    dec_8b_10b #(.LANES(4))
+    u_dec_4 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(line_vld_4),
+        .datain_10b(line_4 ^ err_mask_4),
+        .out_vld(dec_vld_4),
+        .dataout_8b(dec_data_4),
+        .kout(dec_k_4),
+        .code_err(code_err_4),
+        .disp_err(disp_err_4),
+        .rdisp(dec_rdisp_4));
+
+    // ------------------------------
+    // 1 lane
+    // ------------------------------
+
+    logic               enc_vld_1;
+    logic [7:0]         enc_data_1;
+    logic [0:0]         enc_k_1;
+    logic [1:0]         enc_rd_1;
+    logic [9:0]         enc_code_1;
+    logic               enc_rdisp_1;
+
+    logic               line_vld_1;
+    logic [9:0]         line_1;
+    logic [9:0]         err_mask_1;
+
+    logic               dec_vld_1;
+    logic [7:0]         dec_data_1;
+    logic [0:0]         dec_k_1;
+    logic [0:0]         code_err_1;
+    logic [0:0]         disp_err_1;
+    logic               dec_rdisp_1;
+
+    assign enc_rd_1[0] = enc_rdisp_1;
+
+    for (genvar l = 0; l < 1; l = l + 1) begin: enc_lane_1
+        enc_8b_10b #(.OUT_FLOP(0))
+        u_enc (
+            .clk(clk),
+            .rst_b(rst_b),
+            .datain_8b(enc_data_1[l*8+7:l*8]),
+            .kin(enc_k_1[l]),
+            .rdispin(enc_rd_1[l]),
+            .dataout_10b(enc_code_1[l*10+9:l*10]),
+            .rdispout(enc_rd_1[l+1]),
+            .k_err());
+    end
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            enc_rdisp_1 <= 1'b0;
+            line_vld_1 <= 1'b0;
+            line_1 <= '0;
+        end
+        else begin
+            line_vld_1 <= enc_vld_1;
+            if (enc_vld_1) begin
+                enc_rdisp_1 <= enc_rd_1[1];
+                line_1 <= enc_code_1;
+            end
+        end
+    end
+
+    dec_8b_10b #(.LANES(1))
+    u_dec_1 (
+        .clk(clk),
+        .rst_b(rst_b),
+        .in_vld(line_vld_1),
+        .datain_10b(line_1 ^ err_mask_1),
+        .out_vld(dec_vld_1),
+        .dataout_8b(dec_data_1),
+        .kout(dec_k_1),
+        .code_err(code_err_1),
+        .disp_err(disp_err_1),
+        .rdisp(dec_rdisp_1));
+
+endmodule
@@ -0,0 +1,173 @@
+# ------------------------------------------------------------------------------------------------
+# Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+# ------------------------------------------------------------------------------------------------
+# Author: Heqing Huang
+# Date Created: 10/19/2026
+# ------------------------------------------------------------------------------------------------
+# Testbench for 8b/10b decoder
+# The bit error rate on the line can be set with the environment variable BER, e.g.
+#   make BER=1e-2
+# ------------------------------------------------------------------------------------------------
+
+import cocotb
+from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.clock import Clock
+from Codec8b10b import K_CODES, encode_stream, decode
+import numpy as np
+import random
+import time
+import os
+
+BER = float(os.environ.get("BER", "1e-3"))
+
+class Loopback():
+
+    def __init__(self, dut, lanes):
+        """
+        Encoder looped back into the decoder in tb.sv
+        @param lanes: number of lanes, 4 or 1
+        """
+        self.lanes = lanes
+        self.sig = lambda name: getattr(dut, f"{name}_{lanes}")
+        self.line = []          # codes on the line
+        self.mask = []          # error injected on the line
+        self.decoded = {"data": [], "k": [], "code_err": [], "disp_err": []}
+        for name in ["enc_vld", "enc_data", "enc_k", "err_mask"]:
+            self.sig(name).value = 0
+
+    def split(self, value, width):
+        return [(value >> (l * width)) & ((1 << width) - 1) for l in range(self.lanes)]
+
+    def join(self, values, width):
+        return sum(int(value) << (l * width) for l, value in enumerate(values))
+
+    def cycle(self, data, k, mask):
+        """
+        drive one cycle: data/k into the encoder and mask on the line, and record the outputs
+        @param data, k, mask: lists of values for each lane, data is None for an idle cycle
+        """
+        if self.sig("dec_vld").value.integer:
+            self.decoded["data"] += self.split(self.sig("dec_data").value.integer, 8)
+            self.decoded["k"] += self.split(self.sig("dec_k").value.integer, 1)
+            self.decoded["code_err"] += self.split(self.sig("code_err").value.integer, 1)
+            self.decoded["disp_err"] += self.split(self.sig("disp_err").value.integer, 1)
+        if self.sig("line_vld").value.integer:
+            self.line += self.split(self.sig("line").value.integer, 10)
+            self.mask += list(mask)
+            self.sig("err_mask").value = self.join(mask, 10)
+        else:
+            self.sig("err_mask").value = 0
+        self.sig("enc_vld").value = int(data is not None)
+        if data is not None:
+            self.sig("enc_data").value = self.join(data, 8)
+            self.sig("enc_k").value = self.join(k, 1)
+
+########################################
+# Test functions
+########################################
+
+async def setup(dut):
+    chains = {lanes: Loopback(dut, lanes) for lanes in [4, 1]}
+    dut.rst_b.value = 0
+    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    await Timer(20, units="ns")
+    await FallingEdge(dut.clk)
+    dut.rst_b.value = 1
+    return chains
+
+def random_symbols(rng, n, k_rate=0.05):
+    """ random data bytes with some valid control characters """
+    data = rng.integers(0, 256, n)
+    k = (rng.random(n) < k_rate).astype(np.int64)
+    data[k == 1] = rng.choice(K_CODES, int(k.sum()))
+    return data, k
+
+def error_masks(rng, n, ber):
+    """ 10 bit error masks, each bit is flipped with probability ber """
+    bits = rng.random((n, 10)) < ber
+    return (bits * (1 << np.arange(10))).sum(axis=1)
+
+async def run(dut, chain, data, k, masks):
+    """ send the symbols at full rate, then flush the pipeline """
+    lanes = chain.lanes
+    cycles = len(data) // lanes
+    start = time.time()
+    for c in range(cycles + 3):
+        await FallingEdge(dut.clk)
+        idx = slice(c * lanes, (c + 1) * lanes)
+        # the codes on the line in this cycle are the ones sent in the previous cycle
+        mask = masks[(c - 1) * lanes:c * lanes] if c >= 1 else []
+        if c < cycles:
+            chain.cycle(data[idx], k[idx], mask)
+        else:
+            chain.cycle(None, None, mask)
+    wall = time.time() - start
+    dut._log.info(f"{lanes} lane(s): {len(data)} symbols in {cycles} cycles, "
+                  f"{len(data) / cycles:.2f} symbols per cycle, {len(data) / wall:.0f} symbols/s simulated")
+
+def check(dut, chain, data, k, masks):
+    """ compare the decoder outputs with the decode table """
+    n = len(data)
+    expected_codes, _ = encode_stream(data, k)
+    line = np.array(chain.line[:n])
+    assert np.array_equal(line, expected_codes), "Encoder output mismatch"
+    received = line ^ np.asarray(masks[:n])
+    start = time.time()
+    expected, _ = decode(received)
+    model_time = time.time() - start
+    for name in ["data", "k", "code_err", "disp_err"]:
+        actual = np.array(chain.decoded[name][:n])
+        mismatch = np.nonzero(actual != expected[name])[0]
+        assert len(mismatch) == 0, \
+            f"{name} mismatch at symbol {mismatch[0]}: code = {received[mismatch[0]]:010b}, " \
+            f"{name} = {actual[mismatch[0]]}, expected {expected[name][mismatch[0]]}"
+    corrupted = np.asarray(masks[:n]) != 0
+    flagged = (expected["code_err"] | expected["disp_err"]) != 0
+    wrong = (expected["data"] != data) | (expected["k"] != k)
+    dut._log.info(f"{chain.lanes} lane(s): {int(corrupted.sum())} corrupted symbols, "
+                  f"{int(expected['code_err'].sum())} code errors, {int(expected['disp_err'].sum())} disparity errors, "
+                  f"{int((wrong & ~flagged).sum())} wrong symbols not flagged. "
+                  f"Table decode: {n / max(model_time, 1e-9):.0f} symbols/s")
+
+async def tester_loopback(dut, lanes, n):
+    """ no error on the line, everything is decoded back """
+    chains = await setup(dut)
+    chain = chains[lanes]
+    rng = np.random.default_rng(random.getrandbits(32))
+    data, k = random_symbols(rng, n)
+    masks = np.zeros(n, dtype=np.int64)
+    await run(dut, chain, data, k, masks)
+    check(dut, chain, data, k, masks)
+    assert np.array_equal(np.array(chain.decoded["data"][:n]), data), "Data mismatch"
+    assert np.array_equal(np.array(chain.decoded["k"][:n]), k), "K mismatch"
+    assert sum(chain.decoded["code_err"]) + sum(chain.decoded["disp_err"]) == 0, "Error flagged without error"
+
+async def tester_bit_errors(dut, lanes, n, ber):
+    """ bit errors on the line, the flagged errors should match the decode table """
+    chains = await setup(dut)
+    chain = chains[lanes]
+    rng = np.random.default_rng(random.getrandbits(32))
+    data, k = random_symbols(rng, n)
+    masks = error_masks(rng, n, ber)
+    await run(dut, chain, data, k, masks)
+    check(dut, chain, data, k, masks)
+
+@cocotb.test()
+async def test_loopback_4(dut):
+    await tester_loopback(dut, 4, 20000)
+
+@cocotb.test()
+async def test_loopback_1(dut):
+    await tester_loopback(dut, 1, 5000)
+
+@cocotb.test()
+async def test_bit_errors_4(dut):
+    await tester_bit_errors(dut, 4, 20000, BER)
+
+@cocotb.test()
+async def test_bit_errors_4_high(dut):
+    await tester_bit_errors(dut, 4, 20000, BER * 10)
+
+@cocotb.test()
+async def test_bit_errors_1(dut):
+    await tester_bit_errors(dut, 1, 5000, BER * 10)
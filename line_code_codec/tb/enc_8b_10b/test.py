@@ -7,12 +7,16 @@
 # Testbench for 8b/10b encoder
 # The following module is required for the test
 # https://pypi.org/project/encdec8b10b/
+# Set COVERAGE=<dir> to save the coverage of test_random, merge the runs with Coverage.py merge.
 # ------------------------------------------------------------------------------------------------
 
 import cocotb
 from cocotb.triggers import Timer, RisingEdge, FallingEdge
 from cocotb.clock import Clock
 from encdec8b10b import EncDec8B10B
+from Codec8b10b import K_CODES, encode
+from Coverage import Coverage
+import random
 
 async def setup(dut):
     dut.datain_8b.value = 0
@@ -61,8 +65,60 @@ async def test_data_rd1(dut):
     """ Test all data with RD=-1 """
     await tester(dut, 0, range(0,256), 1)
 
+async def tester_random(dut, max_cycles):
+    """
+    random data, control characters and RD until every byte and every control character has been
+    encoded with both RD, checked with the table model in Codec8b10b.py
+    """
+    await setup(dut)
+    cov = Coverage("enc_8b_10b_random")
+    rd_point = cov.point("rd", 2)
+    cov.cross("data_x_rd", cov.point("data", 256), rd_point)
+    cov.cross("k_x_rd", cov.point("k", len(K_CODES)), rd_point)
+    cov.point("k_err", 2)
+    cycles = 0
+    while not cov.done and cycles < max_cycles:
+        cycles += 1
+        rd = random.randint(0, 1)
+        kind = random.random()
+        if kind < 0.85:
+            byte, k = random.randint(0, 255), 0
+        elif kind < 0.95:
+            byte, k = random.choice(K_CODES), 1
+        else:
+            byte, k = random.choice([b for b in range(256) if b not in K_CODES]), 1
+        dut.datain_8b.value = byte
+        dut.rdispin.value = rd
+        dut.kin.value = k
+        await RisingEdge(dut.clk)
+        await FallingEdge(dut.clk)
+        dout = dut.dataout_10b.value.integer
+        rdispout = dut.rdispout.value.integer
+        k_err = dut.k_err.value.integer
+        expected = encode(byte, k, rd)
+        msg = f"data = {byte:#04x}, k = {k}, RD in = {rd}: code = {dout:010b}, RD out = {rdispout}, k_err = {k_err}"
+        if expected is None:
+            assert k_err == 1, dut._log.error(f"Error: k_err not set. {msg}")
+            cov.sample(k_err=1)
+            continue
+        assert k_err == 0, dut._log.error(f"Error: k_err set. {msg}")
+        assert (dout, rdispout) == expected, \
+            dut._log.error(f"Error: {msg}. Expected code = {expected[0]:010b}, RD out = {expected[1]}")
+        if k:
+            cov.sample(k=K_CODES.index(byte), rd=rd, k_err=0)
+        else:
+            cov.sample(data=byte, rd=rd, k_err=0)
+    dut._log.info(f"{cycles} cycles\n{cov.report(holes=8)}")
+    cov.save()
+    assert cov.done, dut._log.error(f"Coverage not closed after {max_cycles} cycles")
+
+@cocotb.test()
+async def test_random(dut):
+    """ Random data and control characters until the coverage is closed """
+    await tester_random(dut, 20000)
+
 # Note: The RD calculation is wrong in the model for control word?
 #@cocotb.test()
 async def test_control_rd0(dut):
     """ Test all data with RD=-1 """
-    await tester(dut, 1, range(0,256), 0)
\ No newline at end of file
+    await tester(dut, 1, range(0,256), 0)
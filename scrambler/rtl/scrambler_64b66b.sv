@@ -0,0 +1,74 @@
+// ------------------------------------------------------------------------------------------------
+// Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+// ------------------------------------------------------------------------------------------------
+// Author: Heqing Huang
+// Date Created: 10/19/2026
+// ------------------------------------------------------------------------------------------------
+// 64b/66b self-synchronizing scrambler/descrambler
+// ------------------------------------------------------------------------------------------------
+// Scrambler defined in IEEE 802.3 Clause 49.2.6
+//
+// Features:
+//      - W bits are scrambled per cycle (64 for the 64b/66b payload)
+//      - The polynomial is x^58 + x^39 + 1
+//      - The same module is used as descrambler with DESCRAMBLE = 1
+// ------------------------------------------------------------------------------------------------
+
+/* Design Notes:
+------------------------------
+* Self-synchronizing         *
+------------------------------
+Unlike scrambler_pcie (additive), the scrambler feeds back the scrambled bits. In serial form:
+
+    scrambler:   s[n] = d[n] ^ s[n-39] ^ s[n-58]
+    descrambler: d[n] = s[n] ^ s[n-39] ^ s[n-58]
+
+The descrambler only uses the received bits so it is synchronized after 58 bits without any
+seed or control character. A single bit error on the line gives 3 errors after descrambling.
+
+------------------------------
+* Parallel scrambling        *
+------------------------------
+The state holds the last 58 scrambled bits, state[57] is the latest one. Bit 0 of din is the
+first bit on the line. Let ext = {scrambled bits of this cycle, state}, then bit i of this cycle is:
+
+    dout[i] = din[i] ^ ext[i+19] ^ ext[i]
+
+ext[i+19] is a bit of this cycle when i >= 39, which was already calculated by the loop. The
+synthesis tool flattens the loop into at most 5 terms per bit. The equations can also be
+printed by line_code_codec/scripts/Codec64b66b.py.
+*/
+
+module scrambler_64b66b #(
+    parameter W = 64,                       // Number of bits per cycle
+    parameter DESCRAMBLE = 0,               // 0: scrambler, 1: descrambler
+    parameter [57:0] SEED = {58{1'b1}}      // Initial state
+) (
+    input  logic            clk,
+    input  logic            rst_b,
+    input  logic            en,             // din is valid, advance the state
+    input  logic [W-1:0]    din,
+    output logic [W-1:0]    dout            // dout is combinational from din
+);
+
+    logic [57:0]    state;
+    logic [W+57:0]  ext;
+
+    always @(*) begin
+        ext[57:0] = state;
+        for (int i = 0; i < W; i = i + 1) begin
+            dout[i] = din[i] ^ ext[i+19] ^ ext[i];
+            ext[58+i] = DESCRAMBLE ? din[i] : dout[i];
+        end
+    end
+
+    always @(posedge clk or negedge rst_b) begin
+        if (!rst_b) begin
+            state <= SEED;
+        end
+        else if (en) begin
+            state <= ext[W+57:W];
+        end
+    end
+
+endmodule
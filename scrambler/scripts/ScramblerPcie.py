@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""
+------------------------------------------------------------------------------------------------
+Copyright 2023 by Heqing Huang (feipenghhq@gamil.com)
+------------------------------------------------------------------------------------------------
+Author: Heqing Huang
+Date Created: 10/19/2026
+------------------------------------------------------------------------------------------------
+PCIe scrambler model, same as scrambler_pcie.sv
+------------------------------------------------------------------------------------------------
+The LFSR advances 8 bits per byte. The next LFSR value only depends on the current value, so it
+is looked up in a table of the 2^16 LFSR values built once from the equations of the RTL.
+
+    COM:        the LFSR is set to SEED, the byte is not scrambled
+    SKP:        the LFSR is not advanced, the byte is not scrambled
+    other K:    the LFSR is advanced, the byte is not scrambled
+    data:       dout = din ^ lfsr[7:0], the LFSR is advanced (dis_scrambler: not scrambled)
+------------------------------------------------------------------------------------------------
+Example:
+Print the first 16 scrambler bytes after COM
+    python3 ScramblerPcie.py -n 16
+------------------------------------------------------------------------------------------------
+"""
+
+import argparse
+
+SEED = 0xFFFF
+COM = 0xBC
+SKP = 0x1C
+
+# lfsr_next[i] = XOR of lfsr_current[j] for j in ROWS[i], same as scrambler_pcie.sv
+ROWS = [
+    [8], [9], [10], [8, 11], [8, 9, 12], [8, 9, 10, 13], [9, 10, 11, 14], [10, 11, 12, 15],
+    [0, 11, 12, 13], [1, 12, 13, 14], [2, 13, 14, 15], [3, 14, 15], [4, 15], [5], [6], [7],
+]
+
+_next = None
+
+def next_table():
+    """ next LFSR value of each LFSR value, built on first use """
+    global _next
+    if _next is None:
+        # the equations are linear: next(a ^ b) = next(a) ^ next(b)
+        bits = [sum(1 << i for i, row in enumerate(ROWS) if j in row) for j in range(16)]
+        _next = [0] * (1 << 16)
+        for value in range(1, 1 << 16):
+            low = value & -value
+            _next[value] = _next[value ^ low] ^ bits[low.bit_length() - 1]
+    return _next
+
+class ScramblerPcie():
+
+    def __init__(self, seed=SEED, com=COM, skp=SKP):
+        """
+        @param seed, com, skp: same as the parameters of scrambler_pcie
+        """
+        self.seed = seed
+        self.com = com
+        self.skp = skp
+        self.lfsr = seed
+        self.next = next_table()
+
+    def scramble(self, din, k=0, dis=0):
+        """ scramble (or descramble) one byte and advance the LFSR """
+        lfsr = self.lfsr
+        if k:
+            if din == self.com:
+                self.lfsr = self.seed
+            elif din != self.skp:
+                self.lfsr = self.next[lfsr]
+            return din
+        self.lfsr = self.next[lfsr]
+        return din if dis else din ^ (lfsr & 0xFF)
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the PCIe scrambler bytes after COM")
+    parser.add_argument('-n', '--bytes', type=int, default=16, help="number of bytes (default 16)")
+    args = parser.parse_args()
+    scm = ScramblerPcie()
+    print(" ".join(f"{scm.scramble(0):02X}" for _ in range(args.bytes)))
+
+if __name__ == "__main__":
+    main()
@@ -6,75 +6,167 @@
 # ------------------------------------------------------------------------------------------------
 # Testbench for scrambler
 # ------------------------------------------------------------------------------------------------
+# One driver sends a symbol from the stimulus queue each cycle (SKP if the queue is empty) and
+# one monitor checks the scrambler output (1 cycle latency) and the descrambler output (2 cycles
+# latency) against the ScramblerPcie model. The descrambler output is checked after the first COM
+# since the descrambler LFSR is only in sync with the scrambler LFSR from there.
+# The number of bytes of test_stream can be set with the environment variable NUM_BYTES, e.g.
+#   make NUM_BYTES=1000000
+# ------------------------------------------------------------------------------------------------
 
 import cocotb
-from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.triggers import Timer, FallingEdge
+from cocotb.queue import Queue, QueueEmpty
 from cocotb.clock import Clock
+from cocotb.utils import get_sim_time
+from ScramblerPcie import ScramblerPcie, COM, SKP
+from Scoreboard import Scoreboard
+from collections import deque
+import random
+import time
+import os
 
-COM = 0xBC
-SKIP = 0x1C
+PERIOD = 10
+NUM_BYTES = int(os.environ.get("NUM_BYTES", 20000))
 
-async def check_data_scrambled(dut, data, dis=0):
-    # wait 1 clock cycles for the latency
-    await FallingEdge(dut.clk)
-    if not dis:
-        assert dut.scm_dout.value.integer != data, \
-        dut._log.error(f"Data should not be scrambled: Original data: {hex(data)}, Scrambled data: {hex(dut.scm_dout.value.integer)}")
-        dut._log.info(f"Data Scrambled. Original data: {hex(data)}, Scrambled data: {hex(dut.scm_dout.value.integer)}")
-    else:
-        assert dut.scm_dout.value.integer == data, \
-        dut._log.error(f"Data should be scrambled: Original data: {hex(data)}, Scrambled data: {hex(dut.scm_dout.value.integer)}")
-        dut._log.info(f"Data not Scrambled. Original data: {hex(data)}, Scrambled data: {hex(dut.scm_dout.value.integer)}")
-
-async def check_data(dut, expected):
-    # wait 2 clock cycles for the latency
-    await FallingEdge(dut.clk)
-    await FallingEdge(dut.clk)
-    assert (dut.descm_dout.value.integer == expected), \
-    dut._log.error(f"Expected: {hex(expected)}. Get: {hex(dut.descm_dout.value.integer)}")
-    dut._log.info(f"Check passed: Get data: {hex(expected)}")
+class Driver():
 
-async def send_cmd(dut, cmd):
-    await FallingEdge(dut.clk)
-    dut.din.value = cmd
-    dut.k_in.value = 1
-    dut.dis_scrambler.value = 0
-    cocotb.start_soon(check_data_scrambled(dut, cmd, 1))
-    cocotb.start_soon(check_data(dut, cmd))
+    def __init__(self, dut, scoreboard, depth=256):
+        """
+        Drive one symbol (data, k, dis) per cycle from the stimulus queue
+        @param depth: depth of the stimulus queue, put() waits when it is full
+        """
+        self.dut = dut
+        self.scoreboard = scoreboard
+        self.queue = Queue(depth)
+        self.sent = 0
+        self.idle = 0
+        self.last = 0       # time the last queued symbol is driven
+        # SKP until the first symbol so the LFSR is not advanced
+        dut.din.value = SKP
+        dut.k_in.value = 1
+        dut.dis_scrambler.value = 0
 
-async def send_data(dut, data, dis=0):
-    await FallingEdge(dut.clk)
-    dut.din.value = data
-    dut.k_in.value = 0
-    dut.dis_scrambler.value = dis
-    cocotb.start_soon(check_data_scrambled(dut, data, dis))
-    cocotb.start_soon(check_data(dut, data))
+    async def put(self, data, k=0, dis=0):
+        await self.queue.put((data, k, dis))
 
-@cocotb.test()
-async def test_scrambler(dut):
-    dut.din.value = 0
-    dut.k_in.value = 0
-    dut.dis_scrambler.value = 0
+    async def run(self):
+        din, k_in, dis_scrambler = self.dut.din, self.dut.k_in, self.dut.dis_scrambler
+        while True:
+            await FallingEdge(self.dut.clk)
+            try:
+                data, k, dis = self.queue.get_nowait()
+                self.sent += 1
+                self.last = get_sim_time("ns")
+            except QueueEmpty:
+                data, k, dis = SKP, 1, 0
+                self.idle += 1
+            din.value = data
+            k_in.value = k
+            dis_scrambler.value = dis
+            self.scoreboard.expect(get_sim_time("ns"), data, k, dis)
+
+    async def flush(self):
+        """ wait until all the queued symbols are checked """
+        while not self.queue.empty():
+            await FallingEdge(self.dut.clk)
+        for _ in range(ScramblerScoreboard.LATENCY + 1):
+            await FallingEdge(self.dut.clk)
+
+class ScramblerScoreboard(Scoreboard):
+
+    LATENCY = 2
+
+    def __init__(self, dut, fail_fast=True):
+        """ Expected output of each driven symbol, tagged with the time it is driven """
+        super().__init__("scrambler", fail_fast)
+        self.dut = dut
+        self.model = ScramblerPcie()
+        self.scm = deque()      # (time, dout, k, dis) expected from the scrambler
+        self.descm = deque()    # (time, data) expected from the descrambler
+        self.synced = False
 
-    cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
+    def expect(self, now, data, k, dis):
+        self.scm.append((now, self.model.scramble(data, k, dis), k, dis))
+        self.synced = self.synced or (k and data == COM)
+        if self.synced:
+            self.descm.append((now, data))
+
+    def compare(self, now, scm, descm):
+        """ check the outputs sampled at now against the symbols driven 1 and 2 cycles before """
+        while self.scm and self.scm[0][0] <= now - PERIOD:
+            t, *expected = self.scm.popleft()
+            expected = tuple(expected)
+            if t == now - PERIOD:
+                self.check(self.dut, scm, expected, f"Scrambler at {now} ns: got (dout, k, dis) = {scm}, expected {expected}")
+        while self.descm and self.descm[0][0] <= now - 2 * PERIOD:
+            t, expected = self.descm.popleft()
+            if t == now - 2 * PERIOD:
+                self.check(self.dut, descm, expected, f"Descrambler at {now} ns: got {descm:#04x}, expected {expected:#04x}")
+
+    def pending(self, until):
+        """ number of outputs not checked yet for the symbols driven up to until """
+        return sum(e[0] <= until for e in self.scm) + sum(e[0] <= until for e in self.descm)
+
+async def monitor(dut, scoreboard):
+    dout, k_out, dis_out, descm_dout = dut.scm_dout, dut.scm_k_out, dut.scm_dis_scrambler_out, dut.descm_dout
+    while True:
+        await FallingEdge(dut.clk)
+        scm = (dout.value.integer, k_out.value.integer, dis_out.value.integer)
+        scoreboard.compare(get_sim_time("ns"), scm, descm_dout.value.integer)
+
+def random_symbols(n, k_rate=0.02, dis_rate=0.01):
+    """
+    COM and n random symbols: data bytes with random K symbols (COM, SKP or another K) inserted
+    @param k_rate: probability of a K symbol
+    @param dis_rate: probability of a data byte with the scrambler disabled
+    """
+    yield COM, 1, 0
+    for _ in range(n):
+        p = random.random()
+        if p < k_rate:
+            yield random.choice([COM, SKP, SKP, random.randint(0, 255)]), 1, 0
+        else:
+            yield random.randint(0, 255), 0, int(p < k_rate + dis_rate)
+
+########################################
+# Test functions
+########################################
+
+async def setup(dut):
+    scoreboard = ScramblerScoreboard(dut)
+    driver = Driver(dut, scoreboard)
+    cocotb.start_soon(Clock(dut.clk, PERIOD, units="ns").start())
     dut.rst_b.value = 0
     await Timer(20, units="ns")
+    await FallingEdge(dut.clk)
     dut.rst_b.value = 1
+    cocotb.start_soon(driver.run())
+    cocotb.start_soon(monitor(dut, scoreboard))
+    return driver, scoreboard
 
-    # First few COM command
-    await send_cmd(dut, COM)
-    await send_cmd(dut, COM)
-    await send_cmd(dut, COM)
-    # Sent few data with scrambler enabled
-    await send_data(dut, 0x12)
-    await send_data(dut, 0x34)
-    await send_data(dut, 0x00)
-    await send_data(dut, 0xFF)
-    # Sent few data without scrambler enabled
-    await send_data(dut, 0x56, 1)
-    await send_data(dut, 0x78, 1)
-    # Send skip command
-    await send_cmd(dut, SKIP)
-    await send_cmd(dut, SKIP)
-    await Timer(100, "ns")
+async def tester(dut, symbols):
+    """ send the symbols and check the scoreboard """
+    driver, scoreboard = await setup(dut)
+    start = time.perf_counter()
+    for data, k, dis in symbols:
+        await driver.put(data, k, dis)
+    await driver.flush()
+    wall = time.perf_counter() - start
+    dut._log.info(f"{driver.sent} bytes ({driver.idle} idle SKP) in {wall:.2f} s, "
+                  f"{driver.sent / wall:.0f} bytes/s. {scoreboard.report()}")
+    assert not scoreboard.errors, scoreboard.report()
+    assert not scoreboard.pending(driver.last), "Not all the symbols are checked"
 
+@cocotb.test()
+async def test_scrambler(dut):
+    symbols = [(COM, 1, 0)] * 3                                 # First few COM command
+    symbols += [(d, 0, 0) for d in [0x12, 0x34, 0x00, 0xFF]]    # Sent few data with scrambler enabled
+    symbols += [(d, 0, 1) for d in [0x56, 0x78]]                # Sent few data without scrambler enabled
+    symbols += [(SKP, 1, 0)] * 2                                # Send skip command
+    await tester(dut, symbols)
+
+@cocotb.test()
+async def test_stream(dut):
+    """ NUM_BYTES random data bytes with random COM/SKP insertion """
+    await tester(dut, random_symbols(NUM_BYTES))